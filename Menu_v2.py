@@ -1,22 +1,60 @@
 import uuid
-import datetime
 import os
 import time
-import math
 import platform
 from collections import deque
 import random
 import threading
+from engine import SimulationEngine
+from queues import BlockedQueues, ProcessQueue, ReadyQueue
+from buffer import SharedBuffer
+from process import Process, ProcessState, ProcessType
+from logger import EventLog, LogLevel
+import log_index
+from log_rotation import LogHistory, LogRotation
+from memory_manager import MemoryManager
+from paging import PagedMemory
+from metrics import MetricsCollector, comparison_table
+from event_trace import EventKind, EventTraceWriter
+from smp import Processors, check_affinity
+from render import ProcessTableView, Screen, parse_filter
+from profiling import Profiler
+import checkpoint
+import concurrency
 
 class OperatingSystemSimulator:
-    def __init__(self):
+    def __init__(self, playback_speed=None, interactive=True, log_file="system_log.txt",
+                 buffer_size=500, memory_size=1024, seed=None, log_level=LogLevel.DEBUG,
+                 log_sim_time=False, log_background=False, memory_policy="first-fit", event_trace=None,
+                 cpus=1, balancing="steal", checkpoint=None, checkpoint_every=5000,
+                 log_rotate=None, log_rotate_lines=None, log_compress="gzip", log_retention=None,
+                 profile=False, profile_output=None, paging=None, page_size=4, tlb_size=16):
+        # Modo interactivo (menú y terminal) o modo sin terminal para scripts y CI
+        self.interactive = interactive
+        self.rng = random.Random(seed)  # Generador propio para cargas reproducibles
+
         # Tabla de procesos y colas
-        self.process_table = []
-        self.ready_queue = deque()
-        self.executing_queue = deque(maxlen=1)
-        self.blocked_queue = deque()
+        self.process_table = {}  # PID -> proceso, en orden de creación (también sirve de índice)
+        self.ready_queue = ReadyQueue()  # Orden FIFO y por prioridad sobre un heap
+        self.executing_queue = ProcessQueue("Ejecutando")  # Un solo CPU: a lo sumo un proceso
+        # Con varios CPUs cada uno tiene su propia cola; la cola de listos recibe a los que hay que ubicar
+        processors = Processors(cpus, balancing)  # También valida la cantidad y el balanceo
+        self.processors = processors if cpus > 1 else None
+        self.blocked_queue = BlockedQueues()  # Colas de espera por condición (buffer, memoria, externa)
+        self.state_queues = {ProcessState.READY: self.ready_queue, ProcessState.RUNNING: self.executing_queue,
+                             ProcessState.BLOCKED: self.blocked_queue}
         self.unblocking_queue = deque()  # Nueva cola para procesos en espera de desbloqueo
         self.current_process = None
+
+        # Reloj virtual y cola de eventos compartidos por FIFO y Round Robin
+        self.engine = SimulationEngine(playback_speed)
+        self.engine.on("arrival", self._on_arrival)
+        self.engine.on("trace_arrival", self._on_trace_arrival)
+        self.engine.on("slice_end", self._on_slice_end)
+        self.arrival_source = None  # Generador de la traza que se está reproduciendo
+        self.trace_read = 0         # Entradas leídas de la traza (para retomarla desde un checkpoint)
+        self.arrivals = 0           # Procesos que llegaron por eventos del reloj
+        self.pass_arrivals = 0      # Llegadas al comenzar la pasada actual del planificador
         
         # Estados y algoritmos disponibles
         self.PROCESS_STATES = ["Listo", "Ejecutando", "Bloqueado", "Terminado"]
@@ -26,18 +64,51 @@ class OperatingSystemSimulator:
         self.time_quantum = 2
         
         # Configuración del sistema
-        self.log_file = "system_log.txt"
+        self.log_file = log_file
+        # Log con buffer y escrituras por lotes; puede marcar el tiempo simulado en vez del real.
+        # Con log_rotate (bytes, p. ej. "64M") o log_rotate_lines rota en segmentos comprimidos
+        rotation = None
+        if (log_rotate or log_rotate_lines) and log_file != os.devnull:
+            rotation = LogRotation(log_file, log_rotate, log_rotate_lines, log_compress, log_retention)
+        self.logger = EventLog(log_file, log_level, clock=(lambda: self.engine.now) if log_sim_time else None,
+                               background=log_background, rotation=rotation)
         
         # Mecanismos para productor-consumidor
-        self.buffer = []  # Buffer compartido inicial
-        self.buffer_size = 500  # Tamaño máximo del buffer
+        self.buffer_size = buffer_size  # Tamaño máximo del buffer
+        self.buffer = SharedBuffer(self.buffer_size)  # Buffer compartido con ocupación incremental
+        # Semáforos del buffer acotado; los usan los hilos reales de run_concurrent (estrategia "semaphore")
         self.mutex = threading.Semaphore(1)  # Semaforo para exclusión mutua
         self.empty = threading.Semaphore(self.buffer_size)  # Semaforo para slots vacíos
         self.full = threading.Semaphore(0)  # Semaforo para slots llenos
         
         # Gestión de memoria para multiprogramación
-        self.memory = {"total": 1024, "available": 1024}  # Memoria simulada en KB
-        self.loaded_processes = []  # Procesos cargados en memoria
+        self.memory = MemoryManager(memory_size, memory_policy)  # Memoria contigua simulada en KB
+        self.loaded_processes = {}  # PID -> proceso cargado en memoria
+        # Con paging (fifo, lru, clock o lfu) la memoria es virtual y paginada por demanda: los procesos
+        # se admiten sin reservar un bloque y los fallos de página alargan cada turno
+        self.paging = (PagedMemory(memory_size, paging, page_size, tlb_size, seed=seed)
+                       if paging is not None else None)
+
+        # Métricas por proceso y del sistema (costo O(1) por evento)
+        memory_capacity = self.paging.frames * page_size if self.paging is not None else self.memory.managed
+        self.metrics = MetricsCollector(self.buffer_size, memory_capacity, cpus=cpus)
+        # Traza binaria de eventos de planificación (opcional, para análisis y Gantt)
+        self.event_trace = EventTraceWriter(event_trace) if event_trace else None
+        # Checkpoints periódicos (cada 'checkpoint_every' despachos) para retomar o bifurcar una corrida
+        self.checkpoints = None
+        self.resume_point = None  # Punto del planificador guardado en el checkpoint restaurado
+        self._dirty = None        # PIDs modificados desde el último checkpoint (dict ordenado)
+        # Vista paginada de la tabla (se crea al mostrarla por primera vez y luego se actualiza por cambios)
+        self.table_view = None
+        if checkpoint:
+            self.enable_checkpoints(checkpoint, checkpoint_every)
+        # Cronómetros por fase del planificador; con profile_output (.prof: cProfile, otro: pilas colapsadas)
+        # el perfil se exporta al terminar cada corrida
+        self.profiler = None
+        self.profile_output = profile_output
+        if profile or profile_output:
+            self.profiler = Profiler(cprofile=bool(profile_output) and profile_output.endswith((".prof", ".pstats")))
+            self.profiler.instrument(self)
         
         # Inicialización del sistema
         self.clear_terminal()
@@ -45,18 +116,22 @@ class OperatingSystemSimulator:
 
     def clear_terminal(self):
         """Limpia la terminal según el sistema operativo"""
-        os.system('cls' if platform.system() == 'Windows' else 'clear')
+        if self.interactive:
+            os.system('cls' if platform.system() == 'Windows' else 'clear')
+
+    def notify(self, message):
+        """Muestra un mensaje de la simulación solo en modo interactivo"""
+        if self.interactive:
+            print(message)
 
     def initialize_log_file(self):
         """Inicializa el archivo de logs"""
-        with open(self.log_file, "w") as f:
-            self.log_action("Sistema iniciado")
+        self.logger.reset()
+        self.log_action("Sistema iniciado")
 
-    def log_action(self, action):
-        """Registra una acción en el log con timestamp"""
-        timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        with open(self.log_file, "a") as f:
-            f.write(f"[{timestamp}] {action}\n")
+    def log_action(self, action, level=LogLevel.INFO):
+        """Registra una acción en el log con timestamp (se escribe a disco por lotes)"""
+        self.logger.log(action, level)
 
     def show_menu(self):
         """Muestra el menú principal"""
@@ -73,13 +148,97 @@ class OperatingSystemSimulator:
         print("10. Mostrar estado de memoria")
         print("11. Salir")
 
+    def add_process(self, priority, process_type="Normal", burst_time=None, memory=None, pid=None, affinity=None):
+        """Agrega un proceso sin interacción. Lanza ValueError si algún dato es inválido"""
+        if not isinstance(priority, int) or not 1 <= priority <= 10:
+            raise ValueError("La prioridad debe ser un número entre 1-10")
+        process_type = ProcessType.parse(process_type)
+
+        burst_time = self.rng.randint(1, 15) if burst_time is None else burst_time
+        memory_req = self.rng.randint(64, 256) if memory is None else memory  # Requerimiento de memoria aleatorio
+        if burst_time <= 0 or memory_req <= 0:
+            raise ValueError("El burst y la memoria deben ser mayores que 0")
+        affinity = check_affinity(affinity, len(self.processors) if self.processors else 1)
+
+        process_id = pid
+        width = 4
+        while process_id is None or (pid is None and process_id in self.process_table):
+            # PID generado: si choca se sortea otro con un dígito más, así nunca se agotan
+            if process_id is not None:
+                width += 1
+            process_id = uuid.UUID(int=self.rng.getrandbits(128)).hex[:width]
+        if process_id in self.process_table:
+            raise ValueError(f"Ya existe un proceso con PID={process_id}")
+
+        process = Process(process_id, priority, burst_time, memory_req, process_type,
+                          arrival_time=self.engine.now, affinity=affinity)
+
+        self.process_table[process_id] = process
+        self.ready_queue.append(process)
+        self._changed(process_id)
+        self.metrics.arrival(process_id, self.engine.now)
+        self._trace(EventKind.ARRIVAL, process)
+        self.log_action(f"Proceso creado: PID={process_id}, Tipo={process_type}")
+        return process
+
+    def add_workload(self, entries):
+        """Agrega los procesos de una carga de trabajo (diccionarios con priority, type, burst_time, memory, pid, affinity)
+
+        Las entradas con un arrival_time futuro no se crean ahora: quedan como
+        eventos de llegada en el reloj. Retorna los procesos creados de inmediato.
+        """
+        created = []
+        for entry in entries:
+            arrival = entry.get("arrival_time")
+            if arrival is not None and arrival > self.engine.now:
+                self.engine.schedule_at(arrival, "arrival", entry)
+            else:
+                created.append(self._create_from_entry(entry))
+        return created
+
+    def feed(self, entries):
+        """Reproduce una secuencia de entradas ordenada por arrival_time (p. ej. ingest.load_trace)
+
+        Solo la próxima llegada vive en la cola de eventos: al atenderla se lee
+        la siguiente, así que la traza nunca se materializa completa.
+        """
+        if self.arrival_source is not None:
+            raise ValueError("Ya hay una traza en reproducción")
+        self.arrival_source = iter(entries)
+        self._schedule_next_arrival()
+
+    def _schedule_next_arrival(self):
+        entry = next(self.arrival_source, None)
+        if entry is None:
+            self.arrival_source = None
+            return
+        self.trace_read += 1
+        self.engine.schedule_at(entry["arrival_time"], "trace_arrival", entry)
+
+    def _create_from_entry(self, entry):
+        return self.add_process(entry["priority"], entry.get("type", "Normal"), burst_time=entry.get("burst_time"),
+                                memory=entry.get("memory"), pid=entry.get("pid"), affinity=entry.get("affinity"))
+
+    def _on_arrival(self, entry):
+        """Evento de llegada: crea el proceso y lo carga en memoria (o lo bloquea esperándola)"""
+        process = self._create_from_entry(entry)
+        self.arrivals += 1
+        if not self.load_into_memory(process):
+            self._mark_blocked(process)
+            self.blocked_queue.memory.wait(process, process.memory)
+            self.notify(f"Proceso {process.pid} llegó y quedó bloqueado por falta de memoria")
+        return process
+
+    def _on_trace_arrival(self, entry):
+        """Evento de llegada de la traza en reproducción: atiende la llegada y programa la siguiente"""
+        try:
+            self._on_arrival(entry)
+        finally:
+            if self.arrival_source is not None:
+                self._schedule_next_arrival()
+
     def create_process(self, process_type="Normal"):
         """Crea un nuevo proceso con tipo especificado (sin cargarlo aún en memoria o buffer)"""
-        process_id = str(uuid.uuid4())[:4]
-        state = "Listo"
-        burst_time = random.randint(1, 15)
-        remaining_time = burst_time
-
         try:
             priority = int(input("Ingrese la prioridad del proceso (1-10): "))
             if not 1 <= priority <= 10:
@@ -89,25 +248,15 @@ class OperatingSystemSimulator:
             self.log_action(f"Intento de creación fallido: Prioridad inválida")
             return
 
-        memory_req = random.randint(64, 256)  # Requerimiento de memoria aleatorio
-
-        process = {
-            "PID": process_id,
-            "Estado": state,
-            "Prioridad": priority,
-            "Burst_Time": burst_time,
-            "Remaining_Time": remaining_time,
-            "Memory": memory_req,
-            "InMemory": False,
-            "Type": process_type
-        }
-
-        self.ready_queue.append(process)
-        self.process_table.append(process)
+        while True:
+            try:
+                process = self.add_process(priority, process_type)
+                break
+            except ValueError:
+                continue  # PID repetido, se genera otro
 
-        print(f"\nProceso {process_id} ({process_type}) creado exitosamente")
-        print(f"  - Memoria requerida: {memory_req}KB")
-        self.log_action(f"Proceso creado: PID={process_id}, Tipo={process_type}")
+        print(f"\nProceso {process.pid} ({process_type}) creado exitosamente")
+        print(f"  - Memoria requerida: {process.memory}KB")
 
     def create_producer_process(self):
         """Crea un proceso productor especial"""
@@ -117,72 +266,222 @@ class OperatingSystemSimulator:
         """Crea un proceso consumidor especial"""
         self.create_process("Consumidor")
 
+    @property
+    def memory_used(self):
+        """KB de memoria física en uso: marcos ocupados con paginación, bloques asignados sin ella"""
+        if self.paging is not None:
+            return self.paging.used_frames * self.paging.page_size
+        return self.memory.used
+
+    @property
+    def memory_available(self):
+        """KB de memoria física libres: marcos libres con paginación, memoria sin asignar sin ella"""
+        if self.paging is not None:
+            return len(self.paging.free_frames) * self.paging.page_size
+        return self.memory.available
+
     def load_into_memory(self, process):
         """Carga un proceso en memoria si hay espacio disponible. Retorna True si es posible"""
-        if process["Memory"] <= self.memory["available"]:
-            self.memory["available"] -= process["Memory"]
-            process["InMemory"] = True
-            self.loaded_processes.append(process)
+        if self.paging is not None:
+            # Paginación por demanda: solo se crea la tabla de páginas, los marcos se asignan en cada fallo
+            self.paging.attach(process.pid, process.memory)
+            process.in_memory = True
+            self.loaded_processes[process.pid] = process
+            self._changed(process.pid)
             return True
-        return False
+        compactions = self.memory.compactions
+        if self.memory.allocate(process.pid, process.memory) is None:
+            return False
+        process.in_memory = True
+        self.loaded_processes[process.pid] = process
+        self._changed(process.pid)
+        if self.memory.compactions != compactions:
+            for pid in self.loaded_processes:  # La compactación movió los bloques de todos
+                self._changed(pid)
+        return True
 
     def unload_from_memory(self, process):
         """Libera la memoria ocupada por un proceso"""
-        if process["InMemory"]:
-            self.memory["available"] += process["Memory"]
-            process["InMemory"] = False
-            if process in self.loaded_processes:
-                self.loaded_processes.remove(process)
-
-    def check_unblocking_processes(self):
-        """Verifica si los procesos bloqueados pueden ser desbloqueados"""
-        desbloqueados = []
-
-        for process in list(self.blocked_queue):
-            if process.get("Type") == "Productor":
-                buffer_used = sum(p['Memory'] for p in self.buffer)
-                if buffer_used + process["Memory"] <= self.buffer_size:
-                    print(f"Hay espacio en el buffer. Productor {process['PID']} añadido a la cola.")
-                    process["Estado"] = "Listo"
-                    self.ready_queue.append(process)
-                    desbloqueados.append(process)
-
-            elif process.get("Type") == "Consumidor":
-                buffer_used = sum(p['Memory'] for p in self.buffer)
-                if buffer_used >= process["Memory"]:
-                    print(f"\nHay datos en el buffer. Consumidor {process['PID']} añadido a la cola.")
-                    process["Estado"] = "Listo"
-                    self.ready_queue.append(process)
-                    desbloqueados.append(process)
-
-            else:
-                # Procesos normales bloqueados (si aplica en tu lógica)
-                print(f"Proceso {process['PID']} desbloqueado por condición externa")
-                process["Estado"] = "Listo"
-                self.ready_queue.append(process)
-                desbloqueados.append(process)
-
-        # Eliminar procesos desbloqueados de la cola bloqueada
-        for p in desbloqueados:
-            self.blocked_queue.remove(p)
-
-                
-    def show_processes(self):
-        """Muestra todos los procesos en el sistema"""
+        if process.in_memory:
+            if self.paging is not None:
+                self.paging.release(process.pid)
+            self.memory.free(process.pid)
+            process.in_memory = False
+            self.loaded_processes.pop(process.pid, None)
+            self._changed(process.pid)
+
+    def check_unblocking_processes(self, memory=True):
+        """Despierta solo a los procesos bloqueados cuya condición ya se cumple (memory=False no carga procesos)"""
+        blocked = self.blocked_queue
+
+        # Memoria: se cargan en orden de requerimiento mientras quepan en un bloque contiguo
+        while memory:
+            needed = blocked.memory.min_threshold()
+            if needed is None or needed > self.memory.max_allocatable():
+                break
+            process = blocked.memory.pop()
+            if not self.load_into_memory(process):
+                blocked.memory.wait(process, process.memory)
+                self._changed(process.pid)
+                break
+            self.notify(f"Hay memoria disponible. Proceso {process.pid} cargado y añadido a la cola.")
+            self._make_ready(process)
+
+        for process in blocked.buffer_space.wake(self.buffer.free):
+            self.notify(f"Hay espacio en el buffer. Productor {process.pid} añadido a la cola.")
+            self._make_ready(process)
+
+        for process in blocked.buffer_data.wake(self.buffer.used):
+            self.notify(f"\nHay datos en el buffer. Consumidor {process.pid} añadido a la cola.")
+            self._make_ready(process)
+
+        # Procesos bloqueados por una condición externa (p. ej. desde el menú)
+        while blocked.external:
+            process = blocked.external.popleft()
+            self.notify(f"Proceso {process.pid} desbloqueado por condición externa")
+            self._make_ready(process)
+
+    def _make_ready(self, process):
+        """Pasa un proceso a Listo y lo encola"""
+        process.state = ProcessState.READY
+        self.ready_queue.append(process)
+        self.metrics.unblock(process.pid, self.engine.now)
+        self._trace(EventKind.UNBLOCK, process)
+        self._changed(process.pid)
+
+    def _mark_blocked(self, process):
+        """Pasa un proceso a Bloqueado (la cola de espera la elige quien lo bloquea)"""
+        process.state = ProcessState.BLOCKED
+        self.metrics.block(process.pid, self.engine.now)
+        self._trace(EventKind.BLOCK, process)
+        self._changed(process.pid)
+
+    def _dispatch(self, process, duration, cpu=0):
+        """Registra que un proceso recibe el CPU 'cpu' por 'duration' segundos simulados
+
+        Retorna los segundos que el turno pierde esperando fallos de página
+        (0 sin memoria paginada); el llamador los suma al avance del reloj.
+        """
+        # Con paginación los fallos del turno se simulan antes de muestrear: la ocupación incluye sus marcos
+        stall = self.paging.run(process.pid, duration) if self.paging is not None else 0.0
+        self.metrics.dispatch(process.pid, self.engine.now, duration, self.buffer.used, self.memory_used, cpu)
+        self._trace(EventKind.DISPATCH, process, duration)
+        self._changed(process.pid)
+        return stall
+
+    def _complete(self, process):
+        """Marca el instante en que terminó un proceso"""
+        process.completion_time = self.engine.now
+        self.metrics.complete(process.pid, self.engine.now)
+        self._trace(EventKind.TERMINATE, process)
+        self._changed(process.pid)
+
+    def _changed(self, pid):
+        """Anota que un proceso cambió, para el próximo checkpoint incremental y la vista de la tabla"""
+        if self._dirty is not None:
+            self._dirty[pid] = None
+        if self.table_view is not None:
+            self.table_view.touch(pid)
+
+    def _trace(self, kind, process, value=0.0):
+        """Agrega un evento a la traza binaria, si está activada"""
+        if self.event_trace is not None:
+            self.event_trace.emit(kind, process.pid, self.engine.now, value)
+
+    def process_view(self):
+        """Vista paginada de la tabla de procesos (la primera llamada la construye en O(n))"""
+        if self.table_view is None:
+            self.table_view = ProcessTableView(self.process_table)
+        return self.table_view
+
+    def show_processes(self, page=1, state=None, process_type=None, priority=None):
+        """Muestra una página de la tabla de procesos con los conteos por estado"""
         self.clear_terminal()
         if not self.process_table:
             print("\nNo hay procesos existentes")
             self.log_action("Consulta de tabla de procesos vacía")
             return False  
 
-        print("\n===== TABLA DE PROCESOS =====")
-        print(f"{'PID':<10} {'Tipo':<10} {'Estado':<12} {'Prioridad':<10} {'Memoria':<8} {'Burst':<6} {'Restante':<9}")
-        print("-" * 70)
-        for process in self.process_table:
-            print(f"{process['PID']:<10} {process.get('Type','Normal'):<10} {process['Estado']:<12} {process['Prioridad']:<10} {process['Memory']:<8} {process['Burst_Time']:<6} {process['Remaining_Time']:<9}")
+        print()
+        print("\n".join(self.process_view().render(page, state=state, process_type=process_type, priority=priority)))
         self.log_action("Tabla de procesos mostrada")
         return True  #La tabla se muestra
 
+    def browse_processes(self):
+        """Recorre la tabla de procesos por páginas y con filtros, redibujando solo las líneas que cambian"""
+        if not self.process_table:
+            self.show_processes()
+            return
+        view = self.process_view()
+        screen = Screen()
+        page, filters, message = 1, {}, ""
+        self.log_action("Tabla de procesos mostrada")
+        while True:
+            current = view.page(page, **filters)
+            page, has_next = current[0], current[3]
+            lines = view.layout(current, filters)
+            lines += ["", "[Enter] siguiente  [p] anterior  [número] ir a página  [f] filtrar  [q] volver", message]
+            screen.draw(lines)
+            message = ""
+            choice = input("> ").strip().lower()
+            if choice in ("", "n"):
+                if has_next:
+                    page += 1
+            elif choice == "p":
+                page = max(1, page - 1)
+            elif choice.isdigit():
+                page = int(choice)
+            elif choice == "f":
+                try:
+                    filters = parse_filter(input("Filtro (estado=Bloqueado tipo=Productor prioridad=3, vacío para quitarlo): "))
+                    page = 1
+                except ValueError as error:
+                    message = str(error)
+            elif choice == "q":
+                break
+            else:
+                message = "Opción no válida."
+
+
+    def find_process(self, pid):
+        """Busca un proceso por PID en O(1). Retorna None si no existe"""
+        return self.process_table.get(pid)
+
+    def set_process_state(self, pid, new_state):
+        """Cambia el estado de un proceso y actualiza sus colas. Retorna el estado anterior"""
+        process = self.find_process(pid)
+        if process is None:
+            raise KeyError(f"PID={pid} no encontrado")
+
+        old_state = process.state
+        new_state = ProcessState.parse(new_state)
+        if new_state == old_state:
+            raise ValueError(f"Estado inválido {old_state}->{new_state}")
+        if new_state == ProcessState.RUNNING and self.executing_queue:
+            raise ValueError(f"Proceso {self.executing_queue.peek().pid} en ejecución")
+
+        process.state = new_state
+        self._changed(pid)
+        if old_state == ProcessState.BLOCKED:
+            self.metrics.unblock(pid, self.engine.now)
+            self._trace(EventKind.UNBLOCK, process)
+        elif new_state == ProcessState.BLOCKED:
+            self.metrics.block(pid, self.engine.now)
+            self._trace(EventKind.BLOCK, process)
+
+        # Actualización de colas según nuevo estado: encolar en la nueva saca de la anterior
+        queue = self.state_queues.get(new_state)
+        if queue is not None:
+            queue.append(process)
+        elif process.queue is not None:
+            process.queue.remove(process)
+
+        if new_state == ProcessState.TERMINATED:
+            self.unload_from_memory(process)
+            self._complete(process)
+
+        self.log_action(f"Estado modificado: PID={pid} {old_state}->{new_state}")
+        return old_state
 
     def modify_process_state(self):
         """Permite modificar el estado de un proceso existente"""
@@ -194,61 +493,76 @@ class OperatingSystemSimulator:
             return False  
 
         pid = input("\nIngrese el PID del proceso a modificar: ")
-        for process in self.process_table:
-            if process["PID"] == pid:
-                current_state = process["Estado"]
-                available_states = [s for s in self.PROCESS_STATES if s != current_state]
-                if self.executing_queue:
-                    available_states = [s for s in available_states if s != "Ejecutando"]
-                
-                print(f"\nEstado actual: {current_state}")
-                print("Estados disponibles:", ", ".join(available_states))
-                
-                new_state = input("Ingrese el nuevo estado: ")
-                
-                if new_state in available_states: 
-                    old_state = process["Estado"]
-                    process["Estado"] = new_state
-                    
-                    # Actualización de colas según nuevo estado
-                    if new_state == "Listo":
-                        if process not in self.ready_queue:
-                            self.ready_queue.append(process)
-                    elif old_state == "Listo" and process in self.ready_queue:
-                        self.ready_queue.remove(process)
-                        
-                    if new_state == "Ejecutando":
-                        if self.executing_queue:
-                            print(f"Advertencia: Proceso {self.executing_queue[0]['PID']} en ejecución.")
-                        else:
-                            self.executing_queue.append(process)
-                    elif old_state == "Ejecutando" and process in self.executing_queue:
-                        self.executing_queue.remove(process)
-                        
-                    if new_state == "Bloqueado":
-                        self.blocked_queue.append(process)
-                    elif old_state == "Bloqueado" and process in self.blocked_queue:
-                        self.blocked_queue.remove(process)
-                        
-                    if new_state == "Terminado":
-                        self.unload_from_memory(process)
-                        if old_state == "Bloqueado" and process in self.blocked_queue:
-                            self.blocked_queue.remove(process)
-                        elif old_state == "Listo" and process in self.ready_queue:
-                            self.ready_queue.remove(process)
-                        elif old_state == "Ejecutando" and process in self.executing_queue:
-                            self.executing_queue.remove(process)
-                    
-                    print(f"\nEstado del proceso {pid} actualizado de '{old_state}' a '{new_state}'.")
-                    self.log_action(f"Estado modificado: PID={pid} {old_state}->{new_state}")
-                    return
-                
-                print("\nError: Estado no válido o igual al actual.")
-                self.log_action(f"Intento de modificación fallido: Estado inválido {current_state}->{new_state}")
-                return
-                
-        print("\nPID no encontrado.")
-        self.log_action(f"Intento de modificación fallido: PID={pid} no encontrado")
+        process = self.find_process(pid)
+        if process is None:
+            print("\nPID no encontrado.")
+            self.log_action(f"Intento de modificación fallido: PID={pid} no encontrado")
+            return
+
+        current_state = process.state.label
+        available_states = [s for s in self.PROCESS_STATES if s != current_state]
+        if self.executing_queue:
+            available_states = [s for s in available_states if s != "Ejecutando"]
+
+        print(f"\nEstado actual: {current_state}")
+        print("Estados disponibles:", ", ".join(available_states))
+
+        new_state = input("Ingrese el nuevo estado: ")
+
+        if new_state in available_states:
+            old_state = self.set_process_state(pid, new_state)
+            print(f"\nEstado del proceso {pid} actualizado de '{old_state}' a '{new_state}'.")
+            return
+
+        print("\nError: Estado no válido o igual al actual.")
+        self.log_action(f"Intento de modificación fallido: Estado inválido {current_state}->{new_state}")
+
+    def _discard_process(self, process):
+        """Libera la memoria de un proceso, lo saca de su cola y de la tabla en O(1)"""
+        self.unload_from_memory(process)
+        if process.queue is not None:
+            process.queue.remove(process)
+        del self.process_table[process.pid]
+        self.metrics.discard(process.pid)
+        self._changed(process.pid)
+
+    def remove_process(self, pid):
+        """Elimina un proceso por PID. Lanza KeyError si no existe"""
+        process = self.find_process(pid)
+        if process is None:
+            raise KeyError(f"PID={pid} no encontrado")
+        self._discard_process(process)
+        # Los datos que el productor dejó en el buffer se eliminan con él
+        if process.type == ProcessType.PRODUCER:
+            self.buffer.discard_pids({pid})
+        self.log_action(f"Proceso eliminado: PID={pid}")
+        return process
+
+    def remove_terminated(self):
+        """Elimina los procesos terminados en una sola pasada. Retorna cuántos se eliminaron"""
+        terminated = [p for p in self.process_table.values() if p.state == ProcessState.TERMINATED]
+        for p in terminated:
+            self._discard_process(p)
+        if terminated:
+            removed = {p.pid for p in terminated if p.type == ProcessType.PRODUCER}
+            if removed:
+                self.buffer.discard_pids(removed)
+            self.log_action(f"{len(terminated)} proceso(s) terminado(s) eliminado(s).")
+        return len(terminated)
+
+    def remove_all(self):
+        """Elimina todos los procesos del sistema"""
+        for process in list(self.loaded_processes.values()):
+            self.unload_from_memory(process)
+        for pid in self.process_table:
+            self._changed(pid)
+        self.process_table.clear()
+        self.metrics.processes.clear()
+        self.ready_queue.clear()
+        self.executing_queue.clear()
+        self.blocked_queue.clear()
+        self.buffer.clear()
+        self.log_action("Todos los procesos eliminados del sistema.")
 
     def delete_process(self):
         """Elimina un proceso del sistema"""
@@ -266,62 +580,77 @@ class OperatingSystemSimulator:
         pid = input("\nIngrese su elección: ").strip().lower()
 
         if pid == "all":
-            self.process_table.clear()
-            self.ready_queue.clear()
-            self.blocked_queue.clear()
-            self.buffer.clear()
+            self.remove_all()
             print("\nTodos los procesos han sido eliminados.")
-            self.log_action("Todos los procesos eliminados del sistema.")
             return
 
         if pid == "terminated":
-            terminated = [p for p in self.process_table if p["Estado"] == "Terminado"]
-            if not terminated:
+            removed = self.remove_terminated()
+            if not removed:
                 print("\nNo hay procesos terminados para eliminar.")
                 self.log_action("No se encontraron procesos terminados para eliminar.")
                 return
-            for p in terminated:
-                self.unload_from_memory(p)
-                if p in self.ready_queue:
-                    self.ready_queue.remove(p)
-                if p in self.blocked_queue:
-                    self.blocked_queue.remove(p)
-                if p in self.buffer:
-                    self.buffer.remove(p)
-                self.process_table.remove(p)
-            print(f"\n{len(terminated)} proceso(s) terminado(s) eliminado(s).")
-            self.log_action(f"{len(terminated)} proceso(s) terminado(s) eliminado(s).")
+            print(f"\n{removed} proceso(s) terminado(s) eliminado(s).")
             return
 
         # Busca y elimina un proceso individual
-        for i, process in enumerate(self.process_table):
-            if process["PID"] == pid:
-                self.unload_from_memory(process)
-                del self.process_table[i]
-                if process in self.ready_queue:
-                    self.ready_queue.remove(process)
-                if process in self.blocked_queue:
-                    self.blocked_queue.remove(process)
-                if process in self.buffer:
-                    self.buffer.remove(process)
-                print(f"\nProceso {pid} eliminado.")
-                self.log_action(f"Proceso eliminado: PID={pid}")
-                return
-
-        print(f"\nEl proceso con ID {pid} no existe.")
-        self.log_action(f"Intento de eliminación fallido: PID={pid} no encontrado")
+        try:
+            self.remove_process(pid)
+            print(f"\nProceso {pid} eliminado.")
+        except KeyError:
+            print(f"\nEl proceso con ID {pid} no existe.")
+            self.log_action(f"Intento de eliminación fallido: PID={pid} no encontrado")
 
 
-    def print_logs(self):
-        """Muestra el historial de logs del sistema"""
+    def print_logs(self, count=20):
+        """Visor del log y sus segmentos rotados: últimas entradas, páginas hacia atrás y filtros"""
         self.clear_terminal()
-        print("\n===== HISTORIAL DE LOGS =====")
+        self.logger.flush()
         try:
-            with open(self.log_file, "r") as f:
-                for line in f:
-                    print(line.strip())
+            viewer = LogHistory(self.log_file)
         except FileNotFoundError:
             print("El archivo de logs no existe.")
+            return
+
+        with viewer:
+            before, newer, filters, message = None, [], {}, ""
+            while True:
+                entries = viewer.select(count, before, **filters)
+                self.clear_terminal()
+                print("\n===== HISTORIAL DE LOGS =====")
+                for _, text in entries:
+                    print(text)
+                if entries:
+                    print(f"\nEntradas {viewer.label(entries[0][0])} a {viewer.label(entries[-1][0])} "
+                          f"(archivo actual y {len(viewer.segments)} segmento(s) rotado(s))")
+                else:
+                    print("\nNo hay entradas" + (" que cumplan el filtro." if filters else "."))
+                if filters:
+                    print(f"Filtro: {log_index.describe_filter(**filters)}")
+                if message:
+                    print(message)
+                    message = ""
+                if not self.interactive:
+                    return
+                print("[Enter] anteriores  [n] más recientes  [f] filtrar  [q] volver")
+                choice = input("> ").strip().lower()
+                if choice == "":
+                    if len(entries) == count:  # Una página incompleta es la más vieja
+                        newer.append(before)
+                        before = entries[0][0]
+                elif choice == "n":
+                    before = newer.pop() if newer else None
+                elif choice == "f":
+                    try:
+                        filters = log_index.parse_filter(
+                            input("Filtro (pid=ab12 evento=terminación desde=10 hasta=20, vacío para quitarlo): "))
+                        before, newer = None, []
+                    except ValueError as error:
+                        message = str(error)
+                elif choice == "q":
+                    break
+                else:
+                    message = "Opción no válida."
 
     def show_memory_status(self):
         """Muestra el estado actual de la memoria"""
@@ -329,39 +658,82 @@ class OperatingSystemSimulator:
 
         # Memory Status
         print("\n===== ESTADO DE MEMORIA =====")
-        print(f"Total: {self.memory['total']} KB")
-        print(f"Disponible: {self.memory['available']} KB")
-        used_memory = self.memory['total'] - self.memory['available']
-        print(f"En uso: {used_memory} KB por {len(self.loaded_processes)} procesos")
+        memory = self.memory.stats()
+        print(f"Total: {memory['total']} KB - Política: {memory['policy']}")
+        print(f"Disponible: {memory['available']} KB en {memory['free_blocks']} hueco(s)")
+        print(f"En uso: {self.memory.used} KB por {len(self.loaded_processes)} procesos")
+        print(f"Hueco más grande: {memory['largest_free']} KB - "
+              f"Fragmentación externa: {memory['external_fragmentation']:.1%}")
+        if memory['internal_fragmentation']:
+            print(f"Fragmentación interna: {memory['internal_fragmentation']} KB")
+        print(f"Compactaciones: {memory['compactions']} ({memory['compaction_moved']} KB movidos)")
+        print(f"Latencia de asignación: {memory['avg_allocation_latency_us']:.2f} µs promedio, "
+              f"{memory['max_allocation_latency_us']:.2f} µs máxima")
+
+        if self.paging is not None:
+            paging = self.paging.stats()
+            print(f"\nMemoria virtual paginada - Reemplazo: {paging['policy']}, páginas de {paging['page_size']} KB")
+            print(f"Marcos: {paging['used_frames']} de {paging['frames']} en uso (máximo {paging['peak_frames']})")
+            print(f"Accesos: {paging['accesses']} - Fallos de página: {paging['page_faults']} "
+                  f"({paging['page_fault_rate']:.2%}), reemplazos: {paging['evictions']}")
+            print(f"TLB de {paging['tlb_size']} entradas: {paging['tlb_hit_rate']:.2%} de aciertos - "
+                  f"Tiempo efectivo de acceso: {paging['effective_access_time_ns']:.1f} ns")
 
         print("\nProcesos en memoria:")
         if self.loaded_processes:
-            for p in self.loaded_processes:
-                print(f"- PID {p['PID']}: {p['Type']}, {p['Memory']} KB (Prioridad: {p['Prioridad']})")
+            if self.paging is not None:
+                for p in self.loaded_processes.values():
+                    print(f"- PID {p.pid}: {p.type}, {p.memory} KB con {len(self.paging.tables.get(p.pid, ()))} "
+                          f"página(s) residentes (Prioridad: {p.priority})")
+            else:
+                for p in sorted(self.loaded_processes.values(), key=lambda p: self.memory.address_of(p.pid)):
+                    print(f"- PID {p.pid}: {p.type}, {p.memory} KB en la dirección "
+                          f"{self.memory.address_of(p.pid)} (Prioridad: {p.priority})")
         else:
             print("No hay procesos cargados en memoria.")
 
         # Buffer Status
-        current_buffer_usage = sum(p['Memory'] for p in self.buffer)
-        buffer_remaining = self.buffer_size - current_buffer_usage
+        current_buffer_usage = self.buffer.used
+        buffer_remaining = self.buffer.free
 
         print("\n===== ESTADO DEL BUFFER =====")
         print(f"Tamaño total: {self.buffer_size:.2f} KB")
         print(f"Usado: {current_buffer_usage:.2f} KB")
         print(f"Disponible: {buffer_remaining:.2f} KB")
+        print(f"Ítems: {len(self.buffer)} de {self.buffer.slots} - Ocupación máxima: {self.buffer.high_water:.2f} KB")
 
         if self.buffer:
             print("\nContenido del buffer:")
             print(f"{'PID':<10}{'Tipo':<15}{'Tamaño (KB)':<15}")
             print("-" * 40)
-            for item in self.buffer:
-                print(f"{item['PID']:<10}{item['Type']:<15}{item['Memory']:<15}")
+            for pid, kb in self.buffer:
+                producer = self.process_table.get(pid)
+                process_type = producer.type if producer else "-"
+                print(f"{pid:<10}{process_type:<15}{kb:<15.2f}")
         else:
             print("\nContenido del buffer: Vacío")
 
 
 
 
+    def configure(self, algorithm=None, quantum=None, playback_speed=None):
+        """Configura algoritmo, quantum y velocidad sin interacción. Lanza ValueError si son inválidos"""
+        if algorithm is not None:
+            if algorithm not in self.SCHEDULING_ALGORITHMS:
+                raise ValueError(f"Algoritmo desconocido: {algorithm}")
+            if algorithm != self.current_algorithm:
+                self.current_algorithm = algorithm
+                self.log_action(f"Algoritmo cambiado a {algorithm}")
+        if quantum is not None:
+            if quantum <= 0:
+                raise ValueError("El quantum debe ser mayor que 0")
+            self.time_quantum = quantum
+            self.log_action(f"Quantum actualizado a {quantum}s")
+        if playback_speed is not None:
+            if playback_speed < 0:
+                raise ValueError("La velocidad no puede ser negativa")
+            self.engine.playback_speed = playback_speed or None
+
     def set_scheduling_algorithm(self):
         """Configura el algoritmo de planificación"""
         self.clear_terminal()
@@ -377,7 +749,8 @@ class OperatingSystemSimulator:
                 else "1. Cambiar a Round Robin")
             print("2. Mantener algoritmo actual")
             print("3. Configurar quantum (solo Round Robin)")
-            print("4. Volver al menú principal")
+            print(f"4. Configurar velocidad de reproducción (actual: {self.engine.playback_speed or 'instantánea'})")
+            print("5. Volver al menú principal")
             
             try:
                 choice = int(input("\nSeleccione una opción: "))
@@ -391,8 +764,7 @@ class OperatingSystemSimulator:
                 new_algo = "FIFO" if self.current_algorithm == "Round Robin" else "Round Robin"
                 confirm = input(f"\n¿Cambiar de {self.current_algorithm} a {new_algo}? (s/n): ").lower()
                 if confirm == 's':
-                    self.current_algorithm = new_algo
-                    self.log_action(f"Algoritmo cambiado a {new_algo}")
+                    self.configure(algorithm=new_algo)
                     print(f"\nAlgoritmo actualizado a {new_algo}")
                     if new_algo == "Round Robin" and self.time_quantum <= 0:
                         self.time_quantum = 2
@@ -411,8 +783,7 @@ class OperatingSystemSimulator:
                 try:
                     new_quantum = int(input("\nIngrese nuevo quantum (segundos): "))
                     if new_quantum > 0:
-                        self.time_quantum = new_quantum
-                        self.log_action(f"Quantum actualizado a {new_quantum}s")
+                        self.configure(quantum=new_quantum)
                         print(f"\nQuantum actualizado a {new_quantum}s")
                     else:
                         print("\nEl quantum debe ser mayor que 0.")
@@ -422,6 +793,20 @@ class OperatingSystemSimulator:
                 self.clear_terminal()
                 
             elif choice == 4:
+                try:
+                    speed = float(input("\nIngrese velocidad (0 = instantánea, 1 = tiempo real): "))
+                    if speed >= 0:
+                        self.configure(playback_speed=speed)
+                        self.log_action(f"Velocidad de reproducción actualizada a {speed}x")
+                        print("\nVelocidad de reproducción actualizada")
+                    else:
+                        print("\nLa velocidad no puede ser negativa.")
+                except ValueError:
+                    print("\n¡Debe ingresar un número válido!")
+                time.sleep(1)
+                self.clear_terminal()
+
+            elif choice == 5:
                 self.clear_terminal()
                 break
                 
@@ -430,104 +815,284 @@ class OperatingSystemSimulator:
                 time.sleep(1)
                 self.clear_terminal()
 
-    def run_scheduler(self):
-        """Ejecuta el planificador con gestión de memoria y desbloqueo"""
-        self.clear_terminal()
+    def simulate(self, algorithm=None, quantum=None):
+        """Ejecuta el planificador sin interacción y retorna los resultados de la corrida"""
+        self.configure(algorithm=algorithm, quantum=quantum)
+        self.run_scheduler()
+        self.finish_profile()
+        self.logger.flush()
+        return self.results()
+
+    def enable_checkpoints(self, path, every=5000, append=False):
+        """Guarda un checkpoint en 'path' cada 'every' despachos mientras corre el planificador"""
+        if every < 1:
+            raise ValueError("checkpoint_every debe ser al menos 1")
+        if self.checkpoints is not None:
+            self.checkpoints.close()
+        self.checkpoints = checkpoint.CheckpointWriter(path, append=append)
+        self.checkpoint_every = every
+        self._next_checkpoint = self.metrics.dispatches + every
+        self._dirty = {}
+
+    def save_checkpoint(self, position=None):
+        """Escribe un checkpoint ahora (completo o incremental) y retorna su número de cuadro"""
+        if self.checkpoints is None:
+            raise ValueError("Los checkpoints no están activados (use enable_checkpoints)")
+        frame = self.checkpoints.write(self, self._dirty, position)
+        self._dirty.clear()
+        self._next_checkpoint = self.metrics.dispatches + self.checkpoint_every
+        self.log_action(f"Checkpoint {frame} guardado en t={self.engine.now:.2f}s", LogLevel.DEBUG)
+        return frame
+
+    def _safe_point(self, position):
+        """Punto del planificador sin estado pendiente: si toca, guarda ahí un checkpoint"""
+        if self.checkpoints is not None and self.metrics.dispatches >= self._next_checkpoint:
+            self.save_checkpoint(position)
+
+    def _scheduler_name(self):
+        return "SMP" if self.processors is not None else self.current_algorithm
+
+    @classmethod
+    def from_checkpoint(cls, path, frame=-1, trace=None, **options):
+        """Crea un simulador con el estado guardado en un checkpoint
+
+        'options' son argumentos del constructor (p. ej. log_file); el tamaño
+        del buffer, la memoria, la paginación y los CPUs salen del checkpoint. Si la corrida
+        reproducía una traza hay que volver a pasarla en 'trace' (se salta lo
+        ya leído). Con checkpoint=path se sigue agregando al mismo archivo.
+        """
+        state = checkpoint.load(path, frame)
+        settings = state["settings"]
+        target = options.pop("checkpoint", None)
+        every = options.pop("checkpoint_every", 5000)
+        options.setdefault("interactive", False)
+        paging = settings.get("paging") or {}  # Los checkpoints sin esta clave son de corridas sin paginación
+        simulator = cls(buffer_size=settings["buffer_size"], memory_size=settings["memory_size"],
+                        memory_policy=settings["memory_policy"], cpus=settings["cpus"],
+                        balancing=settings["balancing"] or "steal", paging=paging.get("policy"),
+                        page_size=paging.get("page_size", 4), tlb_size=paging.get("tlb_size", 16), **options)
+        checkpoint.apply(simulator, state)
+        simulator.resume_point = state["position"]
+
+        pending = any(kind == "trace_arrival" for _, _, kind, _ in simulator.engine.events)
+        if pending and trace is None:
+            raise ValueError("El checkpoint se tomó reproduciendo una traza: pásela en 'trace' para continuar")
+        if pending:
+            source = iter(trace)
+            for _ in range(simulator.trace_read):
+                next(source, None)
+            simulator.arrival_source = source
+        if target:
+            simulator.enable_checkpoints(target, every, append=os.path.abspath(target) == os.path.abspath(path))
+        return simulator
+
+    def resume(self, algorithm=None, quantum=None):
+        """Continúa la corrida restaurada desde el punto del checkpoint y retorna los resultados
+
+        Cambiar el algoritmo o el quantum bifurca la corrida: el planificador
+        nuevo sigue desde el mismo estado en lugar de empezar de cero.
+        """
+        self.configure(algorithm=algorithm, quantum=quantum)
+        self.run_scheduler(self.resume_point)
+        self.resume_point = None
+        self.finish_profile()
+        self.logger.flush()
+        return self.results()
+
+    def run_concurrent(self, strategy="semaphore", producers=None, consumers=None, items=1000, work=0.0):
+        """Ejecuta productores y consumidores como hilos reales sobre un buffer acotado y mide la sincronización
+
+        Sin 'producers' se lanza un hilo por cada proceso Productor de la tabla,
+        que produce burst_time ítems de 'memory' KB; con 'producers' se lanzan
+        esos hilos sintéticos con 'items' ítems cada uno. Sin 'consumers' hay un
+        hilo por proceso Consumidor (al menos uno). El buffer tiene buffer_size
+        espacios, un ítem por espacio; la estrategia "semaphore" usa los
+        semáforos self.mutex, self.empty y self.full. No cambia el estado de
+        los procesos ni el reloj simulado.
+        """
+        if strategy not in concurrency.STRATEGIES:
+            raise ValueError(f"Estrategia desconocida: {strategy} (use {', '.join(concurrency.STRATEGIES)})")
+        if producers is None:
+            threads = [(p.pid, p.burst_time, p.memory) for p in self.process_table.values()
+                       if p.type == ProcessType.PRODUCER]
+        else:
+            threads = [(f"P{i}", items, 1) for i in range(producers)]
+        if consumers is None:
+            consumers = max(1, sum(1 for p in self.process_table.values() if p.type == ProcessType.CONSUMER))
 
-        if not self.process_table:
-            print("\nNo hay procesos para ejecutar")
-            return
+        if strategy == "semaphore":
+            buffer = concurrency.SemaphoreBuffer(self.buffer_size, self.mutex, self.empty, self.full)
+        else:
+            buffer = concurrency.STRATEGIES[strategy](self.buffer_size)
+        result = concurrency.run(buffer, threads, consumers, work)
+        result["strategy"] = strategy
+        self.log_action(f"Modo concurrente ({strategy}): {result['items']} ítems con {len(threads)} productores y "
+                        f"{consumers} consumidores en {result['seconds']:.3f}s")
+        return result
+
+    def results(self):
+        """Resume el estado de la simulación en un diccionario serializable"""
+        processes = []
+        for p in self.process_table.values():
+            completion = p.completion_time
+            timing = self.metrics.processes.get(p.pid)
+            processes.append({
+                "pid": p.pid,
+                "type": p.type.label,
+                "state": p.state.label,
+                "priority": p.priority,
+                "burst_time": p.burst_time,
+                "remaining_time": p.remaining_time,
+                "memory": p.memory,
+                "arrival_time": p.arrival_time,
+                "completion_time": completion,
+                "waiting_time": timing.waiting_time if timing else None,  # Misma definición que metrics
+                "response_time": timing.response_time if timing else None,
+                "turnaround_time": timing.turnaround_time if timing else None,
+                "blocked_time": timing.blocked_time if timing else None,
+            })
+        states = {state: 0 for state in self.PROCESS_STATES}
+        for p in self.process_table.values():
+            states[p.state.label] += 1
+        return {
+            "algorithm": self.current_algorithm,
+            "quantum": self.time_quantum,
+            "simulated_time": self.engine.now,
+            "events": self.engine.processed_events,
+            "states": states,
+            "buffer_used": self.buffer.used,
+            "buffer_high_water": self.buffer.high_water,
+            # Con paginación la memoria contigua no se usa: lo libre son los marcos libres y sus cifras van en "paging"
+            "memory_available": self.memory_available,
+            "memory": self.memory.stats() if self.paging is None else None,
+            "paging": self.paging.stats() if self.paging is not None else None,
+            "metrics": self.metrics.summary(self.engine.now),
+            "processors": self.processors.stats(self.engine.now) if self.processors else None,
+            "profile": self.profiler.report() if self.profiler is not None else None,
+            "processes": processes,
+        }
 
-        # 1. Cargar procesos en memoria si están en estado "Listo" y no están en RAM
-        for process in [p for p in self.process_table if p["Estado"] == "Listo" and not p["InMemory"]]:
-            if not self.load_into_memory(process):
-                process["Estado"] = "Bloqueado"
-                self.blocked_queue.append(process)
-                print(f"Proceso {process['PID']} bloqueado por falta de memoria")
-        
-        # 2. Verificar procesos bloqueados para desbloquear (memoria o buffer)
-        self.check_unblocking_processes()
-        
-        # 3. Ejecutar el planificador según el algoritmo
-        if self.current_algorithm == "FIFO":
-            self.fifo_scheduler()
-        elif self.current_algorithm == "Round Robin":
-            self.round_robin_scheduler()
-
-    def fifo_scheduler(self):
-        """Planificador FIFO (First In, First Out) con interacciones con el buffer"""
+    def run_scheduler(self, resume=None):
+        """Ejecuta el planificador con gestión de memoria y desbloqueo
+
+        'resume' es el punto guardado en un checkpoint: la corrida restaurada
+        sigue desde ahí, sin repetir la preparación de la pasada.
+        """
         self.clear_terminal()
-        self.show_processes()
 
-        def _execute_process(process):
-            """Función auxiliar para ejecutar un proceso"""
-            if process["Estado"] == "Ejecutando":
-                print(f"\nReanudando ejecución de {process['PID']} (FIFO)...")
-            else:
-                print(f"\nProceso {process['PID']} iniciando ejecución (FIFO)")
-            self.log_action(f"Proceso {process['PID']} comenzó ejecución (FIFO)")
-
-            # Verificar si es un productor o consumidor y manejar el buffer
-            if process.get("Type") == "Productor":
-                buffer_used = sum(p['Memory'] for p in self.buffer)
-                if buffer_used + process['Memory'] > self.buffer_size:
-                    # El buffer está lleno, bloqueamos el productor
-                    print(f"\nProceso Productor {process['PID']} ({process['Memory']}) BLOQUEADO - No queda suficiente espacio en el Buffer")
-                    process["Estado"] = "Bloqueado"
-                    self.blocked_queue.append(process)
-                    time.sleep(1)
-                    return
-                else:
-                    # El productor agrega al buffer
-                    print(f"Proceso Productor {process['PID']} añadiendo {process['Memory']}KB al buffer...")
-                    self.buffer.append(process)
-                    time.sleep(1)
-
-            elif process.get("Type") == "Consumidor":
-                buffer_used = sum(p['Memory'] for p in self.buffer)
-                if buffer_used == 0:
-                    # El buffer está vacío, bloqueamos el consumidor
-                    print(f"\nProceso Consumidor {process['PID']} BLOQUEADO - Buffer vacío")
-                    process["Estado"] = "Bloqueado"
-                    self.blocked_queue.append(process)
-                    time.sleep(1)
-                    return
-                else:
-                    # El consumidor consume de los datos en el buffer
-                    if buffer_used - process['Memory'] < 0:
-                        print(f"\nProceso Consumidor {process['PID']} BLOQUEADO - No hay suficiente memoria para consumir")
-                        process["Estado"] = "Bloqueado"
-                        self.blocked_queue.append(process)
-                        return
-                    else:
-                        print(f"Proceso Consumidor {process['PID']} consumiendo {process['Memory']}KB del buffer...")
-                        self.buffer.pop(0)  # Consume el primer ítem del buffer
-                        time.sleep(1)
-            time.sleep(4)  # Simulación de tiempo de ejecución
-            process["Remaining_Time"] = 0
-            process["Estado"] = "Terminado"
-            print(f"Proceso {process['PID']} completado después de {process['Burst_Time']}s")
-            self.log_action(f"Proceso {process['PID']} terminado")
-            self.unload_from_memory(process)
+        if resume is None:
+            if not self.process_table and self.engine.peek_time() is None:
+                self.notify("\nNo hay procesos para ejecutar")
+                return
 
-        # Ejecutar proceso actual si existe
-        if self.executing_queue:
-            current_process = self.executing_queue.popleft()
-            _execute_process(current_process)
-
-        # Procesar en orden FIFO
-        for process in [p for p in self.process_table if p["Estado"] in ["Listo", "Bloqueado"]]:
-            if process["Estado"] == "Listo":
-                if process in self.ready_queue:
-                    self.ready_queue.remove(process)
-                _execute_process(process)
-            elif process["Estado"] == "Bloqueado":
-                print(f"\nProceso {process['PID']} se encuentra bloqueado...")
-                time.sleep(1)
+            # 1. Cargar procesos en memoria si están en estado "Listo" y no están en RAM
+            #    (los que llegan por eventos se cargan al llegar)
+            self.load_ready_processes()
+
+            if self.current_algorithm == "Round Robin":
+                self.buffer.clear()  # Inicializa el buffer
+
+        while True:
+            if resume is None:
+                self.pass_arrivals = self.arrivals
 
-        # Loop para desbloquear procesos y continuar la ejecución
-        previous_blocked_queue_len = len(self.blocked_queue)
-        iterations = 0  # Counter to track the number of iterations without change
+                # 2. Verificar procesos bloqueados para desbloquear (memoria o buffer)
+                self.check_unblocking_processes()
+
+            # 3. Ejecutar el planificador según el algoritmo (con varios CPUs, el multiprocesador);
+            #    un punto guardado solo se retoma con el mismo planificador
+            state = resume[1] if resume is not None and resume[0] == self._scheduler_name() else None
+            resume = None
+            if self.processors is not None:
+                self.smp_scheduler()
+            elif self.current_algorithm == "FIFO":
+                self.fifo_scheduler(state)
+            elif self.current_algorithm == "Round Robin":
+                self.round_robin_scheduler(state)
+
+            # 4. Si quedan llegadas futuras, el CPU queda ocioso hasta la próxima
+            next_arrival = self.engine.peek_time()
+            if next_arrival is not None:
+                self.notify(f"\nCPU ocioso hasta la próxima llegada en t={next_arrival:.2f}s")
+                self.metrics.sample(self.engine.now, self.buffer.used, self.memory_used)
+                self.engine.advance(next_arrival - self.engine.now)
+            elif self.arrivals == self.pass_arrivals:
+                break
+
+        if self.event_trace is not None:
+            self.event_trace.flush()
+        if self.interactive:
+            self.show_metrics()
+
+    def load_ready_processes(self):
+        """Carga en memoria los procesos listos que no están en RAM; los que no caben quedan esperando memoria"""
+        for process in [p for p in self.process_table.values() if p.state == ProcessState.READY and not p.in_memory]:
+            if not self.load_into_memory(process):
+                self._mark_blocked(process)
+                self.blocked_queue.memory.wait(process, process.memory)  # También lo saca de la cola de listos
+                self.notify(f"Proceso {process.pid} bloqueado por falta de memoria")
+
+    def finish_profile(self):
+        """Muestra el desglose por fase de las corridas perfiladas y lo exporta si se pidió un archivo"""
+        if self.profiler is None:
+            return
+        if self.interactive:
+            print("\n===== PERFIL DEL PLANIFICADOR =====")
+            print(self.profiler.table())
+        if self.profile_output:
+            self.profiler.export(self.profile_output)
+            self.notify(f"Perfil guardado en {self.profile_output}")
+
+    def show_metrics(self):
+        """Muestra las métricas de planificación acumuladas"""
+        print("\n===== MÉTRICAS DE PLANIFICACIÓN =====")
+        print(comparison_table({self.current_algorithm: self.metrics.summary(self.engine.now)}))
+        if self.processors is not None:
+            stats = self.processors.stats(self.engine.now)
+            print(f"\nCPUs: {stats['count']} ({stats['balancing']}), migraciones: {stats['migrations']}, "
+                  f"robos: {stats['steals']}")
+            for core in stats["cores"]:
+                print(f"  CPU {core['cpu']:>3}: uso {core['utilization']:.1%}, {core['dispatches']} despachos, "
+                      f"{core['migrations']} migraciones")
+
+    def fifo_scheduler(self, resume=None):
+        """Planificador FIFO (First In, First Out) con interacciones con el buffer
+
+        'resume' son los contadores del ciclo de desbloqueo guardados en un
+        checkpoint tomado dentro de ese ciclo.
+        """
+        self.clear_terminal()
+        if self.interactive:
+            self.show_processes()
+
+        def _run_ready():
+            """Ejecuta los listos que quedaron tras desbloquear"""
+            while self.ready_queue:
+                self._safe_point(("FIFO", (previous_blocked_queue_len, iterations)))
+                process = self.ready_queue.popleft()
+                if process.state == ProcessState.READY:
+                    self._execute_process(process)
+
+        if resume is None:
+            # Ejecutar proceso actual si existe
+            if self.executing_queue:
+                current_process = self.executing_queue.popleft()
+                self._execute_process(current_process)
+
+            # Procesar en orden FIFO (orden de llegada a la cola; los que llegan mientras tanto van al final)
+            if self.interactive:
+                for process in self.blocked_queue:
+                    self.notify(f"\nProceso {process.pid} se encuentra bloqueado...")
+            while self.ready_queue:
+                self._safe_point(("FIFO", None))
+                self._execute_process(self.ready_queue.popleft())
+
+            # Loop para desbloquear procesos y continuar la ejecución
+            previous_blocked_queue_len = len(self.blocked_queue)
+            iterations = 0  # Counter to track the number of iterations without change
+        else:
+            previous_blocked_queue_len, iterations = resume
+            _run_ready()  # Termina la tanda que se interrumpió
 
         while True:
             before_check = len(self.ready_queue)
@@ -538,7 +1103,7 @@ class OperatingSystemSimulator:
             if len(self.blocked_queue) == previous_blocked_queue_len:
                 iterations += 1
                 if iterations >= 2:
-                    print("\nNo hay más progreso. Los procesos bloqueados no se desbloquearán con el entorno actual.")
+                    self.notify("\nNo hay más progreso. Los procesos bloqueados no se desbloquearán con el entorno actual.")
                     break
             else:
                 previous_blocked_queue_len = len(self.blocked_queue)
@@ -549,30 +1114,87 @@ class OperatingSystemSimulator:
 
             # Check for special exit conditions (only one consumer or producer left with an issue)
             if len(self.ready_queue) == 1:
-                last_process = self.ready_queue[0]
-                if last_process["Type"] == "Productor" and sum(p['Memory'] for p in self.buffer) == self.buffer_size:
-                    print(f"\nProceso Productor {last_process['PID']} BLOQUEADO - Buffer lleno, no puede producir más")
+                last_process = self.ready_queue.peek()
+                if last_process.type == ProcessType.PRODUCER and self.buffer.used == self.buffer_size:
+                    self.notify(f"\nProceso Productor {last_process.pid} BLOQUEADO - Buffer lleno, no puede producir más")
                     break
-                elif last_process["Type"] == "Consumidor" and sum(p['Memory'] for p in self.buffer) == 0:
-                    print(f"\nProceso Consumidor {last_process['PID']} BLOQUEADO - Buffer vacío, no puede consumir más")
+                elif last_process.type == ProcessType.CONSUMER and self.buffer.used == 0:
+                    self.notify(f"\nProceso Consumidor {last_process.pid} BLOQUEADO - Buffer vacío, no puede consumir más")
                     break
 
-            for process in [p for p in self.ready_queue if p["Estado"] == "Listo"]:
-                self.ready_queue.remove(process)
-                _execute_process(process)
+            _run_ready()
 
-        print("\nTodos los procesos han sido completados (FIFO)")
+        self.notify(f"\nTodos los procesos han sido completados (FIFO) en t={self.engine.now:.2f}s simulados")
 
-    def round_robin_scheduler(self):
-            """Planificador Round Robin con prioridades y manejo de buffer"""
-            self.clear_terminal()
-            self.show_processes()
+    def _execute_process(self, process):
+        """Ejecuta un proceso FIFO hasta terminarlo (o lo bloquea si el buffer no le alcanza)"""
+        if process.state == ProcessState.RUNNING:
+            self.notify(f"\nReanudando ejecución de {process.pid} (FIFO)...")
+        else:
+            self.notify(f"\nProceso {process.pid} iniciando ejecución (FIFO)")
+        self.log_action(f"Proceso {process.pid} comenzó ejecución (FIFO)", LogLevel.DEBUG)
 
-            self.buffer = []  # Inicializa el buffer
+        # Verificar si es un productor o consumidor y manejar el buffer
+        if not self._fifo_buffer_access(process):
+            return
+        stall = self._dispatch(process, process.remaining_time)
+        self.engine.advance(process.remaining_time + stall)  # Avanza el reloj virtual lo que dura la ráfaga
+        process.remaining_time = 0
+        process.state = ProcessState.TERMINATED
+        self._complete(process)
+        self.notify(f"Proceso {process.pid} completado después de {process.burst_time}s")
+        self.log_action(f"Proceso {process.pid} terminado", LogLevel.DEBUG)
+        self.unload_from_memory(process)
+
+    def _fifo_buffer_access(self, process):
+        """Operación de buffer de un productor o consumidor FIFO antes de ejecutar. Retorna False si se bloqueó"""
+        if process.type == ProcessType.PRODUCER:
+            if not self.buffer.can_produce(process.memory):
+                # El buffer está lleno, bloqueamos el productor
+                self.notify(f"\nProceso Productor {process.pid} ({process.memory}) BLOQUEADO - No queda suficiente espacio en el Buffer")
+                self._mark_blocked(process)
+                self.blocked_queue.append(process)
+                return False
+            # El productor agrega al buffer
+            self.notify(f"Proceso Productor {process.pid} añadiendo {process.memory}KB al buffer...")
+            self.buffer.produce(process.pid, process.memory)
+            self._trace(EventKind.PRODUCE, process, process.memory)
+
+        elif process.type == ProcessType.CONSUMER:
+            buffer_used = self.buffer.used
+            if buffer_used == 0:
+                # El buffer está vacío, bloqueamos el consumidor
+                self.notify(f"\nProceso Consumidor {process.pid} BLOQUEADO - Buffer vacío")
+                self._mark_blocked(process)
+                self.blocked_queue.append(process)
+                return False
+            # El consumidor consume de los datos en el buffer
+            if buffer_used - process.memory < 0:
+                self.notify(f"\nProceso Consumidor {process.pid} BLOQUEADO - No hay suficiente memoria para consumir")
+                self._mark_blocked(process)
+                self.blocked_queue.append(process)
+                return False
+            self.notify(f"Proceso Consumidor {process.pid} consumiendo {process.memory}KB del buffer...")
+            _, consumed = self.buffer.pop()  # Consume el primer ítem del buffer
+            self._trace(EventKind.CONSUME, process, consumed)
+        return True
+
+    def round_robin_scheduler(self, resume=None):
+            """Planificador Round Robin con prioridades y manejo de buffer ('resume': retomar la ronda de un checkpoint)"""
+            self.clear_terminal()
+            if self.interactive:
+                self.show_processes()
 
             sin_cambios = False
 
             while True:
+                if resume is not None:
+                    # El checkpoint se tomó a mitad de una ronda: se termina antes de volver a revisar
+                    resume = None
+                    sin_cambios = True
+                    self._run_round(self.ready_queue.pop_round())
+                    continue
+
                 self._clean_queues()
 
                 if not (self.executing_queue or self.ready_queue or self.blocked_queue):
@@ -585,191 +1207,256 @@ class OperatingSystemSimulator:
                     sin_cambios = False
                     continue
 
-                active_processes = []
-                if self.executing_queue:
-                    active_processes.append(self.executing_queue[0])
-                active_processes.extend(sorted(self.ready_queue, key=lambda x: x["Prioridad"]))
-
-                if not active_processes:
+                if not (self.executing_queue or self.ready_queue):
                     if not self.blocked_queue or sin_cambios:
-                        print("\nNo hay procesos listos ni ejecutándose. Finalizando planificación.")
+                        self.notify("\nNo hay procesos listos ni ejecutándose. Finalizando planificación.")
                         break
 
-                    # Check if all remaining blocked consumers can't be unblocked
-                    can_unblock = False
-                    buffer_used = sum(p['Memory'] for p in self.buffer)
-                    for p in self.blocked_queue:
-                        if p["Type"] == "Consumidor" and buffer_used >= p["Memory"]:
-                            can_unblock = True
-                            break
-                        if p["Type"] == "Productor" and (buffer_used + p["Memory"] <= self.buffer_size):
-                            can_unblock = True
-                            break
+                    # Check if all remaining blocked consumers can't be unblocked (solo se miran los umbrales mínimos)
+                    needed_data = self.blocked_queue.buffer_data.min_threshold()
+                    needed_space = self.blocked_queue.buffer_space.min_threshold()
+                    can_unblock = ((needed_data is not None and self.buffer.used >= needed_data) or
+                                   (needed_space is not None and self.buffer.free >= needed_space))
 
                     if not can_unblock:
-                        print("\nNo se pueden desbloquear más procesos. Terminando.")
+                        self.notify("\nNo se pueden desbloquear más procesos. Terminando.")
                         break
 
-                    print("\nEsperando desbloqueo...")
-                    time.sleep(1)
+                    self.notify("\nEsperando desbloqueo...")
+                    self.metrics.sample(self.engine.now, self.buffer.used, self.memory_used)
+                    self.engine.advance(1)
                     sin_cambios = True
                     continue
 
                 sin_cambios = True  # Se pone en False solo si algo cambia
 
-                for process in list(active_processes):
-                    if process["Estado"] in ("Terminado", "Bloqueado"):
-                        continue
+                # La ronda incluye al proceso en ejecución y a los listos en orden de prioridad;
+                # los procesos que se reencolen durante la ronda esperan a la siguiente
+                self.ready_queue.start_round()
+                self._run_round(self.executing_queue.popleft() if self.executing_queue else self.ready_queue.pop_round())
+
+            self.notify(f"\nPlanificación Round Robin finalizada en t={self.engine.now:.2f}s simulados")
+
+    def _run_round(self, process):
+        """Ejecuta un quantum de cada proceso de la ronda cerrada, empezando por 'process'"""
+        while process is not None:
+            if process.state not in (ProcessState.TERMINATED, ProcessState.BLOCKED):
+                self.run_process(process)
+            self._safe_point(("Round Robin", ()))
+            process = self.ready_queue.pop_round()
+
+    def smp_scheduler(self):
+        """Planificador multiprocesador: cada CPU atiende su propia cola con el algoritmo elegido
+
+        Los turnos terminan como eventos del reloj. Entre un evento y otro se
+        despiertan los bloqueados, los listos se reparten entre las colas de
+        los CPUs y cada CPU libre toma el siguiente de su cola (o lo roba de
+        otra, según el balanceo). FIFO ejecuta cada proceso hasta terminar;
+        Round Robin, de a un quantum.
+        """
+        self.clear_terminal()
+        cpus = self.processors
+        round_robin = self.current_algorithm == "Round Robin"
 
-                    if process in self.executing_queue:
-                        self.executing_queue.remove(process)
-                    elif process in self.ready_queue:
-                        self.ready_queue.remove(process)
+        while True:
+            self._safe_point(("SMP", None))
 
-                    self.run_process(process)
+            # Repartir y despachar hasta que ningún CPU libre consiga trabajo. Los que esperan memoria
+            # se cargan solo cuando algún CPU se queda sin trabajo: así se cargan por tandas (una sola
+            # compactación) y no uno por cada proceso que termina
+            memory = False
+            while True:
+                self.check_unblocking_processes(memory)
+                while self.ready_queue:
+                    process = self.ready_queue.popleft()
+                    cpus.place(process)
+                    self._changed(process.pid)
+                idle = list(cpus.idle.values())
+                hungry = [core for core in idle if not self._start_on_core(core, round_robin)]
+                started = len(hungry) < len(idle)
+                if hungry and cpus.balancing == "steal":
+                    for core in cpus.steal(hungry):
+                        started |= self._start_on_core(core, round_robin)
+                if not cpus.idle:
+                    break
+                if not started:
+                    if memory or not self.blocked_queue.memory:
+                        break
+                    memory = True
+
+            if not cpus.running:
+                next_event = self.engine.peek_time()
+                if next_event is None:
+                    break
+                self.notify(f"\nCPUs ociosos hasta t={next_event:.2f}s")
+                self.metrics.sample(self.engine.now, self.buffer.used, self.memory_used)
+            self.engine.step()
+
+        self.notify(f"\nPlanificación {self.current_algorithm} en {len(cpus)} CPUs finalizada "
+                    f"en t={self.engine.now:.2f}s simulados")
+
+    def _start_on_core(self, core, round_robin):
+        """Despacha en un CPU libre el siguiente proceso de su cola que pueda ejecutar. Retorna True si lo hubo"""
+        while True:
+            process = self.processors.next_process(core, round_robin)
+            if process is None:
+                return False
+            if round_robin:
+                duration = min(self.time_quantum, process.remaining_time)
+                if self._quantum_buffer_access(process, duration):
+                    break
+            else:
+                duration = process.remaining_time
+                if self._fifo_buffer_access(process):
+                    break
+
+        self.processors.start(core, process, duration)
+        process.state = ProcessState.RUNNING
+        self.notify(f"CPU {core.index}: proceso {process.pid} ejecuta {duration}s")
+        stall = self._dispatch(process, duration, core.index)
+        self.engine.schedule(duration + stall, "slice_end", (core, duration))
+        return True
+
+    def _on_slice_end(self, payload):
+        """Evento de fin de turno: libera el CPU y el proceso termina o vuelve a quedar listo"""
+        core, duration = payload
+        self._end_quantum(self.processors.release(core), duration)
 
     def execute_producer(self, process):
         """Ejecuta un proceso productor"""
-        if not process["InMemory"]:
-            print(f"Productor {process['PID']} no puede ejecutarse: falta memoria")
-            process["Estado"] = "Bloqueado"
-            self.blocked_queue.append(process)
+        if not process.in_memory:
+            self.notify(f"Productor {process.pid} no puede ejecutarse: falta memoria")
+            self._mark_blocked(process)
+            self.blocked_queue.memory.wait(process, process.memory)
             return
         
-        print(f"\nProductor {process['PID']} intentando producir...")
+        self.notify(f"\nProductor {process.pid} intentando producir...")
   
         self.mutex.acquire()
         
         # Sección crítica - agregar al buffer
-        item = f"Item-{random.randint(100,999)}"
-        self.buffer.append(item)
-        print(f"Productor {process['PID']} agregó {item}. Buffer: {self.buffer}")
-        self.log_action(f"Productor {process['PID']} produjo {item}")
+        item = f"Item-{self.rng.randint(100,999)}"
+        self.buffer.produce(process.pid, process.memory)
+        self._trace(EventKind.PRODUCE, process, process.memory)
+        self.notify(f"Productor {process.pid} agregó {item}. Buffer: {self.buffer.used}KB en {len(self.buffer)} ítems")
+        self.log_action(f"Productor {process.pid} produjo {item}", LogLevel.DEBUG)
         
         self.mutex.release()
         self.full.release()
         
         # Actualizar estado del proceso
-        process["Remaining_Time"] -= 1
-        if process["Remaining_Time"] <= 0:
-            process["Estado"] = "Terminado"
+        process.remaining_time -= 1
+        if process.remaining_time <= 0:
+            process.state = ProcessState.TERMINATED
+            self._complete(process)
             self.unload_from_memory(process)
         else:
-            process["Estado"] = "Listo"
+            process.state = ProcessState.READY
             self.ready_queue.append(process)
 
     def execute_consumer(self, process):
         """Ejecuta un proceso consumidor"""
-        if not process["InMemory"]:
-            print(f"Consumidor {process['PID']} no puede ejecutarse: falta memoria")
-            process["Estado"] = "Bloqueado"
-            self.blocked_queue.append(process)
+        if not process.in_memory:
+            self.notify(f"Consumidor {process.pid} no puede ejecutarse: falta memoria")
+            self._mark_blocked(process)
+            self.blocked_queue.memory.wait(process, process.memory)
             return
         
-        print(f"\nConsumidor {process['PID']} intentando consumir...")
+        self.notify(f"\nConsumidor {process.pid} intentando consumir...")
             
         self.mutex.acquire()
         
         # Sección crítica - remover del buffer
-        item = self.buffer.pop(0)
-        print(f"Consumidor {process['PID']} consumió {item}. Buffer: {self.buffer}")
-        self.log_action(f"Consumidor {process['PID']} consumió {item}")
+        item = self.buffer.pop()
+        self._trace(EventKind.CONSUME, process, item[1])
+        self.notify(f"Consumidor {process.pid} consumió {item}. Buffer: {self.buffer.used}KB en {len(self.buffer)} ítems")
+        self.log_action(f"Consumidor {process.pid} consumió {item}", LogLevel.DEBUG)
         
         self.mutex.release()
         self.empty.release()
         
         # Actualizar estado del proceso
-        process["Remaining_Time"] -= 1
-        if process["Remaining_Time"] <= 0:
-            process["Estado"] = "Terminado"
+        process.remaining_time -= 1
+        if process.remaining_time <= 0:
+            process.state = ProcessState.TERMINATED
+            self._complete(process)
             self.unload_from_memory(process)
         else:
-            process["Estado"] = "Listo"
+            process.state = ProcessState.READY
             self.ready_queue.append(process)
 
     def run_process(self, process):
-        quantum = 2
-        buffer_used = sum(p['Memory'] for p in self.buffer)
+        """Ejecuta un quantum de un proceso sobre el reloj virtual (Round Robin)"""
+        time_this_iteration = min(self.time_quantum, process.remaining_time)
+        if not self._quantum_buffer_access(process, time_this_iteration):
+            return
 
-        burst = process["Burst_Time"]
-        total_memory = process["Memory"]
-        remaining_time = process["Remaining_Time"]
+        # El quantum consume tiempo del reloj virtual (sin esperas reales salvo reproducción)
+        process.state = ProcessState.RUNNING
+        stall = self._dispatch(process, time_this_iteration)
+        self.engine.advance(time_this_iteration + stall)
+        self._end_quantum(process, time_this_iteration)
 
-        total_iterations = math.ceil(burst / quantum)
-        memory_per_iteration = total_memory / total_iterations
+    def _quantum_buffer_access(self, process, time_this_iteration):
+        """Operación de buffer proporcional al quantum (Round Robin). Retorna False si el proceso se bloqueó"""
+        buffer_used = self.buffer.used
 
         #Ajusta la memoria para la ejecucion actual
-        time_this_iteration = min(quantum, remaining_time)
-        proportion = time_this_iteration / burst
-        memory_this_iteration = total_memory * (time_this_iteration / burst)
-        time.sleep(2)
-        if process["Type"] == "Productor":
-            if buffer_used + memory_this_iteration > self.buffer_size:
-                print(f"\nProductor {process['PID']} BLOQUEADO - Buffer lleno")
-                process["Estado"] = "Bloqueado"
-                self.blocked_queue.append(process)
-                return
-            else:
-                print(f"\nProceso {process['PID']} (Prioridad {process['Prioridad']}) ejecutando quantum de {time_this_iteration}s")
-                print(f"Productor {process['PID']} agregando {memory_this_iteration:.2f}KB al buffer...")
-                self.buffer.append({"PID": process["PID"], "Memory": memory_this_iteration})
-
-        elif process["Type"] == "Consumidor":
+        memory_this_iteration = process.memory * (time_this_iteration / process.burst_time)
+        if process.type == ProcessType.PRODUCER:
+            if not self.buffer.can_produce(memory_this_iteration):
+                self.notify(f"\nProductor {process.pid} BLOQUEADO - Buffer lleno")
+                self._mark_blocked(process)
+                self.blocked_queue.buffer_space.wait(process, memory_this_iteration)
+                return False
+            self.notify(f"\nProceso {process.pid} (Prioridad {process.priority}) ejecutando quantum de {time_this_iteration}s")
+            self.notify(f"Productor {process.pid} agregando {memory_this_iteration:.2f}KB al buffer...")
+            self.buffer.produce(process.pid, memory_this_iteration)
+            self._trace(EventKind.PRODUCE, process, memory_this_iteration)
+
+        elif process.type == ProcessType.CONSUMER:
             if buffer_used == 0:
-                print(f"\nConsumidor {process['PID']} BLOQUEADO - Buffer vacío")
-                process["Estado"] = "Bloqueado"
-                self.blocked_queue.append(process)
-                return
+                self.notify(f"\nConsumidor {process.pid} BLOQUEADO - Buffer vacío")
+                self._mark_blocked(process)
+                self.blocked_queue.buffer_data.wait(process, memory_this_iteration)
+                return False
             elif buffer_used < memory_this_iteration:
-                print(f"\nConsumidor {process['PID']} BLOQUEADO - No hay suficiente en buffer")
-                process["Estado"] = "Bloqueado"
-                self.blocked_queue.append(process)
-                return
-            else:
-                print(f"\nProceso {process['PID']} (Prioridad {process['Prioridad']}) ejecutando quantum de {time_this_iteration}s")
-                print(f"Consumidor {process['PID']} consumiendo {memory_this_iteration:.2f}KB del buffer...")
-                consumed = 0
-                while consumed < memory_this_iteration and self.buffer:
-                    item = self.buffer.pop(0)
-                    consumed += item["Memory"]
-                if consumed > memory_this_iteration:
-                    # Regresa el exceso al buffer
-                    self.buffer.insert(0, {"PID": process["PID"], "Memory": consumed - memory_this_iteration})
-
-        elif process["Type"] == "Normal":
-            print(f"\nProceso {process['PID']} (Prioridad {process['Prioridad']}) ejecutando quantum de {time_this_iteration}s")
-
-            memory_per_second = process["Memoria"] / process["Burst"]
-            memory_this_turn = memory_per_second * time_this_iteration
-
-            if self.memory_used + memory_this_turn > self.total_memory:
-                print(f"\nProceso {process['PID']} BLOQUEADO - No hay suficiente memoria para este turno ({memory_this_turn:.2f}KB)")
-                process["Estado"] = "Bloqueado"
-                self.blocked_queue.append(process)
-                return
-
-            self.memory_used += memory_this_turn
-            print(f"Proceso {process['PID']} ejecutando... usando {memory_this_turn:.2f}KB de memoria")
-
-            process["Restante"] -= time_this_iteration
-
-            if process["Restante"] <= 0:
-                process["Estado"] = "Terminado"
-                self.memory_used -= process["Memoria"]  # libera toda su memoria
-                print(f"Proceso {process['PID']} COMPLETADO")
-            else:
-                process["Estado"] = "Listo"
-                print(f"Proceso {process['PID']} PAUSADO - {process['Restante']}s restantes")
-                self.memory_used -= memory_this_turn  # libera memoria solo de este quantum
-                self.ready_queue.append(process)
+                self.notify(f"\nConsumidor {process.pid} BLOQUEADO - No hay suficiente en buffer")
+                self._mark_blocked(process)
+                self.blocked_queue.buffer_data.wait(process, memory_this_iteration)
+                return False
+            self.notify(f"\nProceso {process.pid} (Prioridad {process.priority}) ejecutando quantum de {time_this_iteration}s")
+            self.notify(f"Consumidor {process.pid} consumiendo {memory_this_iteration:.2f}KB del buffer...")
+            self.buffer.consume(memory_this_iteration)  # El exceso del último ítem regresa al frente
+            self._trace(EventKind.CONSUME, process, memory_this_iteration)
 
+        else:
+            self.notify(f"\nProceso {process.pid} (Prioridad {process.priority}) ejecutando quantum de {time_this_iteration}s")
+        return True
+
+    def _end_quantum(self, process, elapsed):
+        """Descuenta el tiempo ejecutado: el proceso termina o vuelve a la cola de listos"""
+        process.remaining_time -= elapsed
+        self._changed(process.pid)  # Con varios CPUs puede haber un checkpoint entre el despacho y el fin del turno
+
+        if process.remaining_time <= 0:
+            process.remaining_time = 0
+            process.state = ProcessState.TERMINATED
+            self._complete(process)
+            self.notify(f"Proceso {process.pid} COMPLETADO en t={self.engine.now:.2f}s")
+            self.log_action(f"Proceso {process.pid} terminado ({self.current_algorithm})", LogLevel.DEBUG)
+            self.unload_from_memory(process)
+        else:
+            process.state = ProcessState.READY
+            self.notify(f"Proceso {process.pid} PAUSADO - {process.remaining_time}s restantes")
+            self._trace(EventKind.PREEMPT, process, process.remaining_time)
+            self.ready_queue.append(process)
 
     def _clean_queues(self):
-        """Limpia las colas de procesos terminados"""
-        for queue in [self.executing_queue, self.ready_queue, self.blocked_queue]:
-            new_queue = deque(p for p in queue if p.get("Estado") != "Terminado")
-            queue.clear()
-            queue.extend(new_queue)
+        """Limpia el CPU de procesos terminados (las demás colas los sueltan al terminar)"""
+        for p in list(self.executing_queue):
+            if p.state == ProcessState.TERMINATED:
+                self.executing_queue.remove(p)
 
     def run(self):
         """Bucle principal del sistema operativo simulado"""
@@ -787,7 +1474,7 @@ class OperatingSystemSimulator:
                 self.clear_terminal()
                 self.create_consumer_process()
             elif choice == "4":
-                self.show_processes()
+                self.browse_processes()
             elif choice == "5":
                 self.modify_process_state()
             elif choice == "6":
@@ -796,6 +1483,7 @@ class OperatingSystemSimulator:
                 self.print_logs()
             elif choice == "8":
                 self.run_scheduler()
+                self.finish_profile()
             elif choice == "9":
                 self.set_scheduling_algorithm()
             elif choice == "10":
@@ -805,6 +1493,11 @@ class OperatingSystemSimulator:
                 if choice == "s": 
                     print("\nSaliendo del sistema operativo simulado. ¡Adiós!")
                     self.log_action("Sistema terminado")
+                    self.logger.close()
+                    if self.event_trace is not None:
+                        self.event_trace.close()
+                    if self.checkpoints is not None:
+                        self.checkpoints.close()
                     break
                 else: 
                     self.clear_terminal()
@@ -0,0 +1,155 @@
+try:
+    import numpy as np
+except ImportError:  # NumPy es opcional: sin él solo queda el simulador paso a paso
+    np = None
+
+from process import ProcessType
+
+
+def _require_numpy():
+    if np is None:
+        raise ImportError("El evaluador por lotes requiere NumPy (pip install numpy)")
+
+
+def _schedule(burst, arrival, completion):
+    """Arma el resultado con los tiempos derivados de la finalización"""
+    turnaround = completion - arrival
+    return {
+        "completion": completion,
+        "turnaround": turnaround,
+        "waiting": turnaround - burst,
+        "makespan": float(completion.max()) if completion.size else 0.0,
+    }
+
+
+def fifo_schedule(burst, arrival=None):
+    """Tiempos de FIFO sin simular paso a paso
+
+    Los procesos se atienden en orden de llegada (a igual llegada, en el orden
+    de los arreglos, que es el orden de creación). Con C = suma acumulada de
+    las ráfagas, la finalización es C_i + max_{j<=i}(llegada_j - C_{j-1}): el
+    máximo acumulado absorbe los periodos en que el CPU queda ocioso.
+    """
+    _require_numpy()
+    burst = np.asarray(burst, dtype=np.float64)
+    arrival = np.zeros_like(burst) if arrival is None else np.asarray(arrival, dtype=np.float64)
+
+    order = np.argsort(arrival, kind="stable")
+    b = burst[order]
+    cumulative = np.cumsum(b)
+    finished = cumulative + np.maximum.accumulate(arrival[order] - (cumulative - b))
+    completion = np.empty_like(burst)
+    completion[order] = finished
+    return _schedule(burst, arrival, completion)
+
+
+def round_robin_schedule(burst, priority=None, quantum=2, arrival=None):
+    """Tiempos de Round Robin por rondas vectorizadas, con la semántica de round_robin_scheduler
+
+    Cada ronda atiende, en orden de prioridad (menor número primero) y luego de
+    llegada a la cola, a todos los procesos listos al comenzar la ronda, cada uno
+    por min(quantum, restante). Los que no terminan vuelven a la cola para la
+    ronda siguiente. Un proceso entra en la primera ronda que comienza en o
+    después de su llegada; si llega en el mismo instante en que otro se
+    reencola, queda antes que él (el reloj atiende la llegada antes de
+    reencolar). El trabajo total es proporcional a la cantidad de quantums.
+    """
+    _require_numpy()
+    if quantum <= 0:
+        raise ValueError("El quantum debe ser mayor que 0")
+    burst = np.asarray(burst, dtype=np.float64)
+    n = burst.size
+    priority = np.zeros(n, dtype=np.int64) if priority is None else np.asarray(priority)
+    arrival = np.zeros_like(burst) if arrival is None else np.asarray(arrival, dtype=np.float64)
+
+    remaining = burst.copy()
+    completion = np.full(n, np.nan)
+    pending = np.argsort(arrival, kind="stable")  # Procesos aún no llegados, por llegada
+    pending_arrival = arrival[pending]
+    admitted = 0
+
+    active = np.empty(0, dtype=np.intp)   # Procesos de la ronda, ya en orden de atención
+    enqueued = np.empty(0)                # Momento en que cada uno entró a la cola
+    requeued = np.empty(0, dtype=bool)    # A igual momento, las llegadas van antes que los reencolados
+    now = 0.0
+    while True:
+        stop = int(np.searchsorted(pending_arrival, now, side="right"))
+        if stop > admitted:
+            new = pending[admitted:stop]
+            admitted = stop
+            active = np.concatenate((active, new))
+            enqueued = np.concatenate((enqueued, arrival[new]))
+            requeued = np.concatenate((requeued, np.zeros(new.size, dtype=bool)))
+            # Solo las llegadas desordenan la ronda: los que se reencolan ya salen en orden
+            order = np.lexsort((active, requeued, enqueued, priority[active]))
+            active, enqueued, requeued = active[order], enqueued[order], requeued[order]
+        if active.size == 0:
+            if admitted == n:
+                break
+            now = max(now, float(pending_arrival[admitted]))  # CPU ocioso hasta la próxima llegada
+            continue
+
+        slices = np.minimum(quantum, remaining[active])
+        ends = now + np.cumsum(slices)
+        remaining[active] -= slices
+        done = remaining[active] <= 0
+        completion[active[done]] = ends[done]
+        now = float(ends[-1])
+        active, enqueued = active[~done], ends[~done]
+        requeued = np.ones(active.size, dtype=bool)
+
+    return _schedule(burst, arrival, completion)
+
+
+def evaluate(algorithm, burst, priority=None, quantum=2, arrival=None):
+    """Evalúa un algoritmo del simulador ("FIFO" o "Round Robin") sobre arreglos de procesos"""
+    if algorithm == "FIFO":
+        return fifo_schedule(burst, arrival)
+    if algorithm == "Round Robin":
+        return round_robin_schedule(burst, priority, quantum, arrival)
+    raise ValueError(f"Algoritmo desconocido: {algorithm}")
+
+
+def evaluate_columns(columns, algorithm, quantum=2):
+    """Evalúa una tabla ProcessColumns usando sus columnas como arreglos NumPy sin copia"""
+    data = columns.as_numpy()
+    return evaluate(algorithm, data["burst_time"], data["priority"], quantum, data["arrival_time"])
+
+
+def summary(schedule):
+    """Promedios de espera y retorno, tiempo total y rendimiento de un resultado"""
+    count = schedule["completion"].size
+    makespan = schedule["makespan"]
+    return {
+        "process_count": count,
+        "makespan": makespan,
+        "avg_waiting_time": float(schedule["waiting"].mean()) if count else 0.0,
+        "avg_turnaround_time": float(schedule["turnaround"].mean()) if count else 0.0,
+        "throughput": count / makespan if makespan else 0.0,
+    }
+
+
+def cross_check(simulator, algorithm="FIFO", quantum=None):
+    """Corre el simulador paso a paso y el evaluador sobre los mismos procesos
+
+    Retorna la mayor diferencia entre los tiempos de finalización de ambos. Los
+    procesos se toman de los resultados de la corrida, no de la tabla previa,
+    para incluir los que llegan después (aún son eventos pendientes al
+    comenzar). El evaluador solo modela procesos Normales que caben todos en
+    memoria, sobre un simulador que todavía no ejecutó nada.
+    """
+    _require_numpy()
+    capacity = simulator.memory.available
+    quantum = simulator.time_quantum if quantum is None else quantum
+    processes = simulator.simulate(algorithm, quantum)["processes"]
+    if any(p["type"] != ProcessType.NORMAL.label for p in processes):
+        raise ValueError("El evaluador por lotes solo modela procesos Normales")
+    if sum(p["memory"] for p in processes) > capacity:
+        raise ValueError("El evaluador por lotes supone que todos los procesos caben en memoria")
+    if not processes:
+        return 0.0
+
+    expected = evaluate(algorithm, [p["burst_time"] for p in processes],
+                        [p["priority"] for p in processes], quantum, [p["arrival_time"] for p in processes])
+    actual = np.array([p["completion_time"] for p in processes], dtype=np.float64)
+    return float(np.abs(actual - expected["completion"]).max())
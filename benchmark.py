@@ -0,0 +1,166 @@
+import datetime
+import functools
+import json
+import os
+import platform
+import random
+import subprocess
+import time
+import tracemalloc
+
+from Menu_v2 import OperatingSystemSimulator
+from logger import LogLevel
+from workload import MIX  # Proporción de cada tipo de proceso
+
+SIZES = (1_000, 10_000, 100_000, 1_000_000)
+ALGORITHMS = ("FIFO", "Round Robin")
+
+# Métodos del simulador que se cronometran por separado
+PATHS = ("fifo_scheduler", "round_robin_scheduler", "check_unblocking_processes", "run_process")
+
+
+def populate(simulator, size, mix=None, seed=0):
+    """Agrega 'size' procesos sintéticos con la mezcla de tipos indicada"""
+    mix = mix or MIX
+    rng = random.Random(seed)
+    types, weights = list(mix), list(mix.values())
+    for i, process_type in enumerate(rng.choices(types, weights, k=size)):
+        simulator.add_process(rng.randint(1, 10), process_type, burst_time=rng.randint(1, 15),
+                              memory=rng.randint(64, 256), pid=str(i))
+
+
+def _timed(method, stats):
+    """Envuelve un método del simulador acumulando llamadas y segundos en 'stats'"""
+    @functools.wraps(method)
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return method(*args, **kwargs)
+        finally:
+            stats["calls"] += 1
+            stats["seconds"] += time.perf_counter() - start
+    return wrapper
+
+
+def build_case(size, algorithm, quantum=2, mix=None, seed=0, memory_size=None, buffer_size=500):
+    """Crea un simulador listo para correr: sin terminal, sin logs y sin pausas de reproducción"""
+    simulator = OperatingSystemSimulator(
+        playback_speed=None,  # El reloj virtual avanza sin dormir
+        interactive=False,
+        log_file=os.devnull,
+        buffer_size=buffer_size,
+        memory_size=memory_size or size * 128,  # Cerca del 80% de lo que piden: ejercita las esperas por memoria
+        seed=seed,
+        log_level=LogLevel.OFF,
+    )
+    populate(simulator, size, mix, seed)
+    simulator.configure(algorithm=algorithm, quantum=quantum)
+    return simulator
+
+
+def run_case(size, algorithm, quantum=2, mix=None, seed=0, track_memory=True, repeats=1):
+    """Mide un caso: tiempo total y por ruta del planificador, eventos por segundo y memoria pico
+
+    Con repeats > 1 se corre varias veces y se conserva la corrida más rápida,
+    lo que reduce el ruido en los casos cortos.
+    """
+    result = min((_timed_run(size, algorithm, quantum, mix, seed) for _ in range(max(1, repeats))),
+                 key=lambda run: run["seconds"])
+    if track_memory:
+        result["peak_memory_bytes"] = measure_peak_memory(size, algorithm, quantum, mix, seed)
+    return result
+
+
+def _timed_run(size, algorithm, quantum, mix, seed):
+    """Una corrida cronometrada del caso"""
+    simulator = build_case(size, algorithm, quantum, mix, seed)
+
+    paths = {name: {"calls": 0, "seconds": 0.0} for name in PATHS}
+    for name in PATHS:
+        setattr(simulator, name, _timed(getattr(simulator, name), paths[name]))
+    clock = {"calls": 0, "seconds": 0.0}
+    simulator.engine.advance = _timed(simulator.engine.advance, clock)
+
+    start = time.perf_counter()
+    simulator.run_scheduler()
+    seconds = time.perf_counter() - start
+
+    # Cada avance del reloj es un despacho; se suman los eventos programados de la cola
+    events = clock["calls"] + simulator.engine.processed_events
+    return {
+        "size": size,
+        "algorithm": algorithm,
+        "quantum": quantum if algorithm == "Round Robin" else None,
+        "seed": seed,
+        "seconds": seconds,
+        "events": events,
+        "events_per_second": events / seconds if seconds else 0.0,
+        "simulated_time": simulator.engine.now,
+        "completed": sum(1 for p in simulator.process_table.values() if p.completion_time is not None),
+        "paths": {name: stats for name, stats in paths.items() if stats["calls"]},
+        "peak_memory_bytes": None,
+    }
+
+
+def measure_peak_memory(size, algorithm, quantum=2, mix=None, seed=0):
+    """Memoria pico (tracemalloc) de crear y correr el caso; se mide aparte para no alterar los tiempos"""
+    tracemalloc.start()
+    try:
+        build_case(size, algorithm, quantum, mix, seed).run_scheduler()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def run_suite(sizes=SIZES, algorithms=ALGORITHMS, quantum=2, mix=None, seed=0, track_memory=True, repeats=1,
+              progress=None):
+    """Corre todos los casos y retorna el documento JSON de resultados"""
+    results = []
+    for size in sizes:
+        for algorithm in algorithms:
+            result = run_case(size, algorithm, quantum, mix, seed, track_memory, repeats)
+            results.append(result)
+            if progress:
+                progress(result)
+    return {
+        "version": _version(),
+        "timestamp": datetime.datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "mix": mix or MIX,
+        "results": results,
+    }
+
+
+def compare(baseline, current, tolerance=0.10):
+    """Casos que empeoraron más que 'tolerance' (fracción) en eventos por segundo o memoria pico"""
+    previous = {(r["size"], r["algorithm"], r["quantum"]): r for r in baseline["results"]}
+    regressions = []
+    for result in current["results"]:
+        before = previous.get((result["size"], result["algorithm"], result["quantum"]))
+        if before is None:
+            continue
+        checks = [("events_per_second", before["events_per_second"], result["events_per_second"], -1)]
+        if before.get("peak_memory_bytes") and result.get("peak_memory_bytes"):
+            checks.append(("peak_memory_bytes", before["peak_memory_bytes"], result["peak_memory_bytes"], 1))
+        for metric, old, new, worse in checks:
+            change = (new - old) / old if old else 0.0
+            if change * worse > tolerance:
+                regressions.append({"size": result["size"], "algorithm": result["algorithm"], "metric": metric,
+                                    "baseline": old, "current": new, "change": change})
+    return regressions
+
+
+def load(path):
+    """Lee un archivo de resultados guardado"""
+    with open(path, "r") as f:
+        return json.load(f)
+
+
+def _version():
+    """Commit actual del repositorio, si se puede obtener"""
+    try:
+        return subprocess.run(["git", "describe", "--always", "--dirty"], capture_output=True, text=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__)), check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
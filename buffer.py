@@ -0,0 +1,132 @@
+import math
+from array import array
+
+
+class SharedBuffer:
+    """Buffer productor-consumidor sobre un anillo de arreglos preasignados
+
+    Cada ítem es (PID del productor, KB): los PIDs viven en una lista y los KB
+    en un array('d') del mismo tamaño, recorridos como anillo con un índice de
+    cabeza y una cantidad. El anillo tiene un espacio por KB de capacidad y no
+    crece: además de los KB, el buffer se llena si se acaban los espacios
+    (muchos ítems fraccionarios de Round Robin), y entonces el productor se
+    bloquea como cuando no le caben los KB. Agregar al final, sacar del frente
+    y regresar un sobrante al frente cuestan O(1) sin crear ni mover entradas.
+    Los KB usados, la cantidad de ítems y la marca máxima de ocupación se
+    actualizan en O(1), así que consultar la ocupación nunca recorre el buffer.
+    """
+
+    def __init__(self, capacity):
+        self.capacity = capacity  # Tamaño máximo en KB
+        self.slots = max(1, math.ceil(capacity))  # Ítems que caben en el anillo
+        self.used = 0             # KB ocupados
+        self.high_water = 0       # Máxima ocupación alcanzada en KB
+        self._allocate()
+
+    def __len__(self):
+        return self.count
+
+    def __bool__(self):
+        return self.count > 0
+
+    def __iter__(self):
+        """Recorre una copia de los ítems (pid, kb) del frente al final"""
+        pids, kbs, slots = self.pids, self.kbs, self.slots
+        return iter([(pids[i % slots], kbs[i % slots]) for i in range(self.head, self.head + self.count)])
+
+    @property
+    def free(self):
+        """KB disponibles (0 si no queda ningún espacio en el anillo)"""
+        return self.capacity - self.used if self.count < self.slots else 0
+
+    def can_produce(self, kb):
+        """Indica si caben 'kb' KB más en el buffer y queda un espacio para el ítem"""
+        return self.count < self.slots and self.used + kb <= self.capacity
+
+    def produce(self, pid, kb):
+        """Agrega al final un ítem de 'kb' KB producido por 'pid'. Lanza OverflowError si no quedan espacios"""
+        count = self.count
+        if count == self.slots:
+            raise OverflowError("produce on a full SharedBuffer")
+        i = (self.head + count) % self.slots
+        self.pids[i] = pid
+        self.kbs[i] = kb
+        self.count = count + 1
+        used = self.used = self.used + kb
+        if used > self.high_water:
+            self.high_water = used
+
+    def push_front(self, pid, kb):
+        """Regresa un ítem (p. ej. el sobrante de un consumo parcial) al frente del buffer"""
+        if self.count == self.slots:
+            raise OverflowError("push_front on a full SharedBuffer")
+        self.head = i = (self.head - 1) % self.slots
+        self.pids[i] = pid
+        self.kbs[i] = kb
+        self.count += 1
+        self._add(kb)
+
+    def pop(self):
+        """Saca el primer ítem y retorna (pid, kb). Lanza IndexError si está vacío"""
+        count = self.count
+        if not count:
+            raise IndexError("pop from an empty SharedBuffer")
+        i = self.head
+        pids = self.pids
+        pid, kb = pids[i], self.kbs[i]
+        pids[i] = None  # No retener el PID
+        self.head = (i + 1) % self.slots
+        self.count = count - 1
+        # Un buffer vacío se deja exactamente en 0 para no acumular error de punto flotante
+        self.used = self.used - kb if count > 1 else 0
+        return pid, kb
+
+    def consume(self, kb):
+        """Consume 'kb' KB desde el frente; el exceso del último ítem regresa al frente"""
+        consumed = 0
+        pid = None
+        while consumed < kb and self.count:
+            pid, item_kb = self.pop()
+            consumed += item_kb
+        if consumed > kb:
+            # Regresa el exceso al buffer
+            self.push_front(pid, consumed - kb)
+            consumed = kb
+        return consumed
+
+    def discard_pids(self, pids):
+        """Elimina en una sola pasada los ítems producidos por los PIDs indicados"""
+        items = list(self)
+        kept = [item for item in items if item[0] not in pids]
+        if len(kept) != len(items):
+            self._allocate(kept)
+            self.used = sum(kb for _, kb in kept)
+
+    def clear(self):
+        """Vacía el buffer (la marca máxima se conserva)"""
+        self._allocate()
+        self.used = 0
+
+    def restore(self, items, used, high_water):
+        """Reemplaza el contenido por 'items' (PID, KB) con la ocupación guardada, p. ej. desde un checkpoint"""
+        if len(items) > self.slots:
+            raise ValueError(f"{len(items)} ítems no caben en un buffer de {self.slots} espacios")
+        self._allocate(items)
+        self.used = used
+        self.high_water = high_water
+
+    def _allocate(self, items=()):
+        """Crea el anillo vacío con sus espacios fijos y copia 'items' desde el índice 0"""
+        slots = self.slots
+        self.pids = [None] * slots
+        self.kbs = array("d", bytes(8 * slots))
+        self.head = 0
+        self.count = len(items)
+        for i, (pid, kb) in enumerate(items):
+            self.pids[i] = pid
+            self.kbs[i] = kb
+
+    def _add(self, kb):
+        self.used += kb
+        if self.used > self.high_water:
+            self.high_water = self.used
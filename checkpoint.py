@@ -0,0 +1,351 @@
+import gc
+import heapq
+import io
+import os
+from operator import attrgetter
+import pickle
+import struct
+import zlib
+from contextlib import contextmanager
+
+from process import Process, ProcessState, ProcessType
+from metrics import ProcessMetrics
+from queues import ReadyQueue
+
+# Formato: cabecera y luego cuadros (frames) uno tras otro. Cada cuadro es un checkpoint completo o
+# incremental (solo lo que cambió desde el anterior) comprimido con zlib.
+MAGIC = b"SCHEDCKP"
+VERSION = 2  # 2: huecos de memoria indexados en árboles (el estado de la versión 1 no es compatible)
+HEADER = struct.Struct("<8sH")
+FRAME = struct.Struct("<BIdQI")  # tipo, número de cuadro, tiempo simulado, despachos, bytes comprimidos
+FULL, DELTA = 0, 1
+
+# Secciones que se guardan enteras y solo se repiten en un cuadro incremental si cambiaron
+SECTIONS = ("settings", "clock", "rng", "queues", "buffer", "memory", "paging", "metrics", "processors", "position")
+
+PROCESS_FIELDS = ("pid", "state", "priority", "burst_time", "remaining_time", "memory", "in_memory", "type",
+                  "completion_time", "arrival_time", "affinity", "cpu")
+METRIC_FIELDS = ProcessMetrics.__slots__
+_process_values = attrgetter(*PROCESS_FIELDS)
+_metric_values = attrgetter(*METRIC_FIELDS)
+
+# Únicas clases que puede nombrar un checkpoint
+_ALLOWED = {("process", "ProcessState"): ProcessState, ("process", "ProcessType"): ProcessType}
+
+
+class _PlainUnpickler(pickle.Unpickler):
+    """Solo acepta datos simples (números, textos, tuplas, listas, diccionarios, conjuntos) y los estados y tipos"""
+
+    def find_class(self, module, name):
+        try:
+            return _ALLOWED[module, name]
+        except KeyError:
+            raise pickle.UnpicklingError(f"El checkpoint contiene un objeto no permitido: {module}.{name}") from None
+
+
+@contextmanager
+def _bulk():
+    """Pausa el recolector de ciclos: al crear cientos de miles de tuplas y procesos solo los frena"""
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def _dumps(value):
+    return pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def _loads(data):
+    return _PlainUnpickler(io.BytesIO(data)).load()
+
+
+def _process_record(process, timing, keyed, blocks):
+    """Tupla con los campos de un proceso (PROCESS_FIELDS), sus métricas, su lugar en una cola con clave y su bloque de memoria
+
+    El lugar es (cola, *clave de la entrada): (ronda, prioridad, secuencia) en
+    una cola de listos o (umbral, secuencia) en una de espera. Así las colas y
+    los bloques asignados se reconstruyen desde los procesos y un checkpoint
+    incremental no los repite.
+    """
+    queue = keyed.get(process.queue)
+    place = None if queue is None else (queue,) + tuple(process.queue.entries[process.pid][:-1])
+    return _process_values(process) + (None if timing is None else _metric_values(timing), place,
+                                       blocks.get(process.pid))
+
+
+def _keyed_queues(simulator):
+    """Colas cuyas entradas tienen clave, por nombre: la de listos, las de espera y las de cada CPU (por número)"""
+    blocked = simulator.blocked_queue
+    queues = {"ready": simulator.ready_queue, "buffer_space": blocked.buffer_space,
+              "buffer_data": blocked.buffer_data, "memory": blocked.memory}
+    if simulator.processors is not None:
+        queues.update((core.index, core.run_queue) for core in simulator.processors.cores)
+    return queues
+
+
+def capture(simulator, pids=None, position=None):
+    """Estado completo del simulador como secciones de datos simples
+
+    Con 'pids' la tabla de procesos solo trae esos PIDs (los que cambiaron);
+    los que ya no existen se listan en "removed". 'position' es el punto del
+    planificador en el que se tomó el checkpoint (None fuera de una corrida).
+    """
+    table = simulator.process_table
+    timings = simulator.metrics.processes
+    queues = _keyed_queues(simulator)
+    keyed = {queue: name for name, queue in queues.items()}
+    blocks = simulator.memory.blocks
+    if pids is None:
+        processes = [_process_record(p, timings.get(p.pid), keyed, blocks) for p in table.values()]
+        removed = []
+    else:
+        processes = [_process_record(table[pid], timings.get(pid), keyed, blocks) for pid in pids if pid in table]
+        removed = [pid for pid in pids if pid not in table]
+
+    engine = simulator.engine
+    events = [(when, seq, kind, (payload[0].index, payload[1]) if kind == "slice_end" else payload)
+              for when, seq, kind, payload in engine.events]
+    blocked = simulator.blocked_queue
+    metrics = {name: value for name, value in vars(simulator.metrics).items() if name != "processes"}
+    cpus = simulator.processors
+    buffer = simulator.buffer
+    paging = simulator.paging
+
+    return {
+        "settings": {
+            "algorithm": simulator.current_algorithm,
+            "quantum": simulator.time_quantum,
+            "buffer_size": simulator.buffer_size,
+            "memory_size": simulator.memory.total,
+            "memory_policy": simulator.memory.policy,
+            "cpus": len(cpus) if cpus else 1,
+            "balancing": cpus.balancing if cpus else None,
+            "paging": None if paging is None else {
+                "policy": paging.policy, "page_size": paging.page_size, "tlb_size": paging.tlb_size},
+            "arrivals": simulator.arrivals,
+            "pass_arrivals": simulator.pass_arrivals,
+            "trace_read": simulator.trace_read,
+        },
+        "clock": (engine.now, engine.sequence, engine.processed_events, events),
+        "rng": simulator.rng.getstate(),
+        "processes": processes,
+        "removed": removed,
+        # Contadores de las colas con clave (sus entradas van en cada proceso) y el orden de las demás
+        "queues": {
+            "sequences": {name: (getattr(queue, "round", None), queue.sequence) for name, queue in queues.items()},
+            "executing": [p.pid for p in simulator.executing_queue],
+            "external": [p.pid for p in blocked.external],
+        },
+        "buffer": (list(buffer), buffer.used, buffer.high_water),
+        "memory": {name: value for name, value in vars(simulator.memory).items() if name != "blocks"},
+        "paging": None if paging is None else paging.state(),
+        "metrics": metrics,
+        "processors": None if cpus is None else {
+            "idle": list(cpus.idle),
+            "running": cpus.running,
+            "migrations": cpus.migrations,
+            "steals": cpus.steals,
+            "cores": [(core.current.pid if core.current else None, core.busy_time, core.dispatches,
+                       core.migrations, core.steals) for core in cpus.cores],
+        },
+        "position": position,
+    }
+
+
+def _fill(queue, entries):
+    """Carga en una cola vacía sus entradas [clave..., proceso]"""
+    if isinstance(queue, ReadyQueue):
+        entries.sort(key=lambda entry: entry[2])  # La secuencia también es el orden de llegada
+        queue.arrivals.extend(entries)
+    for entry in entries:
+        queue.entries[entry[-1].pid] = entry
+        entry[-1].queue = queue
+    queue.heap = list(entries)
+    heapq.heapify(queue.heap)
+
+
+def apply(simulator, state):
+    """Carga un estado de capture() en un simulador recién creado con la misma configuración"""
+    with _bulk():
+        _apply(simulator, state)
+
+
+def _apply(simulator, state):
+    settings = state["settings"]
+    simulator.current_algorithm = settings["algorithm"]
+    simulator.time_quantum = settings["quantum"]
+    simulator.arrivals = settings["arrivals"]
+    simulator.pass_arrivals = settings["pass_arrivals"]
+    simulator.trace_read = settings["trace_read"]
+    simulator.rng.setstate(state["rng"])
+
+    table = simulator.process_table
+    timings = simulator.metrics.processes
+    members = {}  # Cola -> entradas de sus procesos
+    for (pid, process_state, priority, burst, remaining, memory, in_memory, process_type, completion,
+         arrival, affinity, cpu, timing, place, block) in state["processes"]:
+        process = Process(pid, priority, burst, memory, process_type, process_state, remaining, arrival, affinity)
+        process.in_memory = in_memory
+        process.completion_time = completion
+        process.cpu = cpu
+        table[pid] = process
+        if in_memory:
+            simulator.loaded_processes[pid] = process
+        if timing is not None:
+            record = timings[pid] = ProcessMetrics(timing[0])
+            for name, value in zip(METRIC_FIELDS, timing):
+                setattr(record, name, value)
+        if place is not None:
+            members.setdefault(place[0], []).append(list(place[1:]) + [process])
+        if block is not None:
+            simulator.memory.blocks[pid] = block
+
+    queues = _keyed_queues(simulator)
+    saved = state["queues"]
+    for name, queue in queues.items():
+        round_, queue.sequence = saved["sequences"][name]
+        if round_ is not None:
+            queue.round = round_
+        _fill(queue, members.get(name, []))
+    for pid in saved["executing"]:
+        simulator.executing_queue.append(table[pid])
+    for pid in saved["external"]:
+        simulator.blocked_queue.external.append(table[pid])
+
+    cpus = simulator.processors
+    if cpus is not None:
+        saved = state["processors"]
+        for core, (current, busy, dispatches, migrations, steals) in zip(cpus.cores, saved["cores"]):
+            core.current = None if current is None else table[current]
+            core.busy_time, core.dispatches, core.migrations, core.steals = busy, dispatches, migrations, steals
+        cpus.idle = {index: cpus.cores[index] for index in saved["idle"]}
+        cpus.running, cpus.migrations, cpus.steals = saved["running"], saved["migrations"], saved["steals"]
+
+    items, used, high_water = state["buffer"]
+    simulator.buffer.restore(items, used, high_water)
+    vars(simulator.memory).update(state["memory"])
+    if simulator.paging is not None and state.get("paging") is not None:  # Los archivos anteriores no la traen
+        simulator.paging.restore(state["paging"])
+    vars(simulator.metrics).update(state["metrics"])
+
+    engine = simulator.engine
+    engine.now, engine.sequence, engine.processed_events, events = state["clock"]
+    engine.events = [(when, seq, kind, (cpus.cores[payload[0]], payload[1]) if kind == "slice_end" else payload)
+                     for when, seq, kind, payload in events]
+    heapq.heapify(engine.events)
+
+
+class CheckpointWriter:
+    """Agrega checkpoints de un simulador a un archivo: uno completo cada 'full_every' y los demás incrementales
+
+    Un cuadro incremental trae solo los procesos que cambiaron y las secciones
+    cuyo contenido es distinto al del cuadro anterior, así que restaurar
+    cuesta a lo sumo un cuadro completo más 'full_every' - 1 incrementales.
+    Con append=True se sigue escribiendo al final de un archivo existente
+    (descartando un último cuadro incompleto, p. ej. por una caída).
+    """
+
+    def __init__(self, path, full_every=16, append=False):
+        if full_every < 1:
+            raise ValueError("full_every debe ser al menos 1")
+        self.path = path
+        self.full_every = full_every
+        self.frames = 0
+        self.sections = None  # Secciones serializadas del último cuadro, para detectar cambios
+        if append and os.path.exists(path):
+            found = frames(path)
+            end = found[-1][4] + found[-1][5] if found else HEADER.size
+            self.frames = found[-1][0] + 1 if found else 0
+            self.file = open(path, "r+b")
+            self.file.truncate(end)
+            self.file.seek(end)
+        else:
+            self.file = open(path, "wb")
+            self.file.write(HEADER.pack(MAGIC, VERSION))
+        self.file.flush()
+
+    def write(self, simulator, changed=None, position=None):
+        """Escribe un checkpoint. 'changed' son los PIDs modificados desde el anterior (None = cuadro completo)"""
+        full = changed is None or self.sections is None or self.frames % self.full_every == 0
+        with _bulk():
+            state = capture(simulator, None if full else changed, position)
+            sections = {name: _dumps(state[name]) for name in SECTIONS}
+            if full:
+                payload = dict(sections)
+            else:
+                payload = {name: data for name, data in sections.items() if self.sections[name] != data}
+                payload["removed"] = _dumps(state["removed"])
+            payload["processes"] = _dumps(state["processes"])
+            self.sections = sections
+            data = zlib.compress(_dumps(payload), 1)
+        self.file.write(FRAME.pack(DELTA if not full else FULL, self.frames, simulator.engine.now,
+                                   simulator.metrics.dispatches, len(data)))
+        self.file.write(data)
+        self.file.flush()
+        self.frames += 1
+        return self.frames - 1
+
+    def close(self):
+        if not self.file.closed:
+            self.file.close()
+
+
+def frames(path):
+    """Cuadros completos del archivo: (número, tipo, tiempo, despachos, posición de los datos, bytes)"""
+    found = []
+    with open(path, "rb") as f:
+        magic, version = HEADER.unpack(f.read(HEADER.size).ljust(HEADER.size, b"\0"))
+        if magic != MAGIC:
+            raise ValueError(f"{path} no es un archivo de checkpoints")
+        if version != VERSION:
+            raise ValueError(f"Versión de checkpoint no soportada: {version}")
+        size = os.fstat(f.fileno()).st_size
+        offset = HEADER.size
+        while offset + FRAME.size <= size:
+            f.seek(offset)
+            kind, index, now, dispatches, length = FRAME.unpack(f.read(FRAME.size))
+            start = offset + FRAME.size
+            if start + length > size:
+                break  # Cuadro a medio escribir
+            found.append((index, kind, now, dispatches, start, length))
+            offset = start + length
+    return found
+
+
+def load(path, frame=-1):
+    """Estado guardado en el cuadro 'frame' (posición en frames(path); -1 = el último)
+
+    Se parte del último cuadro completo anterior y se aplican los
+    incrementales hasta el pedido.
+    """
+    found = frames(path)
+    if not found:
+        raise ValueError(f"{path} no tiene checkpoints")
+    try:
+        target = found[frame]
+    except IndexError:
+        raise ValueError(f"No existe el cuadro {frame} (hay {len(found)})") from None
+    stop = found.index(target)
+    start = max(i for i in range(stop + 1) if found[i][1] == FULL)
+
+    state = {}
+    processes = {}
+    with open(path, "rb") as f, _bulk():
+        for _, kind, _, _, offset, length in found[start:stop + 1]:
+            f.seek(offset)
+            payload = _loads(zlib.decompress(f.read(length)))
+            for name in SECTIONS:
+                if name in payload:
+                    state[name] = payload[name]
+            for pid in _loads(payload["removed"]) if kind == DELTA else ():
+                processes.pop(pid, None)
+            for record in _loads(payload["processes"]):
+                processes[record[0]] = record
+
+    state = {name: _loads(data) for name, data in state.items()}
+    state["processes"] = list(processes.values())
+    return state
@@ -0,0 +1,589 @@
+import argparse
+import json
+from array import array
+import os
+import sys
+
+import batch_eval
+import benchmark
+import concurrency
+import event_trace
+import ingest
+import log_index
+import log_rotation
+import paging
+import metrics
+import sweep
+import workload
+from Menu_v2 import OperatingSystemSimulator
+from logger import LogLevel
+from memory_manager import POLICIES
+from smp import BALANCING
+
+ALGORITHM_ALIASES = {"fifo": "FIFO", "rr": "Round Robin", "round robin": "Round Robin"}
+
+
+def parse_algorithm(value):
+    """Convierte el nombre del algoritmo de la línea de comandos al nombre del simulador"""
+    try:
+        return ALGORITHM_ALIASES[value.strip().lower()]
+    except KeyError:
+        raise argparse.ArgumentTypeError(f"algoritmo desconocido: {value} (use fifo o rr)")
+
+
+def parse_log_level(value):
+    """Convierte el nivel de log de la línea de comandos (off, info o debug)"""
+    try:
+        return LogLevel.parse(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"nivel de log desconocido: {value} (use off, info o debug)")
+
+
+def parse_size(value):
+    """Convierte un tamaño de la línea de comandos ('64M', '1G' o bytes)"""
+    try:
+        return log_rotation.parse_size(value)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e))
+
+
+def log_options(args):
+    """Opciones de rotación del log para el constructor del simulador"""
+    return {
+        "log_rotate": args.log_rotate,
+        "log_rotate_lines": args.log_rotate_lines,
+        "log_compress": None if args.log_compress == "none" else args.log_compress,
+        "log_retention": args.log_retention,
+    }
+
+
+def parse_distribution(value):
+    """Convierte una distribución de la línea de comandos ('exp:5', 'pareto:1.5:2', ...)"""
+    try:
+        return workload.parse_distribution(value)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e))
+
+
+def parse_mix(value):
+    """Convierte una mezcla de tipos de la línea de comandos ('Normal=0.8,Productor=0.2')"""
+    try:
+        return workload.parse_mix(value)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e))
+
+
+def add_log_rotation_arguments(parser):
+    """Argumentos de rotación del log compartidos por run y resume"""
+    parser.add_argument("--log-rotate", type=parse_size, help="rota el log al llegar a ese tamaño (p. ej. 64M)")
+    parser.add_argument("--log-rotate-lines", type=int, help="rota el log cada tantas líneas")
+    parser.add_argument("--log-compress", choices=(*log_rotation.CODECS, "none"), default="gzip",
+                        help="compresión de los segmentos rotados (por defecto gzip)")
+    parser.add_argument("--log-retention", type=parse_size,
+                        help="espacio máximo de los segmentos rotados; se borran los más viejos (p. ej. 1G)")
+
+
+def paging_options(args):
+    """Opciones de memoria paginada para el constructor del simulador"""
+    return {"paging": args.paging, "page_size": args.page_size, "tlb_size": args.tlb_size}
+
+
+def add_paging_arguments(parser):
+    """Argumentos de memoria virtual paginada compartidos por run y compare (resume la toma del checkpoint)"""
+    parser.add_argument("--paging", choices=paging.REPLACEMENT,
+                        help="memoria virtual paginada por demanda con esa política de reemplazo")
+    parser.add_argument("--page-size", type=int, default=4, help="tamaño de página en KB (por defecto 4)")
+    parser.add_argument("--tlb-size", type=int, default=16, help="entradas de la TLB (por defecto 16)")
+
+
+def add_profile_arguments(parser):
+    """Argumentos del perfilador del planificador compartidos por run y resume"""
+    parser.add_argument("--profile", action="store_true",
+                        help="cronometra las fases del planificador e imprime el desglose en stderr")
+    parser.add_argument("--profile-output",
+                        help="exporta el perfil: .prof para cProfile, otra extensión para pilas colapsadas (flame graph)")
+
+
+def print_profile(simulator, args):
+    """Imprime en stderr el desglose por fase si la corrida se perfiló con --profile"""
+    if args.profile and simulator.profiler is not None:
+        print(simulator.profiler.table(), file=sys.stderr)
+
+
+def load_workload(path):
+    """Lee un archivo JSON con una lista de procesos o un objeto con la clave 'processes'
+
+    Las trazas CSV/JSONL no se leen aquí: quedan en la clave 'trace' y se
+    reproducen en streaming al construir el simulador.
+    """
+    if ingest.is_trace(path):
+        return {"trace": path}
+    with open(path, "r") as f:
+        data = json.load(f)
+    if isinstance(data, list):
+        data = {"processes": data}
+    return data
+
+
+def build_simulator(workload, args):
+    """Crea un simulador sin terminal y le agrega los procesos de la carga de trabajo"""
+    simulator = OperatingSystemSimulator(
+        interactive=False,
+        log_file=args.log_file,
+        buffer_size=args.buffer_size if args.buffer_size is not None else workload.get("buffer_size", 500),
+        memory_size=args.memory_size if args.memory_size is not None else workload.get("memory_size", 1024),
+        seed=args.seed,
+        log_level=args.log_level,
+        log_sim_time=args.log_sim_time,
+        memory_policy=args.memory_policy or workload.get("memory_policy", "first-fit"),
+        event_trace=args.event_trace,
+        cpus=args.cpus if args.cpus is not None else workload.get("cpus", 1),
+        balancing=args.balancing or workload.get("balancing", "steal"),
+        checkpoint=args.checkpoint,
+        checkpoint_every=args.checkpoint_every,
+        profile=args.profile,
+        profile_output=args.profile_output,
+        **paging_options(args),
+        **log_options(args),
+    )
+    simulator.add_workload(workload.get("processes", []))
+    if workload.get("trace"):
+        simulator.feed(ingest.load_trace(workload["trace"]))
+    return simulator
+
+
+def command_run(args):
+    """Subcomando 'run': ejecuta una carga de trabajo y escribe los resultados en JSON"""
+    try:
+        workload = load_workload(args.workload)
+        simulator = build_simulator(workload, args)
+        algorithm = args.algorithm or parse_algorithm(workload.get("algorithm", "fifo"))
+        quantum = args.quantum if args.quantum is not None else workload.get("quantum")
+        results = simulator.simulate(algorithm, quantum)
+        close(simulator)
+        print_profile(simulator, args)
+    except (OSError, ValueError, KeyError, TypeError, argparse.ArgumentTypeError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    return write_results(results, args)
+
+
+def command_resume(args):
+    """Subcomando 'resume': continúa una corrida desde un checkpoint (o la bifurca con otro algoritmo)"""
+    try:
+        trace = ingest.load_trace(args.trace) if args.trace else None
+        simulator = OperatingSystemSimulator.from_checkpoint(
+            args.checkpoint_file, args.frame, trace, log_file=args.log_file, log_level=args.log_level,
+            event_trace=args.event_trace, checkpoint=args.checkpoint, checkpoint_every=args.checkpoint_every,
+            profile=args.profile, profile_output=args.profile_output, **log_options(args))
+        results = simulator.resume(args.algorithm, args.quantum)
+        close(simulator)
+        print_profile(simulator, args)
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    return write_results(results, args)
+
+
+def close(simulator):
+    """Cierra la traza de eventos y el archivo de checkpoints de una corrida"""
+    if simulator.event_trace is not None:
+        simulator.event_trace.close()
+    if simulator.checkpoints is not None:
+        simulator.checkpoints.close()
+
+
+def write_results(results, args):
+    """Escribe los resultados de 'run' o 'resume' en JSON"""
+    if args.summary:
+        del results["processes"]
+    output = json.dumps(results, indent=2, ensure_ascii=False)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output + "\n")
+    else:
+        print(output)
+    return 0
+
+
+def command_eval(args):
+    """Subcomando 'eval': calcula los tiempos con el evaluador vectorizado, sin simular paso a paso"""
+    try:
+        workload = load_workload(args.workload)
+        algorithm = args.algorithm or parse_algorithm(workload.get("algorithm", "fifo"))
+        quantum = args.quantum if args.quantum is not None else workload.get("quantum", 2)
+        entries = ingest.load_trace(workload["trace"]) if workload.get("trace") else workload.get("processes", [])
+        # Columnas compactas: una traza se recorre una sola vez sin guardar las entradas
+        burst, priority, arrival, pids = array("d"), array("q"), array("d"), []
+        for entry in entries:
+            if entry.get("type", "Normal") != "Normal":
+                raise ValueError("El evaluador por lotes solo modela procesos Normales")
+            burst.append(entry["burst_time"])
+            priority.append(entry["priority"])
+            arrival.append(entry.get("arrival_time", 0))
+            if not args.summary:
+                pids.append(entry.get("pid", str(len(burst) - 1)))
+        schedule = batch_eval.evaluate(algorithm, burst, priority, quantum, arrival)
+    except (OSError, ValueError, KeyError, TypeError, ImportError, argparse.ArgumentTypeError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+    results = {"algorithm": algorithm, "quantum": quantum, **batch_eval.summary(schedule)}
+    if not args.summary:
+        results["processes"] = [
+            {
+                "pid": pid,
+                "completion_time": float(schedule["completion"][i]),
+                "waiting_time": float(schedule["waiting"][i]),
+                "turnaround_time": float(schedule["turnaround"][i]),
+            }
+            for i, pid in enumerate(pids)
+        ]
+    output = json.dumps(results, indent=2, ensure_ascii=False)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output + "\n")
+    else:
+        print(output)
+    return 0
+
+
+def command_compare(args):
+    """Subcomando 'compare': corre la misma carga con FIFO y Round Robin y compara sus métricas"""
+    try:
+        workload = load_workload(args.workload)
+        quantum = args.quantum if args.quantum is not None else workload.get("quantum")
+        summaries = {}
+        for algorithm in ("FIFO", "Round Robin"):
+            simulator = build_simulator(workload, args)  # Misma semilla: misma carga en ambas corridas
+            summaries[algorithm] = simulator.simulate(algorithm, quantum)["metrics"]
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(json.dumps(summaries, indent=2, ensure_ascii=False) + "\n")
+    else:
+        print(metrics.comparison_table(summaries))
+    return 0
+
+
+def command_sweep(args):
+    """Subcomando 'sweep': corre en paralelo todas las combinaciones de parámetros y junta los resultados"""
+    try:
+        workload = load_workload(args.workload)
+        algorithms = [parse_algorithm(name) for name in args.algorithms.split(",")]
+        configs = sweep.grid(
+            algorithms,
+            sweep.parse_range(args.quantum),
+            sweep.parse_range(args.buffer_size) if args.buffer_size else [workload.get("buffer_size", 500)],
+            sweep.parse_range(args.memory_size) if args.memory_size else [workload.get("memory_size", 1024)],
+            repeats=args.repeats,
+            seed=args.seed,
+            cpus=sweep.parse_range(args.cpus) if args.cpus else [workload.get("cpus", 1)],
+        )
+        rows = sweep.run_sweep(workload, configs, workers=args.jobs)
+    except (OSError, ValueError, KeyError, TypeError, argparse.ArgumentTypeError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+    if args.output and args.output.endswith(".csv"):
+        sweep.write_csv(rows, args.output)
+    elif args.output:
+        with open(args.output, "w") as f:
+            f.write(json.dumps(rows, indent=2, ensure_ascii=False) + "\n")
+    else:
+        print(sweep.format_table(rows))
+    return 0
+
+
+def command_bench(args):
+    """Subcomando 'bench': mide los planificadores con cargas sintéticas y compara contra una corrida anterior"""
+    def progress(result):
+        print(f"{result['algorithm']:>11} {result['size']:>9} procesos: {result['seconds']:.2f}s, "
+              f"{result['events_per_second']:.0f} eventos/s", file=sys.stderr)
+
+    try:
+        sizes = sweep.parse_range(args.sizes)
+        algorithms = [parse_algorithm(name) for name in args.algorithms.split(",")]
+        baseline = benchmark.load(args.baseline) if args.baseline else None
+        report = benchmark.run_suite(sizes, algorithms, args.quantum, seed=args.seed,
+                                     track_memory=not args.no_memory, repeats=args.repeats, progress=progress)
+    except (OSError, ValueError, KeyError, TypeError, argparse.ArgumentTypeError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+    output = json.dumps(report, indent=2, ensure_ascii=False)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output + "\n")
+    else:
+        print(output)
+
+    if baseline is not None:
+        regressions = benchmark.compare(baseline, report, args.tolerance)
+        for reg in regressions:
+            print(f"REGRESIÓN {reg['algorithm']} {reg['size']} procesos: {reg['metric']} "
+                  f"{reg['baseline']:.0f} -> {reg['current']:.0f} ({reg['change']:+.1%})", file=sys.stderr)
+        if regressions:
+            return 1
+    return 0
+
+
+def command_threads(args):
+    """Subcomando 'threads': compara estrategias de sincronización con hilos productores y consumidores reales"""
+    try:
+        workload = load_workload(args.workload) if args.workload else {}
+        if workload.get("trace"):
+            raise ValueError("El modo concurrente necesita un archivo JSON de procesos, no una traza")
+        strategies = [name.strip() for name in args.strategies.split(",")]
+        producers, consumers = args.producers, args.consumers
+        if not workload and producers is None:
+            producers = 4
+        if not workload and consumers is None:
+            consumers = 4
+        reports = {}
+        for strategy in strategies:
+            simulator = OperatingSystemSimulator(
+                interactive=False,
+                log_file=os.devnull,
+                buffer_size=args.capacity or workload.get("buffer_size", 500),
+                log_level=LogLevel.OFF,
+                seed=args.seed,
+            )
+            simulator.add_workload(workload.get("processes", []))
+            reports[strategy] = simulator.run_concurrent(strategy, producers, consumers, args.items,
+                                                         args.work_us / 1e6)
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(json.dumps(reports, indent=2, ensure_ascii=False) + "\n")
+    else:
+        print(concurrency.comparison_table(reports))
+    return 0
+
+
+def command_trace(args):
+    """Subcomando 'trace': resume, dibuja o reproduce una traza binaria de eventos"""
+    try:
+        trace = event_trace.EventTrace(args.trace)
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+    with trace:
+        try:
+            if args.at is not None:
+                states = trace.state_at(args.at)
+                print(f"Estado en t={args.at}: {len(states)} procesos")
+                for pid, label in states.items():
+                    print(f"  {pid}: {label}")
+            elif args.gantt:
+                print(event_trace.render_gantt(trace, args.width, args.start, args.end, args.rows))
+            else:
+                print(json.dumps(trace.summary(), indent=2, ensure_ascii=False))
+        except ImportError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            return 1
+    return 0
+
+
+def command_logs(args):
+    """Subcomando 'logs': muestra las últimas líneas del log y sus segmentos rotados, con filtros"""
+    try:
+        filters = log_index.parse_filter(" ".join(args.filter))
+        viewer = log_rotation.LogHistory(args.log_file)
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+    with viewer:
+        try:
+            before = viewer.parse_position(args.before) if args.before is not None else None
+        except ValueError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            return 1
+        for position, text in viewer.select(args.lines, before, **filters):
+            print(f"{viewer.label(position)}: {text}" if args.numbers else text)
+    return 0
+
+
+def command_generate(args):
+    """Subcomando 'generate': crea una carga sintética reproducible y la guarda como traza CSV"""
+    try:
+        generator = workload.WorkloadGenerator(args.seed, burst=args.burst, memory=args.memory,
+                                               priority=args.priority, arrival=args.arrival, mix=args.mix,
+                                               max_burst=args.max_burst)
+        table = generator.columns(args.count)
+        if args.output:
+            workload.write_trace(table, args.output)
+    except (OSError, ValueError, ImportError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    print(json.dumps(generator.summary(table), indent=2, ensure_ascii=False))
+    return 0
+
+
+def build_parser():
+    """Construye el analizador de argumentos de la línea de comandos"""
+    parser = argparse.ArgumentParser(description="Simulador de planificación FIFO y Round Robin sin terminal interactiva")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run = subparsers.add_parser("run", help="ejecuta una carga de trabajo y reporta los resultados")
+    run.add_argument("workload", help="archivo JSON con los procesos a simular, o traza CSV/JSONL (.gz) con llegadas")
+    run.add_argument("-a", "--algorithm", type=parse_algorithm, help="fifo o rr (por defecto el del archivo o fifo)")
+    run.add_argument("-q", "--quantum", type=int, help="quantum de Round Robin en segundos")
+    run.add_argument("--buffer-size", type=int,
+                     help="tamaño del buffer productor-consumidor en KB; también limita los ítems a uno por KB")
+    run.add_argument("--memory-size", type=int, help="memoria total simulada en KB")
+    run.add_argument("--memory-policy", choices=POLICIES,
+                     help="política de asignación de memoria (por defecto la del archivo o first-fit)")
+    run.add_argument("--cpus", type=int, help="CPUs simulados, cada uno con su cola (por defecto el del archivo o 1)")
+    run.add_argument("--balancing", choices=BALANCING, help="balanceo de carga entre CPUs (por defecto steal)")
+    run.add_argument("--seed", type=int, help="semilla para los valores aleatorios no especificados")
+    run.add_argument("--log-file", default="system_log.txt", help="archivo de logs de la corrida")
+    run.add_argument("--log-level", type=parse_log_level, default=LogLevel.INFO,
+                     help="off, info o debug (debug registra cada despacho; por defecto info)")
+    run.add_argument("--log-sim-time", action="store_true", help="marca los logs con el tiempo simulado")
+    add_log_rotation_arguments(run)
+    add_paging_arguments(run)
+    add_profile_arguments(run)
+    run.add_argument("--summary", action="store_true", help="omite el detalle por proceso en los resultados")
+    run.add_argument("--event-trace", help="archivo binario donde registrar los eventos de planificación")
+    run.add_argument("--checkpoint", help="archivo donde guardar checkpoints periódicos de la corrida")
+    run.add_argument("--checkpoint-every", type=int, default=5000, help="despachos entre checkpoints (por defecto 5000)")
+    run.add_argument("-o", "--output", help="archivo donde guardar los resultados (por defecto stdout)")
+    run.set_defaults(func=command_run)
+
+    resume = subparsers.add_parser("resume", help="continúa una corrida desde un checkpoint")
+    resume.add_argument("checkpoint_file", help="archivo de checkpoints de 'run --checkpoint'")
+    resume.add_argument("--frame", type=int, default=-1, help="cuadro desde el que retomar (por defecto el último)")
+    resume.add_argument("-a", "--algorithm", type=parse_algorithm, help="fifo o rr: otro algoritmo bifurca la corrida")
+    resume.add_argument("-q", "--quantum", type=int, help="quantum de Round Robin en segundos")
+    resume.add_argument("--trace", help="traza CSV/JSONL que se reproducía, si la corrida venía de una")
+    resume.add_argument("--log-file", default="system_log.txt", help="archivo de logs de la corrida")
+    resume.add_argument("--log-level", type=parse_log_level, default=LogLevel.INFO, help="off, info o debug")
+    add_log_rotation_arguments(resume)
+    add_profile_arguments(resume)
+    resume.add_argument("--event-trace", help="archivo binario donde registrar los eventos de planificación")
+    resume.add_argument("--checkpoint", help="archivo donde seguir guardando checkpoints (el mismo agrega al final)")
+    resume.add_argument("--checkpoint-every", type=int, default=5000, help="despachos entre checkpoints (por defecto 5000)")
+    resume.add_argument("--summary", action="store_true", help="omite el detalle por proceso en los resultados")
+    resume.add_argument("-o", "--output", help="archivo donde guardar los resultados (por defecto stdout)")
+    resume.set_defaults(func=command_resume)
+
+    evaluate = subparsers.add_parser("eval", help="calcula los tiempos de procesos Normales con NumPy, sin simular")
+    evaluate.add_argument("workload", help="archivo JSON o traza CSV/JSONL con los procesos a evaluar (burst_time obligatorio)")
+    evaluate.add_argument("-a", "--algorithm", type=parse_algorithm, help="fifo o rr (por defecto el del archivo o fifo)")
+    evaluate.add_argument("-q", "--quantum", type=int, help="quantum de Round Robin en segundos")
+    evaluate.add_argument("--summary", action="store_true", help="solo los promedios, sin el detalle por proceso")
+    evaluate.add_argument("-o", "--output", help="archivo donde guardar los resultados (por defecto stdout)")
+    evaluate.set_defaults(func=command_eval)
+
+    compare = subparsers.add_parser("compare", help="compara las métricas de FIFO y Round Robin sobre la misma carga")
+    compare.add_argument("workload", help="archivo JSON con los procesos a simular")
+    compare.add_argument("-q", "--quantum", type=int, help="quantum de Round Robin en segundos")
+    compare.add_argument("--buffer-size", type=int,
+                         help="tamaño del buffer productor-consumidor en KB; también limita los ítems a uno por KB")
+    compare.add_argument("--memory-size", type=int, help="memoria total simulada en KB")
+    compare.add_argument("--memory-policy", choices=POLICIES, help="política de asignación de memoria")
+    compare.add_argument("--cpus", type=int, help="CPUs simulados (por defecto el del archivo o 1)")
+    compare.add_argument("--balancing", choices=BALANCING, help="balanceo de carga entre CPUs (por defecto steal)")
+    compare.add_argument("--seed", type=int, default=0, help="semilla para los valores aleatorios no especificados")
+    compare.add_argument("-o", "--output", help="archivo JSON con las métricas de ambas corridas (por defecto la tabla)")
+    add_paging_arguments(compare)
+    compare.set_defaults(func=command_compare, log_file=os.devnull, log_level=LogLevel.OFF, log_sim_time=False,
+                         event_trace=None, checkpoint=None, checkpoint_every=5000, log_rotate=None,
+                         log_rotate_lines=None, log_compress="gzip", log_retention=None, profile=False,
+                         profile_output=None)
+
+    sweeper = subparsers.add_parser("sweep", help="barre combinaciones de algoritmo, quantum, buffer y memoria en paralelo")
+    sweeper.add_argument("workload", help="archivo JSON con los procesos a simular")
+    sweeper.add_argument("-a", "--algorithms", default="fifo,rr", help="algoritmos separados por comas (por defecto fifo,rr)")
+    sweeper.add_argument("-q", "--quantum", default="2", help="quantums de Round Robin: lista (1,2,4) o rango inicio:fin[:paso]")
+    sweeper.add_argument("--buffer-size",
+                         help="tamaños de buffer en KB, que limitan los ítems a uno por KB "
+                              "(lista o rango; por defecto el del archivo)")
+    sweeper.add_argument("--memory-size", help="tamaños de memoria en KB (lista o rango; por defecto el del archivo)")
+    sweeper.add_argument("--cpus", help="cantidades de CPUs (lista o rango; por defecto el del archivo o 1)")
+    sweeper.add_argument("--repeats", type=int, default=1, help="repeticiones por configuración con semillas seed, seed+1, ...")
+    sweeper.add_argument("--seed", type=int, default=0, help="semilla base de las repeticiones")
+    sweeper.add_argument("-j", "--jobs", type=int, help="procesos en paralelo (por defecto todos los núcleos)")
+    sweeper.add_argument("-o", "--output", help="archivo .csv o .json con la tabla (por defecto se imprime)")
+    sweeper.set_defaults(func=command_sweep)
+
+    bench = subparsers.add_parser("bench", help="mide el rendimiento de los planificadores con cargas sintéticas")
+    bench.add_argument("--sizes", default=",".join(str(size) for size in benchmark.SIZES),
+                       help="cantidades de procesos (lista o rango; por defecto 1k, 10k, 100k y 1M)")
+    bench.add_argument("-a", "--algorithms", default="fifo,rr", help="algoritmos separados por comas (por defecto fifo,rr)")
+    bench.add_argument("-q", "--quantum", type=int, default=2, help="quantum de Round Robin en segundos")
+    bench.add_argument("--seed", type=int, default=0, help="semilla de las cargas sintéticas")
+    bench.add_argument("--repeats", type=int, default=3, help="corridas por caso; se conserva la más rápida (por defecto 3)")
+    bench.add_argument("--no-memory", action="store_true", help="omite la segunda corrida que mide la memoria pico")
+    bench.add_argument("--baseline", help="resultados anteriores (JSON) contra los que buscar regresiones")
+    bench.add_argument("--tolerance", type=float, default=0.10, help="empeoramiento tolerado antes de reportar (0.10 = 10%%)")
+    bench.add_argument("-o", "--output", help="archivo JSON donde guardar los resultados (por defecto stdout)")
+    bench.set_defaults(func=command_bench)
+
+    threads = subparsers.add_parser("threads", help="compara semáforos, Condition y cola sin locks con hilos reales")
+    threads.add_argument("workload", nargs="?",
+                         help="archivo JSON cuyos procesos Productor/Consumidor serán los hilos (opcional)")
+    threads.add_argument("-s", "--strategies", default=",".join(concurrency.STRATEGIES),
+                         help="estrategias separadas por comas (por defecto semaphore,condition,lockfree)")
+    threads.add_argument("-p", "--producers", type=int, help="hilos productores sintéticos (por defecto 4 sin archivo)")
+    threads.add_argument("-c", "--consumers", type=int, help="hilos consumidores (por defecto 4 sin archivo)")
+    threads.add_argument("-n", "--items", type=int, default=1000, help="ítems por productor sintético (por defecto 1000)")
+    threads.add_argument("--capacity", type=int, help="espacios del buffer (por defecto el buffer_size del archivo o 500)")
+    threads.add_argument("--work-us", type=float, default=0.0, help="microsegundos de cómputo por ítem producido o consumido")
+    threads.add_argument("--seed", type=int, help="semilla para los valores aleatorios no especificados")
+    threads.add_argument("-o", "--output", help="archivo JSON con las métricas (por defecto la tabla)")
+    threads.set_defaults(func=command_threads)
+
+    tracer = subparsers.add_parser("trace", help="analiza una traza binaria de eventos (run --event-trace)")
+    tracer.add_argument("trace", help="archivo de traza binaria")
+    tracer.add_argument("--gantt", action="store_true", help="dibuja un diagrama de Gantt en texto")
+    tracer.add_argument("--width", type=int, default=80, help="columnas del diagrama (por defecto 80)")
+    tracer.add_argument("--start", type=float, help="inicio de la ventana de tiempo del diagrama")
+    tracer.add_argument("--end", type=float, help="fin de la ventana de tiempo del diagrama")
+    tracer.add_argument("--rows", type=int, default=20, help="procesos a dibujar como máximo (por defecto 20)")
+    tracer.add_argument("--at", type=float, help="muestra el estado de cada proceso en ese instante")
+    tracer.set_defaults(func=command_trace)
+
+    logs = subparsers.add_parser("logs", help="muestra las últimas líneas del log (y sus segmentos rotados) con filtros")
+    logs.add_argument("--log-file", default="system_log.txt", help="archivo de log (por defecto system_log.txt)")
+    logs.add_argument("filter", nargs="*", help="filtros clave=valor: pid=ab12 evento=terminación desde=10 hasta=20")
+    logs.add_argument("-n", "--lines", type=int, default=20, help="líneas a mostrar (por defecto 20)")
+    logs.add_argument("--before",
+                      help="muestra las líneas anteriores a esa posición (línea o segmento:línea, como las de --numbers)")
+    logs.add_argument("--numbers", action="store_true", help="antepone la posición de cada línea (segmento:línea)")
+    logs.set_defaults(func=command_logs)
+
+    generate = subparsers.add_parser("generate", help="genera una carga sintética reproducible con distribuciones configurables")
+    generate.add_argument("count", type=int, help="cantidad de procesos")
+    generate.add_argument("--seed", type=int, default=0, help="semilla del generador (por defecto 0)")
+    generate.add_argument("--burst", type=parse_distribution,
+                          help="ráfagas: uniform:1:15 (por defecto), exp:MEDIA, pareto:ÍNDICE:MÍNIMO o bimodal:CORTA:LARGA:PROPORCIÓN")
+    generate.add_argument("--max-burst", type=int, help="ráfaga máxima (acota la cola de pareto)")
+    generate.add_argument("--memory", type=parse_distribution, help="memoria en KB (por defecto uniform:64:256)")
+    generate.add_argument("--priority", type=parse_distribution, help="prioridades de 1 a 10 (por defecto uniform:1:10)")
+    generate.add_argument("--arrival", type=parse_distribution,
+                          help="llegadas, p. ej. poisson:50 (procesos por segundo); por defecto todos en t=0")
+    generate.add_argument("--mix", type=parse_mix,
+                          help="proporción de cada tipo (por defecto Normal=0.8,Productor=0.1,Consumidor=0.1)")
+    generate.add_argument("-o", "--output", help="traza CSV (.csv o .csv.gz) para run, eval o sweep; sin ella solo se resume")
+    generate.set_defaults(func=command_generate)
+
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
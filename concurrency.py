@@ -0,0 +1,273 @@
+import threading
+import time
+from collections import deque
+
+import metrics
+
+
+class ThreadStats:
+    """Contadores de sincronización de un hilo (cada hilo tiene los suyos: no se comparten)"""
+
+    __slots__ = ("items", "waits", "blocked_time", "acquisitions", "contended", "lock_wait")
+
+    def __init__(self):
+        self.items = 0
+        self.waits = 0            # Veces que tuvo que esperar espacio (productor) o datos (consumidor)
+        self.blocked_time = 0.0   # Segundos esperando espacio o datos
+        self.acquisitions = 0     # Adquisiciones del lock/mutex del buffer
+        self.contended = 0        # Adquisiciones que encontraron el lock tomado
+        self.lock_wait = 0.0      # Segundos esperando el lock
+
+    def add(self, other):
+        for name in self.__slots__:
+            setattr(self, name, getattr(self, name) + getattr(other, name))
+
+
+def _acquire(primitive, stats):
+    """Toma un lock/mutex contando si estaba ocupado y cuánto se esperó"""
+    stats.acquisitions += 1
+    if primitive.acquire(blocking=False):
+        return
+    stats.contended += 1
+    start = time.perf_counter()
+    primitive.acquire()
+    stats.lock_wait += time.perf_counter() - start
+
+
+def _wait(semaphore, stats):
+    """Baja un semáforo de espacios o de ítems midiendo el tiempo bloqueado"""
+    if semaphore.acquire(blocking=False):
+        return
+    stats.waits += 1
+    start = time.perf_counter()
+    semaphore.acquire()
+    stats.blocked_time += time.perf_counter() - start
+
+
+class SemaphoreBuffer:
+    """Buffer acotado clásico: semáforos de espacios vacíos y llenos más un mutex
+
+    Puede recibir los semáforos existentes del simulador; deben estar en su
+    estado inicial (mutex en 1, empty en la capacidad, full en 0).
+    """
+
+    def __init__(self, capacity, mutex=None, empty=None, full=None):
+        self.capacity = capacity
+        self.items = deque()
+        self.mutex = mutex or threading.Semaphore(1)
+        self.empty = empty or threading.Semaphore(capacity)
+        self.full = full or threading.Semaphore(0)
+
+    def put(self, item, stats):
+        _wait(self.empty, stats)
+        _acquire(self.mutex, stats)
+        self.items.append(item)
+        self.mutex.release()
+        self.full.release()
+
+    def get(self, stats):
+        _wait(self.full, stats)
+        _acquire(self.mutex, stats)
+        item = self.items.popleft()
+        self.mutex.release()
+        self.empty.release()
+        return item
+
+
+class ConditionBuffer:
+    """Buffer acotado con un lock y dos variables de condición (no lleno / no vacío)"""
+
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self.items = deque()
+        self.lock = threading.Lock()
+        self.not_full = threading.Condition(self.lock)
+        self.not_empty = threading.Condition(self.lock)
+
+    def put(self, item, stats):
+        _acquire(self.lock, stats)
+        try:
+            if len(self.items) >= self.capacity:
+                stats.waits += 1
+                start = time.perf_counter()
+                while len(self.items) >= self.capacity:
+                    self.not_full.wait()
+                stats.blocked_time += time.perf_counter() - start
+            self.items.append(item)
+            self.not_empty.notify()
+        finally:
+            self.lock.release()
+
+    def get(self, stats):
+        _acquire(self.lock, stats)
+        try:
+            if not self.items:
+                stats.waits += 1
+                start = time.perf_counter()
+                while not self.items:
+                    self.not_empty.wait()
+                stats.blocked_time += time.perf_counter() - start
+            item = self.items.popleft()
+            self.not_full.notify()
+            return item
+        finally:
+            self.lock.release()
+
+
+class LockFreeBuffer:
+    """Buffer sin locks sobre deque: append y popleft son atómicos en CPython
+
+    Las esperas por espacio o datos giran con retroceso exponencial en lugar de
+    dormir en un semáforo. La capacidad es aproximada: entre la consulta y el
+    append otro productor puede agregar, así que puede excederse en a lo sumo
+    (productores - 1) ítems.
+    """
+
+    MAX_BACKOFF = 0.001
+
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self.items = deque()
+
+    def put(self, item, stats):
+        if len(self.items) >= self.capacity:
+            stats.waits += 1
+            start = time.perf_counter()
+            delay = 0.0
+            while len(self.items) >= self.capacity:
+                time.sleep(delay)
+                delay = min(self.MAX_BACKOFF, delay * 2 or 1e-6)
+            stats.blocked_time += time.perf_counter() - start
+        self.items.append(item)
+
+    def get(self, stats):
+        try:
+            return self.items.popleft()
+        except IndexError:
+            pass
+        stats.waits += 1
+        start = time.perf_counter()
+        delay = 0.0
+        while True:
+            time.sleep(delay)
+            try:
+                item = self.items.popleft()
+            except IndexError:
+                delay = min(self.MAX_BACKOFF, delay * 2 or 1e-6)
+                continue
+            stats.blocked_time += time.perf_counter() - start
+            return item
+
+
+STRATEGIES = {"semaphore": SemaphoreBuffer, "condition": ConditionBuffer, "lockfree": LockFreeBuffer}
+
+
+def _busy(seconds):
+    """Trabajo de CPU simulado fuera de la sección crítica (retiene el GIL como un cómputo real)"""
+    if seconds > 0:
+        end = time.perf_counter() + seconds
+        while time.perf_counter() < end:
+            pass
+
+
+def run(buffer, producers, consumers, work=0.0):
+    """Corre hilos productores y consumidores reales contra 'buffer' y retorna sus métricas
+
+    'producers' es una lista de (pid, ítems, KB por ítem): un hilo por
+    productor. Se lanzan 'consumers' hilos consumidores que terminan al recibir
+    una marca de fin cuando todos los productores acabaron, así que el buffer (y
+    sus semáforos) quedan como al principio. 'work' son segundos de cómputo por
+    ítem, tanto al producir como al consumir.
+    """
+    if consumers < 1:
+        raise ValueError("Debe haber al menos un hilo consumidor")
+    producer_stats = [ThreadStats() for _ in producers]
+    consumer_stats = [ThreadStats() for _ in range(consumers)]
+    consumed_kb = [0.0] * consumers
+    start_line = threading.Barrier(len(producers) + consumers + 1)
+
+    def produce(pid, items, kb, stats):
+        start_line.wait()
+        for _ in range(items):
+            _busy(work)
+            buffer.put((pid, kb), stats)
+            stats.items += 1
+
+    def consume(index, stats):
+        start_line.wait()
+        while True:
+            item = buffer.get(stats)
+            if item is None:
+                return
+            consumed_kb[index] += item[1]
+            stats.items += 1
+            _busy(work)
+
+    threads = [threading.Thread(target=produce, args=(pid, items, kb, stats), name=f"productor-{pid}", daemon=True)
+               for (pid, items, kb), stats in zip(producers, producer_stats)]
+    consumer_threads = [threading.Thread(target=consume, args=(i, stats), name=f"consumidor-{i}", daemon=True)
+                        for i, stats in enumerate(consumer_stats)]
+    for thread in threads + consumer_threads:
+        thread.start()
+
+    start_line.wait()
+    start = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    done = ThreadStats()
+    for _ in consumer_threads:
+        buffer.put(None, done)  # Una marca de fin por consumidor
+    for thread in consumer_threads:
+        thread.join()
+    seconds = time.perf_counter() - start
+
+    return report(type(buffer).__name__, producer_stats, consumer_stats, seconds, sum(consumed_kb))
+
+
+def report(name, producer_stats, consumer_stats, seconds, kb):
+    """Resume las métricas por rol en un diccionario serializable"""
+    produced, consumed = ThreadStats(), ThreadStats()
+    for stats in producer_stats:
+        produced.add(stats)
+    for stats in consumer_stats:
+        consumed.add(stats)
+    threads = len(producer_stats) + len(consumer_stats)
+    acquisitions = produced.acquisitions + consumed.acquisitions
+    contended = produced.contended + consumed.contended
+    return {
+        "buffer": name,
+        "producers": len(producer_stats),
+        "consumers": len(consumer_stats),
+        "items": consumed.items,
+        "kb": kb,
+        "seconds": seconds,
+        "throughput": consumed.items / seconds if seconds else 0.0,
+        "producer_waits": produced.waits,
+        "producer_blocked_time": produced.blocked_time,
+        "consumer_waits": consumed.waits,
+        "consumer_blocked_time": consumed.blocked_time,
+        # Fracción del tiempo de todos los hilos que se pasó bloqueado (esperas más lock)
+        "blocked_fraction": ((produced.blocked_time + consumed.blocked_time + produced.lock_wait + consumed.lock_wait)
+                             / (threads * seconds) if seconds else 0.0),
+        "lock_acquisitions": acquisitions,
+        "lock_contention": contended / acquisitions if acquisitions else 0.0,
+        "lock_wait_time": produced.lock_wait + consumed.lock_wait,
+    }
+
+
+# Columnas de la tabla comparativa, con su etiqueta
+COMPARISON_ROWS = (
+    ("items", "Ítems transferidos"),
+    ("seconds", "Tiempo real (s)"),
+    ("throughput", "Ítems por segundo"),
+    ("producer_blocked_time", "Productores bloqueados (s)"),
+    ("consumer_blocked_time", "Consumidores bloqueados (s)"),
+    ("blocked_fraction", "Fracción bloqueada"),
+    ("lock_contention", "Contención del lock"),
+    ("lock_wait_time", "Espera por el lock (s)"),
+)
+
+
+def comparison_table(reports):
+    """Tabla de texto con una columna por estrategia, p. ej. {"semaphore": ..., "condition": ...}"""
+    return metrics.comparison_table(reports, COMPARISON_ROWS, decimals=4)
@@ -0,0 +1,90 @@
+import heapq
+import time
+
+
+class SimulationEngine:
+    """Motor de eventos discretos con reloj virtual para los planificadores"""
+
+    def __init__(self, playback_speed=None):
+        # Reloj simulado (segundos virtuales desde el inicio)
+        self.now = 0.0
+
+        # Velocidad de reproducción: None o 0 avanza al instante,
+        # 1.0 equivale a tiempo real, 2.0 al doble de velocidad, etc.
+        self.playback_speed = playback_speed
+
+        # Cola de eventos: tuplas (tiempo, secuencia, tipo, datos)
+        self.events = []
+        self.handlers = {}
+        self.sequence = 0
+        self.processed_events = 0
+
+    def on(self, kind, handler):
+        """Registra la función que atiende un tipo de evento"""
+        self.handlers[kind] = handler
+
+    def schedule(self, delay, kind, payload=None):
+        """Programa un evento dentro de 'delay' segundos simulados"""
+        return self.schedule_at(self.now + max(delay, 0), kind, payload)
+
+    def schedule_at(self, when, kind, payload=None):
+        """Programa un evento en un instante absoluto del reloj simulado"""
+        event = (max(when, self.now), self.sequence, kind, payload)
+        self.sequence += 1
+        heapq.heappush(self.events, event)
+        return event
+
+    def peek_time(self):
+        """Instante del próximo evento pendiente, o None si no hay eventos"""
+        return self.events[0][0] if self.events else None
+
+    def advance(self, delta):
+        """Avanza el reloj 'delta' segundos atendiendo los eventos vencidos en orden"""
+        target = self.now + max(delta, 0)
+        start = self.now
+        while self.events and self.events[0][0] <= target:
+            self._fire(heapq.heappop(self.events))
+        self.now = target
+        self._pace(target - start)
+
+    def run(self, until=None):
+        """Atiende eventos hasta vaciar la cola o alcanzar el instante 'until'"""
+        while self.events and (until is None or self.events[0][0] <= until):
+            event = heapq.heappop(self.events)
+            start = self.now
+            self._fire(event)
+            self._pace(self.now - start)
+        if until is not None and until > self.now:
+            self._pace(until - self.now)
+            self.now = until
+
+    def step(self):
+        """Atiende un único evento. Retorna False si la cola está vacía"""
+        if not self.events:
+            return False
+        event = heapq.heappop(self.events)
+        start = self.now
+        self._fire(event)
+        self._pace(self.now - start)
+        return True
+
+    def reset(self):
+        """Reinicia el reloj y descarta los eventos pendientes"""
+        self.now = 0.0
+        self.events.clear()
+        self.sequence = 0
+        self.processed_events = 0
+
+    def _fire(self, event):
+        """Mueve el reloj al instante del evento y ejecuta su manejador"""
+        when, _, kind, payload = event
+        self.now = when
+        self.processed_events += 1
+        handler = self.handlers.get(kind)
+        if handler is not None:
+            handler(payload)
+
+    def _pace(self, simulated_seconds):
+        """Espera en tiempo real solo si se configuró una velocidad de reproducción"""
+        if self.playback_speed and simulated_seconds > 0:
+            time.sleep(simulated_seconds / self.playback_speed)
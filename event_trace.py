@@ -0,0 +1,264 @@
+import atexit
+import json
+import mmap
+import os
+import struct
+import weakref
+
+try:
+    import numpy as np
+except ImportError:  # NumPy es opcional: sin él la traza se recorre registro por registro
+    np = None
+
+from process import _LabeledEnum
+
+
+class EventKind(_LabeledEnum):
+    """Tipos de evento de planificación que se guardan en la traza"""
+    ARRIVAL = 0
+    DISPATCH = 1    # valor = duración del turno
+    PREEMPT = 2     # valor = tiempo restante
+    BLOCK = 3
+    UNBLOCK = 4
+    PRODUCE = 5     # valor = KB agregados al buffer
+    CONSUME = 6     # valor = KB retirados del buffer
+    TERMINATE = 7
+
+EventKind._labels_ = ("Llegada", "Despacho", "Expropiación", "Bloqueo", "Desbloqueo", "Producción",
+                      "Consumo", "Terminación")
+
+MAGIC = b"SCHEDEVT"
+VERSION = 1
+HEADER = struct.Struct("<8sHHI")    # magia, versión, tamaño de registro, reservado
+RECORD = struct.Struct("<ddIB3x")   # tiempo, valor, índice del PID, tipo (24 bytes)
+
+if np is not None:
+    RECORD_DTYPE = np.dtype({"names": ["time", "value", "pid", "kind"],
+                             "formats": ["<f8", "<f8", "<u4", "u1"],
+                             "offsets": [0, 8, 16, 20], "itemsize": RECORD.size})
+
+
+# Trazas abiertas que se vacían al salir del intérprete
+_open_traces = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_open_traces():
+    for trace in list(_open_traces):
+        trace.close()
+
+
+def pids_path(path):
+    """Archivo auxiliar con un PID por línea (el índice es el número de línea)"""
+    return path + ".pids"
+
+
+class EventTraceWriter:
+    """Escribe los eventos de planificación como registros binarios de ancho fijo
+
+    Los registros se acumulan en memoria y se agregan al archivo por lotes. Los
+    PIDs se guardan una sola vez en el archivo auxiliar .pids y cada registro
+    lleva solo su índice.
+    """
+
+    def __init__(self, path, batch_size=4096):
+        self.path = path
+        self.batch_size = batch_size
+        self.pending = []
+        self.pid_index = {}     # PID -> índice
+        self.new_pids = []      # PIDs aún no escritos en el archivo auxiliar
+        self.written = 0        # Registros escritos en disco
+        with open(path, "wb") as f:
+            f.write(HEADER.pack(MAGIC, VERSION, RECORD.size, 0))
+        with open(pids_path(path), "w"):
+            pass
+        _open_traces.add(self)
+
+    def __len__(self):
+        return self.written + len(self.pending)
+
+    def emit(self, kind, pid, now, value=0.0):
+        """Agrega un evento a la traza"""
+        index = self.pid_index.get(pid)
+        if index is None:
+            index = self.pid_index[pid] = len(self.pid_index)
+            self.new_pids.append(pid)
+        self.pending.append(RECORD.pack(now, value, index, kind))
+        if len(self.pending) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        """Escribe los registros y PIDs pendientes"""
+        if self.new_pids:
+            with open(pids_path(self.path), "a") as f:
+                f.write("".join(json.dumps(pid) + "\n" for pid in self.new_pids))
+            self.new_pids = []
+        if self.pending:
+            with open(self.path, "ab") as f:
+                f.write(b"".join(self.pending))
+            self.written += len(self.pending)
+            self.pending = []
+
+    def close(self):
+        self.flush()
+        _open_traces.discard(self)
+
+
+class EventTrace:
+    """Lectura de una traza binaria mapeada en memoria (mmap), sin parsear
+
+    Con NumPy, 'records' es un arreglo estructurado (time, value, pid, kind)
+    que apunta directamente al archivo, así que abrir y filtrar millones de
+    eventos cuesta milisegundos. Los eventos están en orden de tiempo.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as f:
+            header = f.read(HEADER.size)
+            if len(header) < HEADER.size:
+                raise ValueError(f"{path} no es una traza de eventos")
+            magic, version, record_size, _ = HEADER.unpack(header)
+            if magic != MAGIC or record_size != RECORD.size:
+                raise ValueError(f"{path} no es una traza de eventos (versión {version})")
+            size = os.fstat(f.fileno()).st_size
+            self.count = (size - HEADER.size) // RECORD.size
+            self.map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if self.count else None
+        with open(pids_path(path), "r") as f:
+            self.pids = [json.loads(line) for line in f]
+        self.pid_index = {pid: index for index, pid in enumerate(self.pids)}
+        self._records = None
+
+    def __len__(self):
+        return self.count
+
+    def close(self):
+        self._records = None
+        if self.map is not None:
+            self.map.close()
+            self.map = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    @property
+    def records(self):
+        """Arreglo estructurado NumPy sobre el archivo mapeado. Requiere NumPy"""
+        if np is None:
+            raise ImportError("Leer la traza como arreglo requiere NumPy (pip install numpy)")
+        if self._records is None:
+            if self.count:
+                self._records = np.frombuffer(self.map, dtype=RECORD_DTYPE, count=self.count, offset=HEADER.size)
+            else:
+                self._records = np.empty(0, dtype=RECORD_DTYPE)
+        return self._records
+
+    def __iter__(self):
+        """Recorre los eventos como tuplas (tiempo, tipo, PID, valor) sin NumPy"""
+        if not self.count:
+            return
+        view = memoryview(self.map)[HEADER.size:HEADER.size + self.count * RECORD.size]
+        for now, value, index, kind in RECORD.iter_unpack(view):
+            yield now, EventKind(kind), self.pids[index], value
+
+    def select(self, kind=None, pid=None, start=None, end=None):
+        """Eventos filtrados por tipo, PID y ventana de tiempo [start, end); un PID desconocido no tiene eventos"""
+        records = self.records
+        if start is not None or end is not None:
+            times = records["time"]
+            first = np.searchsorted(times, start, "left") if start is not None else 0
+            last = np.searchsorted(times, end, "left") if end is not None else len(records)
+            records = records[first:last]
+        if kind is not None:
+            records = records[records["kind"] == kind]
+        if pid is not None:
+            index = self.pid_index.get(pid)
+            records = records[:0] if index is None else records[records["pid"] == index]
+        return records
+
+    def summary(self):
+        """Cantidad de eventos por tipo, duración y CPU por proceso"""
+        records = self.records
+        counts = np.bincount(records["kind"], minlength=len(EventKind))
+        dispatch = records[records["kind"] == EventKind.DISPATCH]
+        cpu = np.bincount(dispatch["pid"], weights=dispatch["value"], minlength=len(self.pids))
+        return {
+            "events": self.count,
+            "processes": len(self.pids),
+            "start": float(records["time"][0]) if self.count else 0.0,
+            "end": float(records["time"][-1]) if self.count else 0.0,
+            "by_kind": {kind.label: int(counts[kind]) for kind in EventKind},
+            "cpu_time": float(cpu.sum()),
+            "busiest": [(self.pids[i], float(cpu[i])) for i in np.argsort(-cpu, kind="stable")[:5] if cpu[i] > 0],
+        }
+
+    def segments(self):
+        """Turnos de CPU como arreglos (inicio, fin, índice de PID)"""
+        dispatch = self.records[self.records["kind"] == EventKind.DISPATCH]
+        return dispatch["time"], dispatch["time"] + dispatch["value"], dispatch["pid"]
+
+    def blocked_intervals(self):
+        """Periodos bloqueado como arreglos (inicio, fin, índice de PID)
+
+        Cada bloqueo se empareja con el siguiente desbloqueo o terminación del
+        mismo proceso; si no hay, el periodo llega hasta el final de la traza.
+        """
+        records = self.records
+        kinds = records["kind"]
+        relevant = records[(kinds == EventKind.BLOCK) | (kinds == EventKind.UNBLOCK) | (kinds == EventKind.TERMINATE)]
+        if not len(relevant):
+            return np.empty(0), np.empty(0), np.empty(0, dtype=np.uint32)
+        order = np.lexsort((np.arange(len(relevant)), relevant["pid"]))  # Por PID y, dentro, en orden de tiempo
+        ordered = relevant[order]
+        trace_end = records["time"][-1]
+        same_pid = np.append(ordered["pid"][1:] == ordered["pid"][:-1], False)
+        end = np.where(same_pid, np.append(ordered["time"][1:], trace_end), trace_end)
+        is_block = ordered["kind"] == EventKind.BLOCK
+        return ordered["time"][is_block], end[is_block], ordered["pid"][is_block]
+
+    def state_at(self, when):
+        """Último evento de cada proceso en el instante 'when' (reproducción): {PID: etiqueta}"""
+        records = self.records[:np.searchsorted(self.records["time"], when, "right")]
+        if not len(records):
+            return {}
+        # El último registro de cada PID: único sobre el arreglo invertido
+        pids, first = np.unique(records["pid"][::-1], return_index=True)
+        last_kinds = records["kind"][::-1][first]
+        return {self.pids[p]: EventKind(k).label for p, k in zip(pids, last_kinds)}
+
+
+def render_gantt(trace, width=80, start=None, end=None, max_rows=20):
+    """Diagrama de Gantt en texto: '█' ejecutando, '·' bloqueado, una fila por proceso"""
+    if not trace.count:
+        return "Traza vacía"
+    times = trace.records["time"]
+    start = float(times[0]) if start is None else start
+    end = float(times[-1]) if end is None else end
+    if end <= start:
+        end = start + 1
+    scale = width / (end - start)
+    rows = min(len(trace.pids), max_rows)
+    grid = [[" "] * width for _ in range(rows)]
+
+    def paint(starts, ends, pids, mark):
+        visible = (pids < rows) & (ends > start) & (starts < end)
+        first = np.clip(((starts[visible] - start) * scale).astype(int), 0, width - 1)
+        last = np.clip(np.ceil((ends[visible] - start) * scale).astype(int), 1, width)
+        for pid, a, b in zip(pids[visible], first, last):
+            row = grid[pid]
+            for col in range(a, max(b, a + 1)):
+                if row[col] != "█":
+                    row[col] = mark
+
+    paint(*trace.blocked_intervals(), "·")
+    paint(*trace.segments(), "█")
+
+    label = max(len(str(pid)) for pid in trace.pids[:rows])
+    lines = [f"{'':>{label}} t={start:.2f}{'':>{max(width - 16, 1)}}t={end:.2f}"]
+    lines += [f"{str(trace.pids[i]):>{label}} |{''.join(grid[i])}|" for i in range(rows)]
+    if len(trace.pids) > rows:
+        lines.append(f"... {len(trace.pids) - rows} procesos más")
+    return "\n".join(lines)
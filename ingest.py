@@ -0,0 +1,108 @@
+import csv
+import gzip
+import json
+import math
+import os
+
+# Nombres aceptados para cada campo de la traza
+FIELD_ALIASES = {
+    "arrival_time": ("arrival_time", "arrival"),
+    "burst_time": ("burst_time", "burst"),
+    "priority": ("priority",),
+    "memory": ("memory", "memory_req"),
+    "type": ("type", "process_type"),
+    "pid": ("pid",),
+    "affinity": ("affinity",),
+}
+
+TRACE_EXTENSIONS = (".csv", ".jsonl", ".ndjson")
+
+
+def is_trace(path):
+    """Indica si la ruta es una traza CSV/JSONL (opcionalmente comprimida con gzip)"""
+    name = path[:-3] if path.endswith(".gz") else path
+    return os.path.splitext(name)[1].lower() in TRACE_EXTENSIONS
+
+
+def read_rows(path):
+    """Genera (número de línea, fila cruda) leyendo la traza de a una línea"""
+    name = path[:-3] if path.endswith(".gz") else path
+    opener = gzip.open if path.endswith(".gz") else open
+    extension = os.path.splitext(name)[1].lower()
+    if extension not in TRACE_EXTENSIONS:
+        raise ValueError(f"Formato de traza desconocido: {path} (use {', '.join(TRACE_EXTENSIONS)})")
+
+    with opener(path, "rt", newline="") as f:
+        if extension == ".csv":
+            reader = csv.DictReader(f)
+            for row in reader:
+                yield reader.line_num, row
+        else:
+            for line_number, line in enumerate(f, 1):
+                if line.strip():
+                    try:
+                        yield line_number, json.loads(line)
+                    except json.JSONDecodeError as e:
+                        raise ValueError(f"Línea {line_number}: JSON inválido ({e.msg})")
+
+
+def _field(row, name):
+    for alias in FIELD_ALIASES[name]:
+        value = row.get(alias)
+        if value not in (None, ""):
+            return value
+    return None
+
+
+def _number(value, line_number, name):
+    """Convierte a número; los valores enteros quedan como int"""
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        raise ValueError(f"Línea {line_number}: {name} inválido: {value!r}")
+    if math.isnan(number) or math.isinf(number):
+        raise ValueError(f"Línea {line_number}: {name} inválido: {value!r}")
+    return int(number) if number.is_integer() else number
+
+
+def parse_rows(rows):
+    """Normaliza cada fila a una entrada de carga de trabajo con arrival_time"""
+    for line_number, row in rows:
+        missing = [name for name in ("arrival_time", "burst_time", "priority") if _field(row, name) is None]
+        if missing:
+            raise ValueError(f"Línea {line_number}: faltan los campos {', '.join(missing)}")
+        entry = {
+            "arrival_time": float(_number(_field(row, "arrival_time"), line_number, "arrival_time")),
+            "burst_time": _number(_field(row, "burst_time"), line_number, "burst_time"),
+            "priority": int(_number(_field(row, "priority"), line_number, "priority")),
+            "type": _field(row, "type") or "Normal",
+            "line": line_number,
+        }
+        memory = _field(row, "memory")
+        if memory is not None:
+            entry["memory"] = _number(memory, line_number, "memory")
+        pid = _field(row, "pid")
+        if pid is not None:
+            entry["pid"] = str(pid)
+        affinity = _field(row, "affinity")
+        if affinity is not None:
+            # Lista JSON o, en CSV, CPUs separados por ';' (p. ej. "0;2")
+            cpus = affinity if isinstance(affinity, list) else str(affinity).split(";")
+            entry["affinity"] = [int(_number(cpu, line_number, "affinity")) for cpu in cpus]
+        yield entry
+
+
+def ordered(entries):
+    """Deja pasar las entradas verificando que las llegadas no retrocedan"""
+    last = -math.inf
+    for entry in entries:
+        if entry["arrival_time"] < last:
+            raise ValueError(f"Línea {entry['line']}: la traza debe estar ordenada por llegada "
+                             f"({entry['arrival_time']} < {last})")
+        last = entry["arrival_time"]
+        yield entry
+
+
+def load_trace(path):
+    """Generador perezoso de entradas de una traza CSV/JSONL: nunca carga el archivo completo"""
+    return ordered(parse_rows(read_rows(path)))
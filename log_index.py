@@ -0,0 +1,451 @@
+import bisect
+import datetime
+import math
+import mmap
+import os
+import re
+import struct
+import zlib
+
+try:
+    import numpy as np
+except ImportError:  # NumPy es opcional: sin él los filtros recorren el índice registro por registro
+    np = None
+
+from process import _LabeledEnum
+
+
+class LogEvent(_LabeledEnum):
+    """Tipo de evento de una línea del log, deducido del mensaje"""
+    OTHER = 0
+    CREATE = 1
+    START = 2
+    TERMINATE = 3
+    PRODUCE = 4
+    CONSUME = 5
+    STATE = 6
+    DELETE = 7
+    CONFIG = 8
+    ERROR = 9
+    SYSTEM = 10
+
+LogEvent._labels_ = ("Otro", "Creación", "Ejecución", "Terminación", "Producción", "Consumo",
+                     "Cambio de estado", "Eliminación", "Configuración", "Error", "Sistema")
+
+# Fragmentos del mensaje que definen su tipo; gana el primero que aparece
+_EVENT_MARKERS = (
+    ("fallido", LogEvent.ERROR),
+    ("Proceso creado", LogEvent.CREATE),
+    ("comenzó ejecución", LogEvent.START),
+    ("Estado modificado", LogEvent.STATE),
+    ("eliminad", LogEvent.DELETE),
+    ("eliminar", LogEvent.DELETE),
+    ("produjo", LogEvent.PRODUCE),
+    ("consumió", LogEvent.CONSUME),
+    ("Sistema ", LogEvent.SYSTEM),
+    ("terminado", LogEvent.TERMINATE),
+    ("Algoritmo cambiado", LogEvent.CONFIG),
+    ("Quantum", LogEvent.CONFIG),
+    ("Velocidad", LogEvent.CONFIG),
+    ("Checkpoint", LogEvent.SYSTEM),
+    ("Modo concurrente", LogEvent.SYSTEM),
+)
+_PID_FIELD = re.compile(r"PID=([^\s,]+)")
+_PID_SUBJECTS = ("Proceso", "Productor", "Consumidor")
+
+MAGIC = b"SCHEDLOG"
+VERSION = 1
+HEADER = struct.Struct("<8sHHI")    # magia, versión, tamaño de registro, banderas
+UNSORTED = 1                        # Bandera: algún tiempo es menor que el de la línea anterior
+RECORD = struct.Struct("<QdIB3x")   # offset de la línea, tiempo, clave del PID, tipo (24 bytes)
+
+if np is not None:
+    RECORD_DTYPE = np.dtype({"names": ["offset", "time", "pid", "kind"],
+                             "formats": ["<u8", "<f8", "<u4", "u1"],
+                             "offsets": [0, 8, 16, 20], "itemsize": RECORD.size})
+
+CHUNK = 65536  # Registros por bloque al filtrar desde el final
+
+
+def index_path(path):
+    """Archivo auxiliar con el índice de offsets del log"""
+    return path + ".idx"
+
+
+def _event(text):
+    """Tipo de evento según el primer fragmento conocido que aparece en 'text'"""
+    for marker, event in _EVENT_MARKERS:
+        if marker in text:
+            return event
+    return LogEvent.OTHER
+
+
+_subject_events = {}  # Resto del mensaje después del PID -> tipo (los mensajes del planificador se repiten)
+
+
+def classify(action):
+    """PID (o None) y tipo de evento de un mensaje del log"""
+    match = _PID_FIELD.search(action) if "PID=" in action else None
+    if match:
+        return match.group(1), _event(action)
+    words = action.split(" ", 2)
+    if len(words) > 1 and words[0] in _PID_SUBJECTS and not words[1].endswith(":"):
+        rest = words[2] if len(words) > 2 else ""
+        kind = _subject_events.get(rest)
+        if kind is None:
+            if len(_subject_events) >= 4096:
+                _subject_events.clear()
+            kind = _subject_events[rest] = _event(rest)
+        return words[1], kind
+    return None, _event(action)
+
+
+def pid_key(pid):
+    """Clave de 32 bits de un PID para el índice (0 = línea sin PID); las colisiones se descartan al leer"""
+    if pid is None:
+        return 0
+    return zlib.crc32(str(pid).encode()) or 1
+
+
+def _event_name(event):
+    """Nombre del evento para los filtros, sin espacios ('cambio_de_estado')"""
+    return event.label.lower().replace(" ", "_")
+
+
+def parse_event(value):
+    """Convierte 'terminación', 'cambio_de_estado', 'TERMINATE' o un entero al tipo de evento"""
+    if isinstance(value, str):
+        text = value.strip().lower().replace(" ", "_")
+        for event in LogEvent:
+            if text in (_event_name(event), event.name.lower()):
+                return event
+        raise ValueError(f"Evento desconocido: {value} (use {', '.join(_event_name(e) for e in LogEvent)})")
+    return LogEvent(value)
+
+
+def parse_time(value):
+    """Tiempo de un filtro: segundos simulados (10.5) o fecha y hora ISO (2025-05-01T10:00:00)"""
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    try:
+        return datetime.datetime.fromisoformat(value).timestamp()
+    except ValueError:
+        raise ValueError(f"Tiempo inválido: {value} (use segundos o fecha ISO)") from None
+
+
+def parse_filter(text):
+    """Convierte 'pid=ab12 evento=terminación desde=10 hasta=20' en los filtros de LogViewer.select"""
+    filters = {}
+    for term in text.split():
+        key, sep, value = term.partition("=")
+        key = key.lower()
+        if not sep or not value:
+            raise ValueError(f"Filtro inválido: {term} (use clave=valor)")
+        if key == "pid":
+            filters["pid"] = value
+        elif key in ("evento", "event"):
+            filters["kind"] = parse_event(value)
+        elif key in ("desde", "since"):
+            filters["start"] = parse_time(value)
+        elif key in ("hasta", "until"):
+            filters["end"] = parse_time(value)
+        else:
+            raise ValueError(f"Filtro desconocido: {key} (use pid, evento, desde o hasta)")
+    return filters
+
+
+def describe_filter(pid=None, kind=None, start=None, end=None):
+    """Texto legible de los filtros activos"""
+    terms = []
+    if pid is not None:
+        terms.append(f"pid={pid}")
+    if kind is not None:
+        terms.append(f"evento={_event_name(kind)}")
+    if start is not None:
+        terms.append(f"desde={_format_time(start)}")
+    if end is not None:
+        terms.append(f"hasta={_format_time(end)}")
+    return " ".join(terms)
+
+
+def _format_time(value):
+    """Segundos simulados tal cual; los instantes del reloj real como fecha ISO"""
+    if value < 1e9:
+        return f"{value:g}"
+    return datetime.datetime.fromtimestamp(value).isoformat(timespec="seconds")
+
+
+class LogIndexWriter:
+    """Agrega al índice un registro por línea escrita en el log
+
+    Lo usa EventLog al escribir cada lote: el offset de cada línea sale de la
+    posición del archivo y de la longitud en bytes de las anteriores, así que el
+    índice se construye a medida que el log crece, sin volver a leerlo.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.flags = 0
+        self.last_time = -math.inf
+        self.keys = {}  # PID -> clave (caché)
+        try:
+            with open(path, "rb") as f:
+                header = f.read(HEADER.size)
+                size = os.fstat(f.fileno()).st_size
+                if len(header) == HEADER.size and size >= HEADER.size + RECORD.size:
+                    self.flags = HEADER.unpack(header)[3]
+                    f.seek(HEADER.size + ((size - HEADER.size) // RECORD.size - 1) * RECORD.size)
+                    self.last_time = RECORD.unpack(f.read(RECORD.size))[1]
+        except FileNotFoundError:
+            header = b""
+        if len(header) < HEADER.size:
+            self.reset()
+
+    def reset(self):
+        """Deja el índice vacío (el log se truncó)"""
+        self.flags = 0
+        self.last_time = -math.inf
+        with open(self.path, "wb") as f:
+            f.write(HEADER.pack(MAGIC, VERSION, RECORD.size, 0))
+
+    def append(self, offset, lines, marks):
+        """Indexa las líneas codificadas 'lines', escritas a partir de 'offset', con sus (tiempo, mensaje)"""
+        records = []
+        pack, keys = RECORD.pack, self.keys
+        last = self.last_time
+        unsorted = False
+        for line, (now, action) in zip(lines, marks):
+            pid, kind = classify(action)
+            key = keys.get(pid)
+            if key is None:
+                if len(keys) >= 65536:
+                    keys.clear()
+                key = keys[pid] = pid_key(pid)
+            records.append(pack(offset, now, key, kind))
+            offset += len(line)
+            if now < last:
+                unsorted = True
+            last = now
+        self.last_time = last
+        with open(self.path, "r+b") as f:
+            if unsorted and not self.flags & UNSORTED:
+                # Los rangos de tiempo ya no pueden buscarse por bisección
+                self.flags |= UNSORTED
+                f.write(HEADER.pack(MAGIC, VERSION, RECORD.size, self.flags))
+            f.seek(0, os.SEEK_END)
+            f.write(b"".join(records))
+
+
+class LogViewer:
+    """Consultas sobre el log mapeado en memoria (mmap) usando el índice de offsets
+
+    Abrir el visor no lee el log: el índice da el offset, el tiempo, el PID y el
+    tipo de cada línea, y solo se decodifican las líneas que se muestran. Las
+    líneas que el índice todavía no cubre (un log sin índice o cortado por una
+    caída) se indexan al abrir, en memoria. Con NumPy los filtros recorren el
+    índice por bloques desde el final; los rangos de tiempo usan búsqueda
+    binaria salvo que el índice marque tiempos fuera de orden.
+    """
+
+    def __init__(self, path, data=None, index=None):
+        """Abre 'path' y su índice; con 'data' (y opcionalmente 'index') usa esos bytes ya leídos"""
+        self.path = path
+        if data is None:
+            with open(path, "rb") as f:
+                self.size = os.fstat(f.fileno()).st_size
+                self.log = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if self.size else b""
+            index = self._map(index_path(path))
+        else:
+            self.size = len(data)
+            self.log = data
+        self.sorted = True  # Tiempos no decrecientes (según la bandera del índice y lo indexado al abrir)
+        self.index, self.count = self._load_index(index or b"")
+        self._records = None
+
+    @staticmethod
+    def _map(path):
+        """Mapea un archivo en memoria, o retorna b"" si no existe o está vacío"""
+        try:
+            with open(path, "rb") as f:
+                if os.fstat(f.fileno()).st_size:
+                    return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except FileNotFoundError:
+            pass
+        return b""
+
+    def _load_index(self, index):
+        """Valida el índice y le agrega las líneas del final que todavía no cubre"""
+        count = 0
+        if len(index) >= HEADER.size:
+            magic, _, record_size, flags = HEADER.unpack_from(index)
+            if magic == MAGIC and record_size == RECORD.size:
+                self.sorted = not flags & UNSORTED
+                count = (len(index) - HEADER.size) // RECORD.size
+        # El índice debe empezar en la primera línea y no apuntar más allá del log
+        while count and RECORD.unpack_from(index, HEADER.size + (count - 1) * RECORD.size)[0] >= self.size:
+            count -= 1
+        if count and RECORD.unpack_from(index, HEADER.size)[0] != 0:
+            count = 0
+        if not count:
+            self.sorted = True
+        indexed = self._line_end(index, count)
+        if indexed >= self.size:
+            return index, count
+        last = RECORD.unpack_from(index, HEADER.size + (count - 1) * RECORD.size)[1] if count else -math.inf
+        extra = self._scan(indexed, last)
+        data = bytes(index[:HEADER.size + count * RECORD.size]) if count else HEADER.pack(MAGIC, VERSION, RECORD.size, 0)
+        if isinstance(index, mmap.mmap):
+            index.close()
+        return data + b"".join(extra), count + len(extra)
+
+    def _line_end(self, index, count):
+        """Offset donde termina la última línea indexada"""
+        if not count:
+            return 0
+        offset = RECORD.unpack_from(index, HEADER.size + (count - 1) * RECORD.size)[0]
+        end = self.log.find(b"\n", offset)
+        return self.size if end < 0 else end + 1
+
+    def _scan(self, offset, last):
+        """Indexa las líneas desde 'offset' hasta el final leyendo el log ('last': tiempo de la anterior)"""
+        records = []
+        stamps = {}
+        while offset < self.size:
+            end = self.log.find(b"\n", offset)
+            end = self.size if end < 0 else end + 1
+            line = self.log[offset:end].decode(errors="replace")
+            stamp, _, action = line.rstrip("\n").partition("] ")
+            now = stamps.get(stamp)
+            if now is None:
+                now = stamps[stamp] = self._parse_stamp(stamp.lstrip("["))
+            pid, kind = classify(action)
+            records.append(RECORD.pack(offset, now, pid_key(pid), kind))
+            if not now >= last:
+                self.sorted = False
+            last = now
+            offset = end
+        return records
+
+    @staticmethod
+    def _parse_stamp(stamp):
+        if stamp.startswith("t="):
+            try:
+                return float(stamp[2:])
+            except ValueError:
+                return math.nan
+        try:
+            return datetime.datetime.strptime(stamp, "%Y-%m-%d %H:%M:%S").timestamp()
+        except ValueError:
+            return math.nan
+
+    def __len__(self):
+        return self.count
+
+    def close(self):
+        self._records = None
+        for data in (self.log, self.index):
+            if isinstance(data, mmap.mmap):
+                data.close()
+        self.log = self.index = b""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    @property
+    def records(self):
+        """Arreglo estructurado NumPy sobre el índice (offset, time, pid, kind). Requiere NumPy"""
+        if np is None:
+            raise ImportError("Leer el índice como arreglo requiere NumPy (pip install numpy)")
+        if self._records is None:
+            self._records = np.frombuffer(self.index, dtype=RECORD_DTYPE, count=self.count, offset=HEADER.size)
+        return self._records
+
+    def _record(self, number):
+        return RECORD.unpack_from(self.index, HEADER.size + number * RECORD.size)
+
+    def line(self, number):
+        """Texto de la línea 'number' (desde 0), sin el salto de línea"""
+        offset = self._record(number)[0]
+        end = self._record(number + 1)[0] if number + 1 < self.count else self._line_end(self.index, self.count)
+        return self.log[offset:end].decode(errors="replace").rstrip("\n")
+
+    def _time_bounds(self, start, end):
+        """Rango de líneas [first, last) con tiempos en [start, end) por búsqueda binaria"""
+        if np is not None:
+            times = self.records["time"]
+            first = int(np.searchsorted(times, start, "left")) if start is not None else 0
+            last = int(np.searchsorted(times, end, "left")) if end is not None else self.count
+            return first, last
+        key = lambda i: self._record(i)[1]
+        numbers = range(self.count)
+        first = bisect.bisect_left(numbers, start, key=key) if start is not None else 0
+        last = bisect.bisect_left(numbers, end, key=key) if end is not None else self.count
+        return first, last
+
+    def select(self, count=20, before=None, pid=None, kind=None, start=None, end=None):
+        """Las últimas 'count' líneas que cumplen el filtro y están antes de la línea 'before'
+
+        Retorna una lista de (número de línea, texto) en orden. Para paginar
+        hacia atrás se pasa como 'before' el número de la primera línea de la
+        página anterior. 'start' y 'end' delimitan el tiempo en [start, end).
+        """
+        low, high = 0, self.count if before is None else max(0, min(before, self.count))
+        timed = start is not None or end is not None
+        if timed and self.sorted:
+            first, last = self._time_bounds(start, end)
+            low, high = max(low, first), min(high, last)
+            timed = False
+        key = pid_key(pid) if pid is not None else None
+        if key is None and kind is None and not timed:
+            numbers = range(high - 1, low - 1, -1)
+        elif np is not None:
+            numbers = self._match_blocks(low, high, key, kind, start if timed else None, end if timed else None)
+        else:
+            numbers = self._match_records(low, high, key, kind, start if timed else None, end if timed else None)
+
+        entries = []
+        for number in numbers:
+            text = self.line(number)
+            if pid is not None and classify(text.partition("] ")[2])[0] != str(pid):
+                continue  # Colisión de la clave del PID
+            entries.append((number, text))
+            if len(entries) >= count:
+                break
+        entries.reverse()
+        return entries
+
+    def _match_blocks(self, low, high, key, kind, start, end):
+        """Números de línea que cumplen el filtro, del último al primero, recorriendo el índice por bloques"""
+        records = self.records
+        stop = high
+        while stop > low:
+            first = max(low, stop - CHUNK)
+            block = records[first:stop]
+            mask = np.ones(len(block), dtype=bool)
+            if key is not None:
+                mask &= block["pid"] == key
+            if kind is not None:
+                mask &= block["kind"] == kind
+            if start is not None:
+                mask &= block["time"] >= start
+            if end is not None:
+                mask &= block["time"] < end
+            yield from (first + np.flatnonzero(mask)[::-1]).tolist()
+            stop = first
+
+    def _match_records(self, low, high, key, kind, start, end):
+        """Como _match_blocks, pero registro por registro (sin NumPy)"""
+        for number in range(high - 1, low - 1, -1):
+            _, now, pid, event = self._record(number)
+            if ((key is None or pid == key) and (kind is None or event == kind)
+                    and (start is None or now >= start) and (end is None or now < end)):
+                yield number
+
+    def tail(self, count=20, **filters):
+        """Las últimas 'count' líneas (con filtros opcionales)"""
+        return self.select(count, **filters)
@@ -0,0 +1,296 @@
+import gzip
+import lzma
+import os
+import queue
+import re
+import threading
+from collections import OrderedDict
+
+from log_index import HEADER, RECORD, LogViewer, index_path
+
+# Compresión de los segmentos cerrados: sufijo del archivo y función para abrirlo
+CODECS = {"gzip": (".gz", gzip.open), "lzma": (".xz", lzma.open)}
+_OPENERS = {suffix: opener for suffix, opener in CODECS.values()}
+
+
+def parse_size(value):
+    """Convierte '64M', '512k', '2G' o un número de bytes a bytes"""
+    if isinstance(value, (int, float)):
+        return int(value)
+    text = value.strip().upper().removesuffix("B")
+    factor = {"K": 1 << 10, "M": 1 << 20, "G": 1 << 30}.get(text[-1:], 1)
+    try:
+        return int(float(text[:-1] if factor > 1 else text) * factor)
+    except ValueError:
+        raise ValueError(f"Tamaño inválido: {value} (use bytes o K, M, G)") from None
+
+
+def segment_path(path, number):
+    """Nombre del segmento 'number' del log (sin el sufijo de compresión)"""
+    return f"{path}.{number:06d}"
+
+
+def list_segments(path):
+    """Segmentos rotados del log, del más viejo al más nuevo: [(número, archivo del log, archivo del índice)]
+
+    Un segmento se comprime en segundo plano; mientras tanto pueden existir las
+    dos versiones y se usa la que no está comprimida.
+    """
+    directory = os.path.dirname(path) or "."
+    pattern = re.compile(re.escape(os.path.basename(path)) + r"\.(\d{6})(?:\.gz|\.xz)?$")
+    numbers = set()
+    for name in os.listdir(directory):
+        match = pattern.match(name)
+        if match:
+            numbers.add(int(match.group(1)))
+    segments = []
+    for number in sorted(numbers):
+        base = segment_path(path, number)
+        segments.append((number, _existing(base), _existing(index_path(base))))
+    return segments
+
+
+def _existing(path):
+    """La versión de 'path' que existe en disco: sin comprimir o con el sufijo de algún códec"""
+    for candidate in [path] + [path + suffix for suffix in _OPENERS]:
+        if os.path.exists(candidate):
+            return candidate
+    return path
+
+
+def read_file(path):
+    """Contenido de un archivo, descomprimido según su sufijo (b"" si no existe)
+
+    Si la versión sin comprimir desapareció (el compresor la acaba de
+    reemplazar) se lee la comprimida.
+    """
+    base = path.removesuffix(os.path.splitext(path)[1]) if os.path.splitext(path)[1] in _OPENERS else path
+    for candidate in (path, _existing(base)):
+        opener = _OPENERS.get(os.path.splitext(candidate)[1], open)
+        try:
+            with opener(candidate, "rb") as f:
+                return f.read()
+        except FileNotFoundError:
+            continue
+    return b""
+
+
+class LogRotation:
+    """Rotación del log en segmentos numerados con compresión en segundo plano y retención
+
+    Cuando el archivo activo llega a 'max_bytes' o a 'max_lines' líneas, el log
+    y su índice se renombran como el siguiente segmento (system_log.txt.000007
+    y .000007.idx) y un hilo aparte los comprime con gzip o lzma. Si los
+    segmentos cerrados ocupan más de 'retention' bytes en disco, se borran los
+    más viejos. La rotación se revisa después de cada lote escrito.
+    """
+
+    def __init__(self, path, max_bytes=None, max_lines=None, compress="gzip", retention=None):
+        if compress is not None and compress not in CODECS:
+            raise ValueError(f"Compresión desconocida: {compress} (use {', '.join(CODECS)} o None)")
+        self.path = path
+        self.max_bytes = parse_size(max_bytes) if max_bytes is not None else None
+        self.max_lines = max_lines
+        self.compress = compress
+        self.retention = parse_size(retention) if retention is not None else None
+        segments = list_segments(path)
+        self.last = segments[-1][0] if segments else 0  # Número del último segmento
+        self.lines = self._indexed_lines()              # Líneas en el archivo activo
+        self.jobs = None
+        self.worker = None
+        self.lock = threading.Lock()                    # Serializa retención y compresión
+
+    def _indexed_lines(self):
+        try:
+            return max(0, (os.path.getsize(index_path(self.path)) - HEADER.size) // RECORD.size)
+        except OSError:
+            return 0
+
+    def due(self, lines, size):
+        """Cuenta 'lines' líneas recién escritas e indica si el archivo activo ('size' bytes) debe rotar"""
+        self.lines += lines
+        return ((self.max_bytes is not None and size >= self.max_bytes)
+                or (self.max_lines is not None and self.lines >= self.max_lines))
+
+    def rotate(self):
+        """Cierra el archivo activo como el siguiente segmento. Retorna su número, o None si estaba vacío"""
+        self.lines = 0
+        try:
+            if not os.path.getsize(self.path):
+                return None
+        except FileNotFoundError:
+            return None
+        self.last += 1
+        target = segment_path(self.path, self.last)
+        os.replace(self.path, target)
+        if os.path.exists(index_path(self.path)):
+            os.replace(index_path(self.path), index_path(target))
+        if self.compress is not None:
+            self._submit(self.last)
+        else:
+            self.apply_retention()
+        return self.last
+
+    def _submit(self, number):
+        if self.worker is None:
+            self.jobs = queue.Queue()
+            self.worker = threading.Thread(target=self._compress_loop, name="log-compressor", daemon=True)
+            self.worker.start()
+        self.jobs.put(number)
+
+    def _compress_loop(self):
+        """Hilo compresor: comprime los segmentos cerrados en orden"""
+        while True:
+            number = self.jobs.get()
+            try:
+                if number is None:
+                    return
+                self.compress_segment(number)
+            finally:
+                self.jobs.task_done()
+
+    def compress_segment(self, number):
+        """Comprime el log y el índice de un segmento y borra las versiones sin comprimir"""
+        suffix, opener = CODECS[self.compress]
+        base = segment_path(self.path, number)
+        with self.lock:
+            for source in (base, index_path(base)):
+                if not os.path.exists(source):
+                    continue
+                partial = source + suffix + ".tmp"
+                with open(source, "rb") as raw, opener(partial, "wb") as packed:
+                    while True:
+                        block = raw.read(1 << 20)
+                        if not block:
+                            break
+                        packed.write(block)
+                # El comprimido aparece completo antes de borrar el original: un lector ve siempre uno de los dos
+                os.replace(partial, source + suffix)
+                os.remove(source)
+        self.apply_retention()
+
+    def apply_retention(self):
+        """Borra los segmentos más viejos mientras los cerrados ocupen más de 'retention' bytes"""
+        if self.retention is None:
+            return
+        with self.lock:
+            segments = list_segments(self.path)
+            sizes = [sum(os.path.getsize(name) for name in self._files(number)) for number, _, _ in segments]
+            total = sum(sizes)
+            for (number, _, _), size in zip(segments, sizes):
+                if total <= self.retention:
+                    break
+                for name in self._files(number):
+                    os.remove(name)
+                total -= size
+
+    def _files(self, number):
+        """Archivos en disco de un segmento (log e índice, comprimidos o no)"""
+        base = segment_path(self.path, number)
+        names = [base + suffix for suffix in ("", ".gz", ".xz")]
+        names += [index_path(base) + suffix for suffix in ("", ".gz", ".xz")]
+        return [name for name in names if os.path.exists(name)]
+
+    def flush(self):
+        """Espera a que terminen las compresiones pendientes"""
+        if self.jobs is not None:
+            self.jobs.join()
+
+    def close(self):
+        """Termina las compresiones pendientes y detiene el hilo compresor"""
+        if self.worker is not None:
+            self.jobs.put(None)
+            self.worker.join()
+            self.worker = None
+            self.jobs = None
+
+
+class LogHistory:
+    """Consultas sobre el log activo y todos sus segmentos rotados, como si fueran un solo log
+
+    Las posiciones son (segmento, línea): el archivo activo es el segmento que
+    sigue al último rotado, así que una posición no cambia cuando el archivo
+    rota. Las consultas recorren los segmentos del más nuevo al más viejo y se
+    detienen al juntar las líneas pedidas; los segmentos comprimidos se
+    descomprimen en memoria al consultarlos y los últimos 'cache' quedan
+    abiertos.
+    """
+
+    def __init__(self, path, cache=4):
+        self.path = path
+        self.cache = cache
+        self.segments = {number: (log_file, index_file) for number, log_file, index_file in list_segments(path)}
+        self.active_number = max(self.segments, default=0) + 1
+        try:
+            self.active = LogViewer(path)
+        except FileNotFoundError:
+            if not self.segments:
+                raise
+            self.active = LogViewer(path, b"")
+        self.views = OrderedDict()
+
+    def numbers(self):
+        """Números de segmento, del más nuevo (el archivo activo) al más viejo"""
+        return [self.active_number] + sorted(self.segments, reverse=True)
+
+    def view(self, number):
+        """Visor del segmento 'number' (lo descomprime la primera vez)"""
+        if number == self.active_number:
+            return self.active
+        view = self.views.get(number)
+        if view is None:
+            log_file, index_file = self.segments[number]
+            view = LogViewer(log_file, read_file(log_file), read_file(index_file))
+            self.views[number] = view
+            if len(self.views) > self.cache:
+                self.views.popitem(last=False)[1].close()
+        else:
+            self.views.move_to_end(number)
+        return view
+
+    def select(self, count=20, before=None, **filters):
+        """Las últimas 'count' líneas que cumplen el filtro antes de la posición 'before' (segmento, línea)
+
+        Retorna una lista de ((segmento, línea), texto) en orden; los filtros
+        son los de LogViewer.select.
+        """
+        entries = []
+        for number in self.numbers():
+            if before is not None and number > before[0]:
+                continue
+            local = before[1] if before is not None and number == before[0] else None
+            found = self.view(number).select(count - len(entries), local, **filters)
+            entries[:0] = [((number, line), text) for line, text in found]
+            if len(entries) >= count:
+                break
+        return entries
+
+    def tail(self, count=20, **filters):
+        """Las últimas 'count' líneas de todo el historial (con filtros opcionales)"""
+        return self.select(count, **filters)
+
+    def label(self, position):
+        """Posición legible: 'actual:12' para el archivo activo o '3:45' para un segmento (líneas desde 1)"""
+        number, line = position
+        return f"{'actual' if number == self.active_number else number}:{line + 1}"
+
+    def parse_position(self, text):
+        """Convierte 'actual:12', '3:45' o '12' (archivo activo) a una posición (segmento, línea)"""
+        segment, sep, line = text.rpartition(":")
+        try:
+            number = self.active_number if segment in ("", "actual") else int(segment)
+            return number, int(line) - 1
+        except ValueError:
+            raise ValueError(f"Posición inválida: {text} (use línea o segmento:línea)") from None
+
+    def close(self):
+        for view in self.views.values():
+            view.close()
+        self.views.clear()
+        self.active.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
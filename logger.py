@@ -0,0 +1,188 @@
+import atexit
+import datetime
+import os
+import queue
+import threading
+import time
+import weakref
+from collections import deque
+from enum import IntEnum
+from log_index import LogIndexWriter, index_path
+
+
+class LogLevel(IntEnum):
+    """Niveles de log: OFF desactiva el registro por completo"""
+    OFF = 0
+    INFO = 1   # Acciones del usuario y del sistema (crear, modificar, configurar)
+    DEBUG = 2  # Eventos por despacho del planificador (ejecución, producción, consumo)
+
+    @classmethod
+    def parse(cls, value):
+        """Convierte un nombre ("info") o un entero al nivel correspondiente"""
+        if isinstance(value, str):
+            try:
+                return cls[value.upper()]
+            except KeyError:
+                raise ValueError(f"Nivel de log desconocido: {value}")
+        return cls(value)
+
+
+# Logs abiertos que se vacían al salir del intérprete
+_open_logs = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_open_logs():
+    for log in list(_open_logs):
+        log.close()
+
+
+class EventLog:
+    """Log de acciones con buffer en memoria y escrituras por lotes
+
+    Cada línea se arma al registrarla y queda en un buffer pendiente que se
+    escribe de una sola vez cada 'batch_size' líneas (o al llamar flush). Las
+    últimas 'capacity' líneas se conservan además en un buffer circular para
+    consultarlas sin leer el archivo. Con background=True las escrituras las
+    hace un hilo aparte. Si se pasa 'clock' (una función que retorna el tiempo
+    simulado), las líneas llevan ese tiempo en lugar de la fecha y hora real.
+    Con index=True cada lote escrito agrega al índice .idx el offset, el
+    tiempo, el PID y el tipo de sus líneas (lo usa log_index.LogViewer). Con
+    'rotation' (un log_rotation.LogRotation) el archivo rota en segmentos
+    después de los lotes que lo llenan, y reset() cierra el log anterior como
+    un segmento en lugar de borrarlo.
+    """
+
+    def __init__(self, path, level=LogLevel.DEBUG, clock=None, batch_size=256, capacity=4096,
+                 background=False, index=True, rotation=None):
+        self.path = path
+        self.level = LogLevel.parse(level)
+        self.clock = clock
+        self.batch_size = batch_size
+        self.recent = deque(maxlen=capacity)  # Buffer circular con las últimas líneas
+        self.pending = []                     # Líneas aún no escritas en disco
+        self.marks = []                       # (tiempo, mensaje) de las líneas pendientes, para el índice
+        self.lock = threading.Lock()
+        self.written = 0                      # Líneas escritas en disco
+        self.index = LogIndexWriter(index_path(path)) if index and path != os.devnull else None
+        self.rotation = rotation
+
+        # Caché del timestamp de reloj real: solo se formatea una vez por segundo
+        self._second = None
+        self._stamp = ""
+
+        self.writer = None
+        self.batches = None
+        if background:
+            self.batches = queue.Queue()
+            self.writer = threading.Thread(target=self._write_loop, name="log-writer", daemon=True)
+            self.writer.start()
+        _open_logs.add(self)
+
+    def enabled(self, level=LogLevel.INFO):
+        """Indica si un mensaje de ese nivel se registraría"""
+        return level <= self.level
+
+    def log(self, action, level=LogLevel.INFO):
+        """Registra una acción; la escritura a disco ocurre por lotes"""
+        if level > self.level:
+            return
+        now = self.clock() if self.clock is not None else time.time()
+        line = f"[{self._timestamp(now)}] {action}\n"
+        with self.lock:
+            self.pending.append(line)
+            if self.index is not None:
+                self.marks.append((now, action))
+            self.recent.append(line)
+            if len(self.pending) >= self.batch_size:
+                self._flush_locked()
+
+    def tail(self, count=None):
+        """Retorna las últimas líneas registradas desde el buffer en memoria"""
+        with self.lock:
+            lines = list(self.recent)
+        return lines if count is None else lines[-count:]
+
+    def flush(self):
+        """Escribe las líneas pendientes (y espera al hilo escritor si lo hay)"""
+        with self.lock:
+            self._flush_locked()
+        if self.batches is not None:
+            self.batches.join()
+
+    def reset(self):
+        """Descarta lo pendiente y trunca el archivo de logs"""
+        with self.lock:
+            self.pending = []
+            self.marks = []
+            self.recent.clear()
+            self.written = 0
+        if self.batches is not None:
+            self.batches.join()
+        if self.rotation is not None:
+            self.rotation.rotate()  # El log anterior se conserva como segmento
+        with open(self.path, "w"):
+            pass
+        if self.index is not None:
+            self.index.reset()
+
+    def close(self):
+        """Vacía el buffer y detiene el hilo escritor"""
+        self.flush()
+        if self.writer is not None:
+            self.batches.put(None)
+            self.writer.join()
+            self.writer = None
+            self.batches = None
+        if self.rotation is not None:
+            self.rotation.close()
+        _open_logs.discard(self)
+
+    def _timestamp(self, now):
+        if self.clock is not None:
+            return f"t={now:.3f}"
+        second = int(now)
+        if second != self._second:
+            self._second = second
+            self._stamp = datetime.datetime.fromtimestamp(second).strftime("%Y-%m-%d %H:%M:%S")
+        return self._stamp
+
+    def _flush_locked(self):
+        if not self.pending:
+            return
+        batch = (self.pending, self.marks)
+        self.pending, self.marks = [], []
+        self.written += len(batch[0])
+        if self.batches is not None:
+            self.batches.put(batch)
+        else:
+            self._write(batch)
+
+    def _write(self, batch):
+        lines, marks = batch
+        if self.index is None:
+            with open(self.path, "ab") as f:
+                f.write("".join(lines).encode())
+                size = f.tell()
+        else:
+            data = [line.encode() for line in lines]
+            with open(self.path, "ab") as f:
+                offset = f.tell()
+                f.write(b"".join(data))
+                size = f.tell()
+            self.index.append(offset, data, marks)  # Después del log: el índice nunca apunta más allá
+        if self.rotation is not None and self.rotation.due(len(lines), size):
+            self.rotation.rotate()
+            if self.index is not None:
+                self.index.reset()
+
+    def _write_loop(self):
+        """Hilo escritor: toma lotes de la cola y los agrega al archivo"""
+        while True:
+            batch = self.batches.get()
+            try:
+                if batch is None:
+                    return
+                self._write(batch)
+            finally:
+                self.batches.task_done()
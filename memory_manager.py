@@ -0,0 +1,344 @@
+import heapq
+import time
+
+POLICIES = ("first-fit", "best-fit", "next-fit", "buddy")
+
+
+def _tree_set(tree, width, index, value):
+    """Fija la hoja 'index' de un árbol de máximos disperso y actualiza sus ancestros en O(log width)
+
+    El árbol es un dict nodo -> máximo del subárbol con la numeración de un
+    heap (raíz 1, hijos 2n y 2n + 1, hojas desde 'width'); los nodos en cero
+    no se guardan, así que ocupa O(hojas usadas * log width) y no depende del
+    tamaño de la memoria.
+    """
+    get = tree.get
+    node = width + index
+    while node and get(node, 0) != value:  # Si un nodo no cambia, sus ancestros tampoco
+        if value:
+            tree[node] = value
+        else:
+            del tree[node]
+        sibling = get(node ^ 1, 0)
+        if sibling > value:
+            value = sibling
+        node >>= 1
+
+
+def _tree_first(tree, width, low, minimum):
+    """Menor índice >= low cuya hoja vale al menos 'minimum', o None, en O(log width)"""
+    if low >= width:
+        return None
+    node = width + low
+    if tree.get(node, 0) < minimum:
+        # Sube hasta el primer hermano derecho que alcance y luego baja siempre por la izquierda posible
+        while node & 1 or tree.get(node | 1, 0) < minimum:
+            node >>= 1
+            if node <= 1:
+                return None
+        node |= 1
+        while node < width:
+            node <<= 1
+            if tree.get(node, 0) < minimum:
+                node |= 1
+    return node - width
+
+
+def _tree_last(tree, width):
+    """Mayor índice con hoja distinta de cero (0 si el árbol está vacío), en O(log width)"""
+    if not tree:
+        return 0
+    node = 1
+    while node < width:
+        node = node << 1 | 1 if node << 1 | 1 in tree else node << 1
+    return node - width
+
+
+class MemoryManager:
+    """Memoria contigua simulada con políticas de asignación seleccionables
+
+    - first-fit / next-fit / best-fit: los huecos se indexan por dirección de
+      inicio y de fin, así que unir vecinos al liberar es O(1). first-fit y
+      next-fit los buscan en un árbol de máximos sobre las direcciones, que da
+      el primer hueco suficiente desde cualquier dirección en O(log total).
+      best-fit usa en cambio un árbol con la cantidad de huecos de cada tamaño
+      y, por tamaño, un heap de direcciones: también elige en O(log total) el
+      hueco más chico que alcanza y, entre los del mismo tamaño, el de menor
+      dirección.
+    - buddy: por orden (potencias de dos), un conjunto de bloques libres y un
+      heap con sus direcciones; asignar y liberar cuestan O(log total). Los
+      heaps descartan las direcciones que ya no están libres al llegar a su tope.
+      Administra la mayor potencia de dos que cabe en la memoria total.
+
+    Reporta fragmentación externa, costo de compactación (KB movidos) y la
+    latencia de cada asignación.
+    """
+
+    def __init__(self, total, policy="first-fit", auto_compact=True):
+        if policy not in POLICIES:
+            raise ValueError(f"Política de memoria desconocida: {policy} (use {', '.join(POLICIES)})")
+        if total <= 0:
+            raise ValueError("La memoria total debe ser mayor que 0")
+        self.total = total
+        self.policy = policy
+        self.auto_compact = auto_compact  # Compactar cuando hay memoria suficiente pero fragmentada
+
+        self.blocks = {}        # Dueño (PID) -> (dirección, tamaño asignado, tamaño pedido)
+        self.used = 0           # KB asignados
+        self.requested = 0      # KB pedidos (difiere de 'used' por el redondeo del buddy)
+
+        # Métricas
+        self.allocations = 0
+        self.failures = 0
+        self.compactions = 0
+        self.compaction_moved = 0
+        self.latency_ns = 0
+        self.max_latency_ns = 0
+
+        if policy == "buddy":
+            self.max_order = total.bit_length() - 1
+            self.managed = 1 << self.max_order
+            self.free_sets = [set() for _ in range(self.max_order + 1)]   # Direcciones libres por orden
+            self.free_heaps = [[] for _ in range(self.max_order + 1)]     # Las mismas (y algunas vencidas) en un heap
+            self._push_buddy(self.max_order, 0)
+        else:
+            self.managed = total
+            self.width = 1 << total.bit_length()  # Hojas de los árboles: direcciones 0..total-1 y tamaños 1..total
+            self._reset_holes(0)
+            self.rover = 0             # Punto de partida de next-fit
+
+    @property
+    def available(self):
+        """KB libres (sin contar la parte que el buddy no administra)"""
+        return self.managed - self.used
+
+    def __contains__(self, owner):
+        return owner in self.blocks
+
+    def address_of(self, owner):
+        """Dirección de inicio del bloque de un dueño, o None si no tiene memoria"""
+        block = self.blocks.get(owner)
+        return block[0] if block else None
+
+    def largest_free(self):
+        """Tamaño del hueco (o bloque buddy) libre más grande"""
+        if self.policy == "buddy":
+            for order in range(self.max_order, -1, -1):
+                if self.free_sets[order]:
+                    return 1 << order
+            return 0
+        if self.policy == "best-fit":
+            return _tree_last(self.size_tree, self.width)
+        return self.hole_tree.get(1, 0)  # La raíz del árbol guarda el hueco más grande
+
+    def max_allocatable(self):
+        """Mayor pedido que se puede atender ahora (compactando si está activado)"""
+        if self.policy != "buddy" and self.auto_compact:
+            return self.available
+        return self.largest_free()
+
+    def free_blocks(self):
+        """Cantidad de huecos libres"""
+        if self.policy == "buddy":
+            return sum(len(free) for free in self.free_sets)
+        return len(self.hole_sizes)
+
+    def external_fragmentation(self):
+        """1 - hueco más grande / memoria libre (0 = sin fragmentación)"""
+        available = self.available
+        return 1 - self.largest_free() / available if available > 0 else 0.0
+
+    def allocate(self, owner, size):
+        """Reserva 'size' KB para 'owner'. Retorna la dirección o None si no hay espacio"""
+        if owner in self.blocks:
+            raise ValueError(f"{owner} ya tiene memoria asignada")
+        start_ns = time.perf_counter_ns()
+        size = max(1, int(-(-size // 1)))  # Redondeo hacia arriba a KB enteros
+        if self.policy == "buddy":
+            address, allocated = self._allocate_buddy(size)
+        else:
+            address, allocated = self._allocate_contiguous(size)
+        elapsed = time.perf_counter_ns() - start_ns
+        self.latency_ns += elapsed
+        self.max_latency_ns = max(self.max_latency_ns, elapsed)
+
+        if address is None:
+            self.failures += 1
+            return None
+        self.allocations += 1
+        self.blocks[owner] = (address, allocated, size)
+        self.used += allocated
+        self.requested += size
+        return address
+
+    def free(self, owner):
+        """Libera la memoria de 'owner'. Retorna los KB liberados (0 si no tenía)"""
+        block = self.blocks.pop(owner, None)
+        if block is None:
+            return 0
+        address, size, requested = block
+        self.used -= size
+        self.requested -= requested
+        if self.policy == "buddy":
+            self._free_buddy(address, size)
+        else:
+            self._insert_hole(address, size)
+        return size
+
+    def compact(self):
+        """Desliza los bloques asignados hacia las direcciones bajas. Retorna los KB movidos"""
+        if self.policy == "buddy":
+            return 0
+        cursor = 0
+        moved = 0
+        for owner, (address, size, requested) in sorted(self.blocks.items(), key=lambda item: item[1][0]):
+            if address != cursor:
+                moved += size
+                self.blocks[owner] = (cursor, size, requested)
+            cursor += size
+        self._reset_holes(cursor)
+        self.rover = cursor
+        self.compactions += 1
+        self.compaction_moved += moved
+        return moved
+
+    def stats(self):
+        """Métricas del administrador en un diccionario serializable"""
+        attempts = self.allocations + self.failures
+        return {
+            "policy": self.policy,
+            "total": self.total,
+            "managed": self.managed,
+            "available": self.available,
+            "largest_free": self.largest_free(),
+            "free_blocks": self.free_blocks(),
+            "external_fragmentation": self.external_fragmentation(),
+            "internal_fragmentation": self.used - self.requested,
+            "allocations": self.allocations,
+            "failures": self.failures,
+            "compactions": self.compactions,
+            "compaction_moved": self.compaction_moved,
+            "avg_allocation_latency_us": self.latency_ns / attempts / 1000 if attempts else 0.0,
+            "max_allocation_latency_us": self.max_latency_ns / 1000,
+        }
+
+    # --- Políticas contiguas ---
+
+    def _allocate_contiguous(self, size):
+        start = self._find_hole(size)
+        if start is None and self.auto_compact and size <= self.available:
+            self.compact()
+            start = self._find_hole(size)
+        if start is None:
+            return None, 0
+        hole = self._remove_hole(start)
+        if hole > size:
+            self._add_hole(start + size, hole - size)
+        self.rover = start + size
+        return start, size
+
+    def _find_hole(self, size):
+        """Dirección del hueco elegido por la política, o None si ninguno alcanza"""
+        if self.policy == "best-fit":
+            fit = _tree_first(self.size_tree, self.width, size, 1)
+            if fit is None:
+                return None
+            heap = self.by_size[fit]
+            while self.hole_sizes.get(heap[0]) != fit:
+                heapq.heappop(heap)  # Dirección de un hueco que ya no existe o cambió de tamaño
+            return heap[0]
+
+        low = self.rover if self.policy == "next-fit" else 0
+        start = _tree_first(self.hole_tree, self.width, low, size)
+        if start is None and low:
+            start = _tree_first(self.hole_tree, self.width, 0, size)  # next-fit da la vuelta
+        return start
+
+    def _reset_holes(self, start):
+        """Deja un único hueco desde 'start' hasta el final (o ninguno si la memoria está llena)"""
+        self.hole_sizes = {}   # Dirección de inicio -> tamaño del hueco
+        self.hole_ends = {}    # Dirección de fin -> dirección de inicio
+        self.hole_tree = {}    # first-fit y next-fit: hoja = dirección, valor = tamaño del hueco
+        self.size_tree = {}    # best-fit: hoja = tamaño, valor = huecos de ese tamaño
+        self.by_size = {}      # best-fit: tamaño -> heap de direcciones
+        if start < self.total:
+            self._add_hole(start, self.total - start)
+
+    def _add_hole(self, start, size):
+        self.hole_sizes[start] = size
+        self.hole_ends[start + size] = start
+        if self.policy != "best-fit":
+            _tree_set(self.hole_tree, self.width, start, size)
+        else:
+            count = self.size_tree.get(self.width + size, 0) + 1
+            _tree_set(self.size_tree, self.width, size, count)
+            heap = self.by_size.setdefault(size, [])
+            heapq.heappush(heap, start)
+            if len(heap) > 2 * count + 16:  # Demasiadas direcciones vencidas: se reconstruye
+                self.by_size[size] = sorted({address for address in heap if self.hole_sizes.get(address) == size})
+
+    def _remove_hole(self, start):
+        size = self.hole_sizes.pop(start)
+        del self.hole_ends[start + size]
+        if self.policy != "best-fit":
+            _tree_set(self.hole_tree, self.width, start, 0)
+        else:
+            count = self.size_tree[self.width + size] - 1
+            _tree_set(self.size_tree, self.width, size, count)
+            if not count:
+                del self.by_size[size]  # Su dirección queda vencida en el heap hasta que salga
+        return size
+
+    def _insert_hole(self, start, size):
+        """Agrega un hueco uniéndolo con los huecos vecinos"""
+        if start + size in self.hole_sizes:
+            size += self._remove_hole(start + size)
+        previous = self.hole_ends.get(start)
+        if previous is not None:
+            size += self._remove_hole(previous)
+            start = previous
+        self._add_hole(start, size)
+
+    # --- Buddy ---
+
+    def _allocate_buddy(self, size):
+        order = max(0, (size - 1).bit_length())
+        if order > self.max_order:
+            return None, 0
+        current = order
+        while current <= self.max_order and not self.free_sets[current]:
+            current += 1
+        if current > self.max_order:
+            return None, 0
+        start = self._pop_buddy(current)  # Dirección más baja del orden
+        while current > order:
+            current -= 1
+            self._push_buddy(current, start + (1 << current))
+        return start, 1 << order
+
+    def _free_buddy(self, start, size):
+        order = size.bit_length() - 1
+        while order < self.max_order:
+            buddy = start ^ (1 << order)
+            free = self.free_sets[order]
+            if buddy not in free:
+                break
+            free.remove(buddy)  # Su dirección queda vencida en el heap hasta que salga
+            start = min(start, buddy)
+            order += 1
+        self._push_buddy(order, start)
+
+    def _push_buddy(self, order, start):
+        free, heap = self.free_sets[order], self.free_heaps[order]
+        free.add(start)
+        heapq.heappush(heap, start)
+        if len(heap) > 2 * len(free) + 16:  # Demasiadas direcciones vencidas: se reconstruye
+            self.free_heaps[order] = sorted(free)
+
+    def _pop_buddy(self, order):
+        free, heap = self.free_sets[order], self.free_heaps[order]
+        while True:
+            start = heapq.heappop(heap)
+            if start in free:
+                free.remove(start)
+                return start
@@ -0,0 +1,208 @@
+class ProcessMetrics:
+    """Marcas de tiempo y acumulados de un proceso"""
+
+    __slots__ = ("arrival", "first_dispatch", "completion", "cpu_time", "blocked_time", "blocked_since",
+                 "blocks", "dispatches")
+
+    def __init__(self, arrival):
+        self.arrival = arrival
+        self.first_dispatch = None
+        self.completion = None
+        self.cpu_time = 0.0
+        self.blocked_time = 0.0
+        self.blocked_since = None  # Momento del último bloqueo mientras siga bloqueado
+        self.blocks = 0
+        self.dispatches = 0
+
+    @property
+    def turnaround_time(self):
+        return None if self.completion is None else self.completion - self.arrival
+
+    @property
+    def response_time(self):
+        return None if self.first_dispatch is None else self.first_dispatch - self.arrival
+
+    @property
+    def waiting_time(self):
+        """Tiempo en la cola de listos: retorno menos CPU recibida y tiempo bloqueado"""
+        turnaround = self.turnaround_time
+        return None if turnaround is None else turnaround - self.cpu_time - self.blocked_time
+
+    def as_dict(self):
+        return {
+            "arrival_time": self.arrival,
+            "first_dispatch_time": self.first_dispatch,
+            "completion_time": self.completion,
+            "response_time": self.response_time,
+            "turnaround_time": self.turnaround_time,
+            "waiting_time": self.waiting_time,
+            "cpu_time": self.cpu_time,
+            "blocked_time": self.blocked_time,
+            "blocks": self.blocks,
+            "dispatches": self.dispatches,
+        }
+
+
+class MetricsCollector:
+    """Métricas de planificación por proceso y del sistema, con costo O(1) por evento
+
+    El simulador avisa llegadas, despachos, bloqueos, desbloqueos y
+    finalizaciones con el tiempo simulado. La ocupación del buffer y de la
+    memoria se integra en el tiempo (nivel x duración) en cada muestra, así que
+    los promedios son ponderados por tiempo sin guardar el historial. Con
+    timeline=True además se conserva cada muestra (t, buffer, memoria). Con
+    varios CPUs el uso de CPU es el promedio entre todos.
+    """
+
+    def __init__(self, buffer_capacity, memory_capacity, timeline=False, cpus=1):
+        self.buffer_capacity = buffer_capacity
+        self.memory_capacity = memory_capacity
+        self.cpus = cpus
+        self.processes = {}       # PID -> ProcessMetrics
+        self.timeline = [] if timeline else None
+
+        self.start = None         # Primera llegada
+        self.busy_time = 0.0      # Tiempo de CPU ocupado
+        self.dispatches = 0
+        self.context_switches = 0
+        self.last_pids = {}       # CPU -> último proceso despachado en él
+
+        self.sampled_at = 0.0     # Momento de la última muestra de ocupación
+        self.buffer_level = 0.0
+        self.memory_level = 0
+        self.buffer_area = 0.0    # Integral de la ocupación del buffer en el tiempo
+        self.memory_area = 0.0
+        self.buffer_peak = 0.0
+        self.memory_peak = 0
+
+    def arrival(self, pid, now):
+        """Un proceso entra al sistema"""
+        self.processes[pid] = ProcessMetrics(now)
+        if self.start is None:
+            self.start = now
+
+    def dispatch(self, pid, now, duration, buffer_used, memory_used, cpu=0):
+        """Un proceso recibe el CPU 'cpu' por 'duration'; registra también la ocupación de ese momento"""
+        self.sample(now, buffer_used, memory_used)
+        record = self.processes.get(pid)
+        if record is not None:
+            if record.first_dispatch is None:
+                record.first_dispatch = now
+            record.cpu_time += duration
+            record.dispatches += 1
+        last_pid = self.last_pids.get(cpu)
+        if last_pid is not None and pid != last_pid:
+            self.context_switches += 1
+        self.last_pids[cpu] = pid
+        self.dispatches += 1
+        self.busy_time += duration
+
+    def block(self, pid, now):
+        """Un proceso pasa a Bloqueado"""
+        record = self.processes.get(pid)
+        if record is not None and record.blocked_since is None:
+            record.blocked_since = now
+            record.blocks += 1
+
+    def unblock(self, pid, now):
+        """Un proceso sale de Bloqueado (sin efecto si no lo estaba)"""
+        record = self.processes.get(pid)
+        if record is not None and record.blocked_since is not None:
+            record.blocked_time += now - record.blocked_since
+            record.blocked_since = None
+
+    def complete(self, pid, now):
+        """Un proceso termina"""
+        record = self.processes.get(pid)
+        if record is not None:
+            self.unblock(pid, now)
+            record.completion = now
+
+    def discard(self, pid):
+        """Olvida las métricas de un proceso eliminado del sistema"""
+        self.processes.pop(pid, None)
+
+    def sample(self, now, buffer_used, memory_used):
+        """Acumula la ocupación vigente hasta 'now' y toma los niveles nuevos"""
+        elapsed = now - self.sampled_at
+        if elapsed > 0:
+            self.buffer_area += self.buffer_level * elapsed
+            self.memory_area += self.memory_level * elapsed
+        self.sampled_at = max(self.sampled_at, now)
+        self.buffer_level = buffer_used
+        self.memory_level = memory_used
+        self.buffer_peak = max(self.buffer_peak, buffer_used)
+        self.memory_peak = max(self.memory_peak, memory_used)
+        if self.timeline is not None:
+            self.timeline.append((now, buffer_used, memory_used))
+
+    def summary(self, now):
+        """Métricas del sistema hasta 'now' en un diccionario serializable"""
+        finished = [r for r in self.processes.values() if r.completion is not None]
+        started = [r for r in self.processes.values() if r.first_dispatch is not None]
+        elapsed = now - self.start if self.start is not None else 0.0
+        # Área hasta 'now' con el nivel vigente
+        tail = max(now - self.sampled_at, 0.0)
+        buffer_area = self.buffer_area + self.buffer_level * tail
+        memory_area = self.memory_area + self.memory_level * tail
+
+        def average(values):
+            values = list(values)
+            return sum(values) / len(values) if values else None
+
+        return {
+            "processes": len(self.processes),
+            "completed": len(finished),
+            "elapsed_time": elapsed,
+            "cpu_utilization": self.busy_time / (elapsed * self.cpus) if elapsed else 0.0,
+            "throughput": len(finished) / elapsed if elapsed else 0.0,
+            "dispatches": self.dispatches,
+            "context_switches": self.context_switches,
+            "avg_waiting_time": average(r.waiting_time for r in finished),
+            "avg_turnaround_time": average(r.turnaround_time for r in finished),
+            "avg_response_time": average(r.response_time for r in started),
+            "avg_blocked_time": average(r.blocked_time for r in finished),
+            "blocks": sum(r.blocks for r in self.processes.values()),
+            "buffer_utilization": buffer_area / (self.buffer_capacity * now) if now and self.buffer_capacity else 0.0,
+            "buffer_peak": self.buffer_peak,
+            "memory_utilization": memory_area / (self.memory_capacity * now) if now and self.memory_capacity else 0.0,
+            "memory_peak": self.memory_peak,
+        }
+
+
+# Métricas que muestra la tabla comparativa, con su etiqueta
+COMPARISON_ROWS = (
+    ("completed", "Procesos completados"),
+    ("elapsed_time", "Tiempo total (s)"),
+    ("avg_waiting_time", "Espera promedio (s)"),
+    ("avg_turnaround_time", "Retorno promedio (s)"),
+    ("avg_response_time", "Respuesta promedio (s)"),
+    ("avg_blocked_time", "Bloqueo promedio (s)"),
+    ("cpu_utilization", "Uso de CPU"),
+    ("throughput", "Rendimiento (proc/s)"),
+    ("context_switches", "Cambios de contexto"),
+    ("buffer_utilization", "Uso promedio del buffer"),
+    ("memory_utilization", "Uso promedio de memoria"),
+)
+
+
+def comparison_table(summaries, rows=COMPARISON_ROWS, decimals=3):
+    """Tabla de texto con una columna por corrida, p. ej. {"FIFO": ..., "Round Robin": ...}
+
+    'rows' son las filas (clave, etiqueta) a mostrar; por omisión, las métricas
+    de planificación. Los valores None se muestran como '-'.
+    """
+    def cell(value):
+        if value is None:
+            return "-"
+        return f"{value:.{decimals}f}" if isinstance(value, float) else str(value)
+
+    names = list(summaries)
+    label_width = max(len(label) for _, label in rows)
+    cells = [[cell(summaries[name][key]) for name in names] for key, _ in rows]
+    widths = [max([len(name)] + [len(row[i]) for row in cells]) for i, name in enumerate(names)]
+
+    lines = [" " * label_width + "  " + "  ".join(name.rjust(w) for name, w in zip(names, widths))]
+    for (_, label), row in zip(rows, cells):
+        lines.append(label.ljust(label_width) + "  " + "  ".join(value.rjust(w) for value, w in zip(row, widths)))
+    return "\n".join(lines)
@@ -0,0 +1,328 @@
+import random
+from collections import OrderedDict
+
+REPLACEMENT = ("fifo", "lru", "clock", "lfu")
+
+
+class FIFOReplacement:
+    """Reemplaza el marco que lleva más tiempo cargado (orden de carga en un dict ordenado)"""
+
+    def __init__(self, frames):
+        self.order = OrderedDict()
+
+    def insert(self, frame):
+        self.order[frame] = None
+
+    def touch(self, frame):
+        pass
+
+    def remove(self, frame):
+        del self.order[frame]
+
+    def victim(self):
+        return self.order.popitem(last=False)[0]
+
+    def state(self):
+        return list(self.order)
+
+    def restore(self, state):
+        self.order = OrderedDict.fromkeys(state)
+
+
+class LRUReplacement(FIFOReplacement):
+    """Reemplaza el marco usado hace más tiempo: cada acceso lo mueve al final del dict ordenado"""
+
+    def touch(self, frame):
+        self.order.move_to_end(frame)
+
+
+class ClockReplacement:
+    """Segunda oportunidad: un bit de referencia por marco y una manecilla que da la vuelta
+
+    El acceso solo enciende el bit. La manecilla apaga los bits encendidos que
+    encuentra y se queda con el primer marco que ya lo tenía apagado, así que
+    cada bit se apaga a lo sumo una vez por acceso: O(1) amortizado.
+    """
+
+    def __init__(self, frames):
+        self.referenced = bytearray(frames)
+        self.loaded = bytearray(frames)
+        self.hand = 0
+
+    def insert(self, frame):
+        self.loaded[frame] = 1
+        self.referenced[frame] = 1
+
+    def touch(self, frame):
+        self.referenced[frame] = 1
+
+    def remove(self, frame):
+        self.loaded[frame] = 0
+        self.referenced[frame] = 0
+
+    def victim(self):
+        referenced, loaded, frames = self.referenced, self.loaded, len(self.loaded)
+        hand = self.hand
+        while not loaded[hand] or referenced[hand]:
+            referenced[hand] = 0
+            hand = (hand + 1) % frames
+        self.hand = (hand + 1) % frames
+        loaded[hand] = 0
+        return hand
+
+    def state(self):
+        return bytes(self.referenced), bytes(self.loaded), self.hand
+
+    def restore(self, state):
+        referenced, loaded, self.hand = state
+        self.referenced, self.loaded = bytearray(referenced), bytearray(loaded)
+
+
+class LFUReplacement:
+    """Reemplaza el marco con menos accesos (entre los empatados, el usado hace más tiempo) en O(1)
+
+    Los marcos se agrupan en dicts ordenados por frecuencia y se recuerda la
+    menor frecuencia presente: un acceso mueve el marco al grupo siguiente y la
+    víctima sale del frente del grupo de menor frecuencia.
+    """
+
+    def __init__(self, frames):
+        self.frequency = {}  # Marco -> accesos desde que se cargó
+        self.groups = {}     # Frecuencia -> marcos con esa frecuencia (dict ordenado)
+        self.minimum = 0
+
+    def insert(self, frame):
+        self.frequency[frame] = 1
+        self.groups.setdefault(1, OrderedDict())[frame] = None
+        self.minimum = 1
+
+    def touch(self, frame):
+        count = self.frequency[frame]
+        group = self.groups[count]
+        del group[frame]
+        if not group:
+            del self.groups[count]
+            if self.minimum == count:
+                self.minimum = count + 1
+        self.frequency[frame] = count + 1
+        self.groups.setdefault(count + 1, OrderedDict())[frame] = None
+
+    def remove(self, frame):
+        count = self.frequency.pop(frame)
+        group = self.groups[count]
+        del group[frame]
+        if not group:
+            del self.groups[count]
+            if self.minimum == count:
+                self.minimum = min(self.groups, default=0)  # Solo al liberar un proceso, no en cada acceso
+
+    def victim(self):
+        group = self.groups[self.minimum]
+        frame = group.popitem(last=False)[0]
+        if not group:
+            del self.groups[self.minimum]  # El marco liberado se carga enseguida con frecuencia 1 (insert)
+        del self.frequency[frame]
+        return frame
+
+    def state(self):
+        return dict(self.frequency), [(count, list(group)) for count, group in self.groups.items()], self.minimum
+
+    def restore(self, state):
+        frequency, groups, self.minimum = state
+        self.frequency = dict(frequency)
+        self.groups = {count: OrderedDict.fromkeys(group) for count, group in groups}
+
+
+POLICY_CLASSES = {"fifo": FIFOReplacement, "lru": LRUReplacement, "clock": ClockReplacement, "lfu": LFUReplacement}
+
+
+class PagedMemory:
+    """Memoria virtual paginada con tablas de páginas por proceso, TLB y paginación por demanda
+
+    La memoria física se divide en marcos de 'page_size' KB y cada proceso ve
+    ceil(memoria / page_size) páginas virtuales que se cargan recién en su
+    primer acceso. Mientras un proceso ejecuta genera 'references' accesos por
+    segundo simulado con localidad: con probabilidad 'locality' cae en una
+    ventana de 'working_set' páginas (más seguido en sus primeras páginas) y
+    si no, salta a otra zona (cambio de fase). Cada acceso consulta la TLB (LRU de 'tlb_size' entradas marcadas con
+    el PID, así que no se vacía al cambiar de proceso), luego la tabla de
+    páginas, y si la página no está cargada hay un fallo: se usa un marco
+    libre o se reemplaza uno según la política. Los fallos cuestan
+    'fault_time' segundos simulados que se suman al turno del proceso.
+    """
+
+    def __init__(self, total, policy="lru", page_size=4, tlb_size=16, references=10, locality=0.99,
+                 working_set=8, memory_time=100e-9, tlb_time=1e-9, fault_time=0.01, seed=None):
+        if policy not in POLICY_CLASSES:
+            raise ValueError(f"Política de reemplazo desconocida: {policy} (use {', '.join(REPLACEMENT)})")
+        if page_size <= 0 or total < page_size:
+            raise ValueError("La memoria debe tener al menos un marco de página")
+        if tlb_size < 1:
+            raise ValueError("La TLB debe tener al menos una entrada")
+        self.total = total
+        self.policy = policy
+        self.page_size = page_size
+        self.frames = int(total // page_size)
+        self.tlb_size = tlb_size
+        self.references = references
+        self.locality = locality
+        self.working_set = working_set
+        self.memory_time = memory_time
+        self.tlb_time = tlb_time
+        self.fault_time = fault_time
+        self.rng = random.Random(seed)  # Generador propio: no altera las cargas del simulador
+
+        self.replacement = POLICY_CLASSES[policy](self.frames)
+        self.tables = {}       # PID -> {página virtual: marco}
+        self.pages = {}        # PID -> páginas virtuales del proceso
+        self.locus = {}        # PID -> primera página de la ventana de localidad actual
+        self.owners = [None] * self.frames        # Marco -> (PID, página)
+        self.free_frames = list(range(self.frames - 1, -1, -1))  # Pila: se entregan desde el marco 0
+        self.tlb = OrderedDict()  # (PID, página) -> marco, en orden de uso
+
+        # Métricas
+        self.accesses = 0
+        self.tlb_hits = 0
+        self.faults = 0
+        self.evictions = 0
+        self.peak_frames = 0
+        self.stall_time = 0.0
+
+    @property
+    def used_frames(self):
+        return self.frames - len(self.free_frames)
+
+    def attach(self, pid, memory):
+        """Crea la tabla de páginas (vacía) de un proceso de 'memory' KB"""
+        self.tables.setdefault(pid, {})
+        self.pages[pid] = max(1, int(-(-memory // self.page_size)))
+        self.locus.setdefault(pid, 0)
+
+    def release(self, pid):
+        """Libera los marcos y las entradas de TLB de un proceso. Retorna los marcos liberados"""
+        table = self.tables.pop(pid, None)
+        self.pages.pop(pid, None)
+        self.locus.pop(pid, None)
+        if not table:
+            return 0
+        for page, frame in table.items():
+            self.replacement.remove(frame)
+            self.owners[frame] = None
+            self.free_frames.append(frame)
+            self.tlb.pop((pid, page), None)
+        return len(table)
+
+    def __contains__(self, pid):
+        return pid in self.tables
+
+    def access(self, pid, page):
+        """Un acceso a la página virtual 'page' del proceso. Retorna True si produjo un fallo de página"""
+        self.accesses += 1
+        key = (pid, page)
+        tlb = self.tlb
+        frame = tlb.get(key)
+        if frame is not None:
+            self.tlb_hits += 1
+            tlb.move_to_end(key)
+            self.replacement.touch(frame)
+            return False
+
+        table = self.tables[pid]
+        frame = table.get(page)
+        fault = frame is None
+        if fault:
+            self.faults += 1
+            frame = self.free_frames.pop() if self.free_frames else self._evict()
+            table[page] = frame
+            self.owners[frame] = key
+            self.replacement.insert(frame)
+            self.peak_frames = max(self.peak_frames, self.frames - len(self.free_frames))
+        else:
+            self.replacement.touch(frame)
+        tlb[key] = frame
+        if len(tlb) > self.tlb_size:
+            tlb.popitem(last=False)
+        return fault
+
+    def _evict(self):
+        """Libera un marco según la política: lo quita de la tabla de su dueño y de la TLB"""
+        frame = self.replacement.victim()
+        pid, page = self.owners[frame]
+        del self.tables[pid][page]
+        self.tlb.pop((pid, page), None)
+        self.evictions += 1
+        return frame
+
+    def run(self, pid, duration):
+        """Simula los accesos de un turno de 'duration' segundos. Retorna los segundos perdidos en fallos"""
+        if pid not in self.tables:
+            return 0.0
+        count = int(duration * self.references)
+        pages, window = self.pages[pid], min(self.working_set, self.pages[pid])
+        locus = self.locus[pid]
+        random_ = self.rng.random
+        access = self.access
+        faults = 0
+        for _ in range(count):
+            if random_() >= self.locality:
+                locus = int(random_() * (pages - window + 1))  # Cambio de fase: otra ventana
+            if access(pid, locus + int(random_() * random_() * window)):  # Sesgado hacia el inicio de la ventana
+                faults += 1
+        self.locus[pid] = locus
+        stall = faults * self.fault_time
+        self.stall_time += stall
+        return stall
+
+    def state(self):
+        """Estado en datos simples para un checkpoint: tablas, marcos, TLB, reemplazo, generador y métricas"""
+        return {
+            "tables": {pid: dict(table) for pid, table in self.tables.items()},
+            "pages": dict(self.pages),
+            "locus": dict(self.locus),
+            "owners": list(self.owners),
+            "free_frames": list(self.free_frames),
+            "tlb": list(self.tlb.items()),
+            "replacement": self.replacement.state(),
+            "rng": self.rng.getstate(),
+            "counters": (self.accesses, self.tlb_hits, self.faults, self.evictions, self.peak_frames,
+                         self.stall_time),
+        }
+
+    def restore(self, state):
+        """Carga un estado de state() en una memoria recién creada con la misma configuración"""
+        self.tables = {pid: dict(table) for pid, table in state["tables"].items()}
+        self.pages = dict(state["pages"])
+        self.locus = dict(state["locus"])
+        self.owners = list(state["owners"])
+        self.free_frames = list(state["free_frames"])
+        self.tlb = OrderedDict(state["tlb"])
+        self.replacement.restore(state["replacement"])
+        self.rng.setstate(state["rng"])
+        (self.accesses, self.tlb_hits, self.faults, self.evictions, self.peak_frames,
+         self.stall_time) = state["counters"]
+
+    def stats(self):
+        """Métricas de la memoria paginada en un diccionario serializable"""
+        accesses = self.accesses
+        hit_rate = self.tlb_hits / accesses if accesses else 0.0
+        fault_rate = self.faults / accesses if accesses else 0.0
+        # Acierto en TLB: TLB + memoria; fallo de TLB: además se lee la tabla de páginas
+        resident = self.tlb_time + self.memory_time + (1 - hit_rate) * self.memory_time
+        effective = (1 - fault_rate) * resident + fault_rate * self.fault_time
+        return {
+            "policy": self.policy,
+            "page_size": self.page_size,
+            "frames": self.frames,
+            "used_frames": self.used_frames,
+            "peak_frames": self.peak_frames,
+            "tlb_size": self.tlb_size,
+            "processes": len(self.tables),
+            "accesses": accesses,
+            "tlb_hits": self.tlb_hits,
+            "tlb_hit_rate": hit_rate,
+            "page_faults": self.faults,
+            "page_fault_rate": fault_rate,
+            "evictions": self.evictions,
+            "effective_access_time_ns": effective * 1e9,
+            "stall_time": self.stall_time,
+        }
@@ -0,0 +1,208 @@
+import math
+from array import array
+from enum import IntEnum
+
+try:
+    import numpy as np
+except ImportError:  # NumPy es opcional: las columnas funcionan solo con el módulo array
+    np = None
+
+
+class _LabeledEnum(IntEnum):
+    """Enumeración entera que se muestra con su etiqueta en español"""
+
+    @property
+    def label(self):
+        return self._labels_[self.value]
+
+    @classmethod
+    def parse(cls, value):
+        """Convierte una etiqueta ("Listo"), un nombre ("READY") o un entero al miembro"""
+        if isinstance(value, cls):
+            return value
+        if isinstance(value, str):
+            for member in cls:
+                if value in (member.label, member.name):
+                    return member
+            raise ValueError(f"{cls.__name__} desconocido: {value}")
+        return cls(value)
+
+    def __str__(self):
+        return self.label
+
+    def __format__(self, spec):
+        return format(self.label, spec)
+
+
+class ProcessState(_LabeledEnum):
+    """Estados de un proceso"""
+    READY = 0
+    RUNNING = 1
+    BLOCKED = 2
+    TERMINATED = 3
+
+ProcessState._labels_ = ("Listo", "Ejecutando", "Bloqueado", "Terminado")
+
+
+class ProcessType(_LabeledEnum):
+    """Tipos de proceso"""
+    NORMAL = 0
+    PRODUCER = 1
+    CONSUMER = 2
+
+ProcessType._labels_ = ("Normal", "Productor", "Consumidor")
+
+
+class Process:
+    """Registro compacto de un proceso (sin __dict__ gracias a __slots__)"""
+
+    __slots__ = ("pid", "state", "priority", "burst_time", "remaining_time", "memory",
+                 "in_memory", "type", "completion_time", "queue", "arrival_time", "affinity", "cpu")
+
+    def __init__(self, pid, priority, burst_time, memory, process_type=ProcessType.NORMAL,
+                 state=ProcessState.READY, remaining_time=None, arrival_time=0.0, affinity=None):
+        self.pid = pid
+        self.state = state
+        self.priority = priority
+        self.burst_time = burst_time
+        self.remaining_time = burst_time if remaining_time is None else remaining_time
+        self.memory = memory
+        self.in_memory = False
+        self.type = process_type
+        self.completion_time = None
+        self.queue = None  # Cola en la que se encuentra el proceso (pertenencia intrusiva)
+        self.arrival_time = arrival_time  # Instante simulado en que entró al sistema
+        self.affinity = affinity  # CPUs en los que puede ejecutar (None = cualquiera)
+        self.cpu = None  # Último CPU en el que ejecutó
+
+    def __repr__(self):
+        return (f"Process(pid={self.pid!r}, type={self.type.label}, state={self.state.label}, "
+                f"priority={self.priority}, remaining={self.remaining_time}/{self.burst_time})")
+
+
+class ProcessColumns:
+    """Tabla de procesos en columnas (struct-of-arrays) para cargas de trabajo grandes
+
+    Cada atributo vive en un array tipado contiguo, de modo que un millón de
+    procesos ocupa unas decenas de MB en lugar de un objeto por proceso. Los PIDs
+    son enteros; al materializar un registro se convierten a texto.
+    """
+
+    COLUMNS = (
+        ("pid", "q"),
+        ("state", "b"),
+        ("type", "b"),
+        ("priority", "b"),
+        ("burst_time", "i"),
+        ("remaining_time", "i"),
+        ("memory", "i"),
+        ("in_memory", "b"),
+        ("completion_time", "d"),  # NaN mientras el proceso no termina
+        ("arrival_time", "d"),
+    )
+
+    def __init__(self):
+        for name, typecode in self.COLUMNS:
+            setattr(self, name, array(typecode))
+
+    def __len__(self):
+        return len(self.pid)
+
+    @property
+    def nbytes(self):
+        """Bytes ocupados por los datos de todas las columnas"""
+        return sum(getattr(self, name).itemsize * len(self) for name, _ in self.COLUMNS)
+
+    def append(self, pid, priority, burst_time, memory, process_type=ProcessType.NORMAL,
+               state=ProcessState.READY, remaining_time=None, in_memory=False, completion_time=None,
+               arrival_time=0.0):
+        """Agrega un proceso al final de la tabla y retorna su índice"""
+        self.pid.append(pid)
+        self.state.append(state)
+        self.type.append(process_type)
+        self.priority.append(priority)
+        self.burst_time.append(burst_time)
+        self.remaining_time.append(burst_time if remaining_time is None else remaining_time)
+        self.memory.append(memory)
+        self.in_memory.append(in_memory)
+        self.completion_time.append(math.nan if completion_time is None else completion_time)
+        self.arrival_time.append(arrival_time)
+        return len(self) - 1
+
+    def extend(self, **columns):
+        """Agrega procesos en bloque: cada argumento es una columna completa (array, lista o arreglo NumPy)
+
+        Las columnas omitidas toman el valor por defecto de append (PIDs
+        consecutivos, Listo, Normal, restante = ráfaga, fuera de memoria, sin
+        terminar, llegada 0). Los arreglos NumPy se copian como bloques de bytes.
+        Retorna el índice del primer proceso agregado.
+        """
+        unknown = set(columns) - {name for name, _ in self.COLUMNS}
+        if unknown:
+            raise ValueError(f"Columnas desconocidas: {', '.join(sorted(unknown))}")
+        if "burst_time" not in columns:
+            raise ValueError("Falta la columna burst_time")
+        sizes = {len(values) for values in columns.values()}
+        if len(sizes) > 1:
+            raise ValueError("Todas las columnas deben tener el mismo largo")
+        start, count = len(self), sizes.pop()
+        defaults = {
+            "pid": range(start, start + count),
+            "state": ProcessState.READY,
+            "type": ProcessType.NORMAL,
+            "remaining_time": columns["burst_time"],
+            "in_memory": 0,
+            "completion_time": math.nan,
+            "arrival_time": 0.0,
+        }
+        for name, typecode in self.COLUMNS:
+            values = columns.get(name, defaults.get(name))
+            if values is None:
+                raise ValueError(f"Falta la columna {name}")
+            column = getattr(self, name)
+            if isinstance(values, (int, float)):
+                values = array(typecode, [values]) * count  # Valor constante
+            if np is not None and isinstance(values, np.ndarray):
+                column.frombytes(np.ascontiguousarray(values, dtype=typecode).tobytes())
+            else:
+                column.extend(values)
+        return start
+
+    def record(self, index):
+        """Materializa la fila 'index' como un Process"""
+        process = Process(str(self.pid[index]), self.priority[index], self.burst_time[index],
+                          self.memory[index], ProcessType(self.type[index]),
+                          ProcessState(self.state[index]), self.remaining_time[index],
+                          self.arrival_time[index])
+        process.in_memory = bool(self.in_memory[index])
+        completion = self.completion_time[index]
+        process.completion_time = None if math.isnan(completion) else completion
+        return process
+
+    def store(self, index, process):
+        """Escribe de vuelta en la fila 'index' el estado dinámico de un Process"""
+        self.state[index] = process.state
+        self.remaining_time[index] = process.remaining_time
+        self.in_memory[index] = process.in_memory
+        self.completion_time[index] = math.nan if process.completion_time is None else process.completion_time
+
+    def records(self):
+        """Genera los procesos de la tabla uno por uno, sin materializarlos todos a la vez"""
+        for index in range(len(self)):
+            yield self.record(index)
+
+    @classmethod
+    def from_processes(cls, processes):
+        """Construye la tabla en columnas a partir de procesos con PID numérico"""
+        table = cls()
+        for p in processes:
+            table.append(int(p.pid), p.priority, p.burst_time, p.memory, p.type, p.state,
+                         p.remaining_time, p.in_memory, p.completion_time, p.arrival_time)
+        return table
+
+    def as_numpy(self):
+        """Vistas NumPy sin copia de cada columna. Requiere NumPy instalado"""
+        if np is None:
+            raise ImportError("as_numpy() requiere NumPy (pip install numpy)")
+        return {name: np.frombuffer(getattr(self, name), dtype=getattr(self, name).typecode)
+                for name, _ in self.COLUMNS}
@@ -0,0 +1,121 @@
+import cProfile
+import functools
+import time
+
+# Fases de run_scheduler y ayudantes del planificador que se cronometran (métodos del simulador)
+PHASES = ("run_scheduler", "load_ready_processes", "check_unblocking_processes", "fifo_scheduler",
+          "round_robin_scheduler", "smp_scheduler", "_execute_process", "run_process", "_clean_queues")
+
+
+class Profiler:
+    """Cronómetros por fase del planificador con perf_counter, llamadas y tiempo propio
+
+    instrument(simulator) reemplaza las fases de PHASES en la instancia por
+    versiones cronometradas, así que un simulador sin perfilador no paga nada.
+    Cada fase acumula llamadas, tiempo total (con las fases anidadas) y tiempo
+    propio (sin ellas); el tiempo propio también se acumula por pila de fases
+    para exportarlo como pilas colapsadas (flamegraph.pl, speedscope). Con
+    cprofile=True además se corre cProfile mientras dura la fase más externa.
+    """
+
+    def __init__(self, cprofile=False, clock=time.perf_counter):
+        self.clock = clock
+        self.stats = {}    # Fase -> [llamadas, segundos totales, segundos propios]
+        self.stacks = {}   # Pila de fases (tupla) -> segundos propios
+        self.frames = []   # Fases abiertas: [pila, inicio, segundos de las fases hijas]
+        self.profile = cProfile.Profile() if cprofile else None
+
+    def instrument(self, simulator, phases=PHASES):
+        """Cronometra las fases de un simulador (métodos que la instancia resuelve por atributo)"""
+        for name in phases:
+            setattr(simulator, name, self.wrap(name, getattr(simulator, name)))
+        return simulator
+
+    def wrap(self, name, function):
+        """Envuelve 'function' para que cada llamada se cuente como la fase 'name'"""
+        @functools.wraps(function)
+        def timed(*args, **kwargs):
+            self.enter(name)
+            try:
+                return function(*args, **kwargs)
+            finally:
+                self.exit(name)
+        return timed
+
+    def enter(self, name):
+        """Abre una fase dentro de la que esté abierta"""
+        frames = self.frames
+        if not frames and self.profile is not None:
+            self.profile.enable()
+        stack = frames[-1][0] + (name,) if frames else (name,)
+        frames.append([stack, self.clock(), 0.0])
+
+    def exit(self, name):
+        """Cierra la fase abierta más reciente y acumula sus tiempos"""
+        now = self.clock()
+        frames = self.frames
+        stack, start, children = frames.pop()
+        elapsed = now - start
+        own = elapsed - children
+        stats = self.stats.get(name)
+        if stats is None:
+            stats = self.stats[name] = [0, 0.0, 0.0]
+        stats[0] += 1
+        if name not in stack[:-1]:  # En una llamada recursiva el total ya lo cuenta la externa
+            stats[1] += elapsed
+        stats[2] += own
+        self.stacks[stack] = self.stacks.get(stack, 0.0) + own
+        if frames:
+            frames[-1][2] += elapsed
+        elif self.profile is not None:
+            self.profile.disable()
+
+    def total(self):
+        """Segundos medidos en las fases más externas"""
+        return sum(self.stacks.values())
+
+    def report(self):
+        """Desglose por fase en orden de tiempo propio: llamadas, segundos totales y propios, y su porción"""
+        total = self.total()
+        breakdown = {}
+        for name, (calls, seconds, own) in sorted(self.stats.items(), key=lambda item: -item[1][2]):
+            breakdown[name] = {
+                "calls": calls,
+                "seconds": seconds,
+                "self_seconds": own,
+                "share": own / total if total else 0.0,
+                "mean_us": seconds / calls * 1e6 if calls else 0.0,
+            }
+        return {"seconds": total, "phases": breakdown}
+
+    def table(self):
+        """Desglose por fase como tabla de texto"""
+        report = self.report()
+        lines = [f"{'Fase':<28} {'Llamadas':>10} {'Total (s)':>10} {'Propio (s)':>11} {'%':>6} {'µs/llamada':>11}"]
+        lines.append("-" * len(lines[0]))
+        for name, phase in report["phases"].items():
+            lines.append(f"{name:<28} {phase['calls']:>10} {phase['seconds']:>10.4f} {phase['self_seconds']:>11.4f} "
+                         f"{phase['share']:>6.1%} {phase['mean_us']:>11.2f}")
+        lines.append(f"Tiempo medido: {report['seconds']:.4f}s")
+        return "\n".join(lines)
+
+    def write_collapsed(self, path):
+        """Escribe las pilas colapsadas ('fase;fase;fase microsegundos' por línea) para un flame graph"""
+        with open(path, "w") as f:
+            for stack, seconds in sorted(self.stacks.items()):
+                micros = round(seconds * 1e6)
+                if micros:
+                    f.write(f"{';'.join(stack)} {micros}\n")
+
+    def write_pstats(self, path):
+        """Escribe las estadísticas de cProfile (se leen con pstats, snakeviz o flameprof)"""
+        if self.profile is None:
+            raise ValueError("El perfilador se creó sin cProfile (use cprofile=True)")
+        self.profile.dump_stats(path)
+
+    def export(self, path):
+        """Exporta según la extensión: .prof/.pstats para cProfile, cualquier otra para pilas colapsadas"""
+        if path.endswith((".prof", ".pstats")):
+            self.write_pstats(path)
+        else:
+            self.write_collapsed(path)
@@ -0,0 +1,306 @@
+import heapq
+from collections import deque
+
+from process import ProcessType
+
+
+class ProcessQueue:
+    """Cola FIFO de procesos con pertenencia intrusiva
+
+    Cada proceso guarda en process.queue la cola en la que está, de modo que
+    consultar la pertenencia, sacarlo o moverlo a otra cola cuesta O(1). Sacar o
+    cancelar una entrada solo la marca como vacía (proceso = None) y la cola
+    descarta las entradas vacías al llegar a ellas.
+    """
+
+    def __init__(self, name):
+        self.name = name
+        self.arrivals = deque()  # Entradas en orden de llegada; el proceso es el último elemento
+        self.entries = {}       # PID -> entrada viva
+        self.dead = 0           # Entradas vaciadas desde la última compactación
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __bool__(self):
+        return bool(self.entries)
+
+    def __contains__(self, process):
+        return process.queue is self
+
+    def __iter__(self):
+        """Recorre los procesos vivos en orden de llegada"""
+        return (entry[-1] for entry in list(self.arrivals) if entry[-1] is not None)
+
+    def __reversed__(self):
+        """Recorre los procesos vivos del más reciente al más antiguo (sin modificar la cola mientras tanto)"""
+        return (entry[-1] for entry in reversed(self.arrivals) if entry[-1] is not None)
+
+    def append(self, process):
+        """Encola un proceso al final, sacándolo antes de la cola en la que estuviera"""
+        current = process.queue
+        if current is self:
+            return
+        if current is not None:
+            current.remove(process)
+        entry = self._new_entry(process)
+        self.entries[process.pid] = entry
+        self.arrivals.append(entry)
+        process.queue = self
+
+    def remove(self, process):
+        """Saca un proceso de la cola en O(1). Lanza ValueError si no está en ella"""
+        if process.queue is not self:
+            raise ValueError(f"Proceso {process.pid} no está en la cola {self.name}")
+        self._take(self.entries[process.pid])
+
+    def discard(self, process):
+        """Saca un proceso si está en la cola, sin error si no lo está"""
+        if process.queue is self:
+            self._take(self.entries[process.pid])
+
+    def popleft(self):
+        """Saca el proceso más antiguo. Lanza IndexError si la cola está vacía"""
+        while self.arrivals:
+            entry = self.arrivals.popleft()
+            if entry[-1] is not None:
+                return self._take(entry)
+        raise IndexError(f"pop from an empty {type(self).__name__}")
+
+    def peek(self):
+        """Retorna el proceso más antiguo sin sacarlo, o None si la cola está vacía"""
+        while self.arrivals and self.arrivals[0][-1] is None:
+            self.arrivals.popleft()
+        return self.arrivals[0][-1] if self.arrivals else None
+
+    def clear(self):
+        """Vacía la cola"""
+        for entry in self.entries.values():
+            entry[-1].queue = None
+        self.arrivals.clear()
+        self.entries.clear()
+        self.dead = 0
+
+    def _new_entry(self, process):
+        """Crea la entrada con la que se encola un proceso"""
+        return [process]
+
+    def _take(self, entry):
+        """Vacía una entrada viva, desliga su proceso y lo retorna"""
+        process = entry[-1]
+        del self.entries[process.pid]
+        process.queue = None
+        entry[-1] = None
+        self.dead += 1
+        if self.dead > 64 and self.dead > len(self.entries):
+            self._compact()
+        return process
+
+    def _compact(self):
+        """Descarta las entradas vacías acumuladas"""
+        self.arrivals = deque(e for e in self.arrivals if e[-1] is not None)
+        self.dead = 0
+
+
+class ReadyQueue(ProcessQueue):
+    """Cola de procesos listos con orden de llegada (FIFO) y orden por prioridad (heap)
+
+    Ambas vistas comparten las mismas entradas [ronda, prioridad, secuencia, proceso],
+    así que insertar y sacar cuestan O(log n) y cancelar O(1) sin recorrer la cola.
+    """
+
+    def __init__(self, name="Listo"):
+        super().__init__(name)
+        self.heap = []          # Entradas ordenadas por (ronda, prioridad, secuencia)
+        self.sequence = 0       # Desempate estable: FIFO dentro de una misma prioridad
+        self.round = 0          # Ronda a la que pertenecen las nuevas entradas
+
+    def pop(self):
+        """Saca el proceso de mayor prioridad (menor número). Lanza IndexError si está vacía"""
+        entry = self._top()
+        if entry is None:
+            raise IndexError("pop from an empty ReadyQueue")
+        heapq.heappop(self.heap)
+        return self._take(entry)
+
+    def start_round(self):
+        """Cierra la ronda actual: lo que se encole desde ahora espera a la siguiente"""
+        self.round += 1
+
+    def pop_round(self):
+        """Saca por prioridad un proceso de la ronda cerrada, o None si ya no quedan"""
+        entry = self._top()
+        if entry is None or entry[0] >= self.round:
+            return None
+        heapq.heappop(self.heap)
+        return self._take(entry)
+
+    def clear(self):
+        """Vacía la cola"""
+        super().clear()
+        self.heap.clear()
+
+    def _new_entry(self, process):
+        """Crea la entrada y la inserta también en el heap de prioridades"""
+        entry = [self.round, process.priority, self.sequence, process]
+        self.sequence += 1
+        heapq.heappush(self.heap, entry)
+        return entry
+
+    def _top(self):
+        """Descarta las entradas vacías de la cima del heap y retorna la primera viva"""
+        heap = self.heap
+        while heap and heap[0][-1] is None:
+            heapq.heappop(heap)
+        return heap[0] if heap else None
+
+    def _compact(self):
+        """Reconstruye ambas vistas solo con las entradas vivas"""
+        super()._compact()
+        self.heap = list(self.arrivals)
+        heapq.heapify(self.heap)
+
+
+class WaitQueue:
+    """Procesos bloqueados esperando que un recurso alcance un umbral
+
+    Las entradas [umbral, secuencia, proceso] viven en un heap ordenado por
+    umbral, así que despertar a los que ya se pueden atender cuesta
+    O(k log n) para k procesos despertados, sin revisar a los demás.
+    """
+
+    def __init__(self, name):
+        self.name = name
+        self.heap = []
+        self.entries = {}   # PID -> entrada viva
+        self.sequence = 0   # Desempate estable: FIFO dentro de un mismo umbral
+        self.dead = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __bool__(self):
+        return bool(self.entries)
+
+    def __contains__(self, process):
+        return process.queue is self
+
+    def __iter__(self):
+        """Recorre los procesos en espera del menor al mayor umbral"""
+        return (entry[-1] for entry in sorted(self.entries.values()))
+
+    def wait(self, process, threshold):
+        """Bloquea un proceso hasta que el recurso llegue a 'threshold' (lo saca de su cola actual)"""
+        if process.queue is not None:
+            process.queue.remove(process)
+        entry = [threshold, self.sequence, process]
+        self.sequence += 1
+        heapq.heappush(self.heap, entry)
+        self.entries[process.pid] = entry
+        process.queue = self
+
+    def remove(self, process):
+        """Saca un proceso de la espera en O(1). Lanza ValueError si no está en ella"""
+        if process.queue is not self:
+            raise ValueError(f"Proceso {process.pid} no está en la cola {self.name}")
+        self._take(self.entries[process.pid])
+
+    def discard(self, process):
+        """Saca un proceso si está en la espera, sin error si no lo está"""
+        if process.queue is self:
+            self._take(self.entries[process.pid])
+
+    def min_threshold(self):
+        """Umbral más bajo entre los procesos en espera, o None si no hay ninguno"""
+        heap = self.heap
+        while heap and heap[0][-1] is None:
+            heapq.heappop(heap)
+        return heap[0][0] if heap else None
+
+    def pop(self):
+        """Saca el proceso con el umbral más bajo. Lanza IndexError si no hay ninguno"""
+        if self.min_threshold() is None:
+            raise IndexError("pop from an empty WaitQueue")
+        return self._take(heapq.heappop(self.heap))
+
+    def wake(self, available):
+        """Saca y retorna, por umbral, los procesos cuyo umbral ya se cumple con 'available'"""
+        woken = []
+        while True:
+            threshold = self.min_threshold()
+            if threshold is None or threshold > available:
+                return woken
+            woken.append(self._take(heapq.heappop(self.heap)))
+
+    def clear(self):
+        """Vacía la espera"""
+        for entry in self.entries.values():
+            entry[-1].queue = None
+        self.heap.clear()
+        self.entries.clear()
+        self.dead = 0
+
+    def _take(self, entry):
+        """Vacía una entrada viva, desliga su proceso y lo retorna"""
+        process = entry[-1]
+        del self.entries[process.pid]
+        process.queue = None
+        entry[-1] = None
+        self.dead += 1
+        if self.dead > 64 and self.dead > len(self.entries):
+            self.heap = list(self.entries.values())
+            heapq.heapify(self.heap)
+            self.dead = 0
+        return process
+
+
+class BlockedQueues:
+    """Procesos bloqueados repartidos en colas de espera según la condición que esperan
+
+    - buffer_space: productores que esperan N KB libres en el buffer
+    - buffer_data: consumidores que esperan N KB de datos en el buffer
+    - memory: procesos que esperan N KB de memoria para cargarse
+    - external: procesos bloqueados por una condición externa (p. ej. desde el menú)
+    """
+
+    def __init__(self):
+        self.buffer_space = WaitQueue("Bloqueado (espacio en buffer)")
+        self.buffer_data = WaitQueue("Bloqueado (datos en buffer)")
+        self.memory = WaitQueue("Bloqueado (memoria)")
+        self.external = ProcessQueue("Bloqueado (condición externa)")
+        self.queues = (self.buffer_space, self.buffer_data, self.memory, self.external)
+
+    def __len__(self):
+        return sum(len(queue) for queue in self.queues)
+
+    def __bool__(self):
+        return any(self.queues)
+
+    def __contains__(self, process):
+        return process.queue in self.queues
+
+    def __iter__(self):
+        for queue in self.queues:
+            yield from queue
+
+    def append(self, process):
+        """Bloquea un proceso con la condición por defecto según su tipo"""
+        if process.queue in self.queues:
+            return
+        if process.type == ProcessType.PRODUCER:
+            self.buffer_space.wait(process, process.memory)
+        elif process.type == ProcessType.CONSUMER:
+            self.buffer_data.wait(process, process.memory)
+        else:
+            self.external.append(process)
+
+    def remove(self, process):
+        """Saca un proceso de la cola de espera en la que esté"""
+        if process.queue not in self.queues:
+            raise ValueError(f"Proceso {process.pid} no está bloqueado")
+        process.queue.remove(process)
+
+    def clear(self):
+        """Vacía todas las colas de espera"""
+        for queue in self.queues:
+            queue.clear()
@@ -0,0 +1,206 @@
+import sys
+from itertools import islice
+from process import ProcessState, ProcessType
+
+HEADER = f"{'PID':<10} {'Tipo':<10} {'Estado':<12} {'Prioridad':<10} {'Memoria':<8} {'Burst':<6} {'Restante':<9}"
+RULE = "-" * 70
+
+
+def format_row(process):
+    """Fila de la tabla de procesos (mismas columnas que el menú original)"""
+    return (f"{process.pid:<10} {process.type:<10} {process.state:<12} {process.priority:<10} "
+            f"{process.memory:<8} {process.burst_time:<6} {process.remaining_time:<9}")
+
+
+def parse_filter(text):
+    """Convierte 'estado=Bloqueado tipo=Productor prioridad=3' en los filtros de ProcessTableView.page
+
+    Acepta también las claves state, type y priority. Un texto vacío quita los filtros.
+    """
+    filters = {}
+    for term in text.split():
+        key, sep, value = term.partition("=")
+        key = key.lower()
+        if not sep or not value:
+            raise ValueError(f"Filtro inválido: {term} (use clave=valor)")
+        if key in ("estado", "state"):
+            filters["state"] = ProcessState.parse(value)
+        elif key in ("tipo", "type"):
+            filters["process_type"] = ProcessType.parse(value)
+        elif key in ("prioridad", "priority"):
+            try:
+                filters["priority"] = int(value)
+            except ValueError:
+                raise ValueError(f"Prioridad inválida: {value}") from None
+        else:
+            raise ValueError(f"Filtro desconocido: {key} (use estado, tipo o prioridad)")
+    return filters
+
+
+def describe_filter(state=None, process_type=None, priority=None):
+    """Texto legible de los filtros activos"""
+    terms = []
+    if state is not None:
+        terms.append(f"estado={state.label}")
+    if process_type is not None:
+        terms.append(f"tipo={process_type.label}")
+    if priority is not None:
+        terms.append(f"prioridad={priority}")
+    return " ".join(terms)
+
+
+class ProcessTableView:
+    """Vista paginada y filtrable de la tabla de procesos con conteos por estado incrementales
+
+    El simulador avisa con touch(pid) cada vez que un proceso se crea, cambia o
+    se elimina. La vista solo vuelve a contar y formatear esos procesos antes de
+    dibujar, así que los conteos cuestan O(cambios). Las filas no tienen índice
+    por posición: la página k salta (sin formatearlas) las k-1 anteriores del
+    filtro, así que mostrarla cuesta O(cambios + k·página). Las primeras
+    páginas, las que se miran en vivo, siguen siendo baratas aunque la tabla
+    tenga cientos de miles de procesos.
+    Con filtro de estado las filas salen en el orden en que los procesos
+    llegaron a ese estado; sin él, en orden de creación.
+    """
+
+    def __init__(self, process_table, page_size=20):
+        if page_size < 1:
+            raise ValueError("El tamaño de página debe ser al menos 1")
+        self.table = process_table
+        self.page_size = page_size
+        self.by_state = {state: {} for state in ProcessState}  # Estado -> PIDs en ese estado (dict ordenado)
+        self.kinds = {}     # PID -> (estado, tipo) con que está contado
+        self.counts = {}    # (estado, tipo) -> procesos
+        self.rows = {}      # PID -> fila ya formateada
+        self.pending = dict.fromkeys(process_table)  # PIDs que cambiaron desde la última sincronización
+
+    def touch(self, pid):
+        """Marca un proceso como cambiado (O(1)); se procesa en la próxima consulta"""
+        self.pending[pid] = None
+
+    def sync(self):
+        """Aplica los cambios pendientes a los conteos, índices y filas formateadas"""
+        table, by_state, kinds, counts, rows = self.table, self.by_state, self.kinds, self.counts, self.rows
+        for pid in self.pending:
+            rows.pop(pid, None)
+            kind = kinds.pop(pid, None)
+            if kind is not None:
+                del by_state[kind[0]][pid]
+                counts[kind] -= 1
+            process = table.get(pid)
+            if process is not None:
+                kind = (process.state, process.type)
+                kinds[pid] = kind
+                by_state[process.state][pid] = None
+                counts[kind] = counts.get(kind, 0) + 1
+        self.pending.clear()
+
+    def state_counts(self):
+        """Procesos por estado, con la etiqueta en español"""
+        self.sync()
+        return {state.label: len(self.by_state[state]) for state in ProcessState}
+
+    def count(self, state=None, process_type=None, priority=None):
+        """Procesos que cumplen el filtro, o None si contarlos exige recorrer la tabla (filtro de prioridad)"""
+        self.sync()
+        if priority is not None:
+            return None
+        return sum(n for (s, t), n in self.counts.items()
+                   if (state is None or s == state) and (process_type is None or t == process_type))
+
+    def select(self, state=None, process_type=None, priority=None):
+        """Genera los procesos que cumplen el filtro, en orden"""
+        self.sync()
+        table = self.table
+        if state is None:
+            processes = iter(table.values())
+        else:
+            processes = (table[pid] for pid in self.by_state[state])
+        if process_type is not None:
+            processes = (p for p in processes if p.type == process_type)
+        if priority is not None:
+            processes = (p for p in processes if p.priority == priority)
+        return processes
+
+    def row(self, process):
+        """Fila formateada de un proceso (se formatea una sola vez hasta que cambie)"""
+        row = self.rows.get(process.pid)
+        if row is None:
+            row = self.rows[process.pid] = format_row(process)
+        return row
+
+    def page(self, number=1, **filters):
+        """Filas de la página 'number' (desde 1), el total de páginas (o None) y si hay una siguiente
+
+        Una página fuera de rango se ajusta a la primera o a la última. Con
+        filtro de prioridad no hay total: la página pedida se recorre tal cual.
+        """
+        number = max(1, number)
+        size = self.page_size
+        total = self.count(**filters)
+        pages = None if total is None else max(1, -(-total // size))
+        if pages is not None:
+            number = min(number, pages)
+        selected = list(islice(self.select(**filters), (number - 1) * size, number * size + 1))
+        has_next = len(selected) > size
+        return number, [self.row(p) for p in selected[:size]], pages, has_next
+
+    def render(self, number=1, **filters):
+        """Líneas de la tabla para la página 'number': conteos por estado, encabezado, filas y pie"""
+        return self.layout(self.page(number, **filters), filters)
+
+    def layout(self, page, filters):
+        """Líneas de una página ya obtenida con page()"""
+        number, rows, pages, has_next = page
+        counts = self.state_counts()
+        lines = ["===== TABLA DE PROCESOS =====",
+                 "  ".join(f"{label}: {n}" for label, n in counts.items()) + f"  (total {len(self.table)})"]
+        description = describe_filter(**filters)
+        if description:
+            lines.append(f"Filtro: {description}")
+        lines += [HEADER, RULE]
+        if rows:
+            lines += rows
+        else:
+            lines.append("(ningún proceso cumple el filtro)" if number == 1 else "(no hay procesos en esta página)")
+        if pages is not None:
+            lines.append(f"Página {number} de {pages}")
+        else:
+            lines.append(f"Página {number}" + (" (hay más)" if has_next else ""))
+        return lines
+
+
+class Screen:
+    """Redibuja en la terminal solo las líneas que cambiaron desde el último cuadro (secuencias ANSI)
+
+    El primer cuadro limpia la pantalla; los siguientes posicionan el cursor en
+    cada línea distinta y la reescriben, y borran lo que quede debajo (el eco
+    de la última entrada del usuario). Las líneas no deben superar el ancho de
+    la terminal.
+    """
+
+    def __init__(self, stream=None):
+        self.stream = stream or sys.stdout
+        self.lines = None
+
+    def reset(self):
+        """Fuerza a que el próximo cuadro se dibuje completo"""
+        self.lines = None
+
+    def draw(self, lines):
+        """Dibuja un cuadro y retorna cuántas líneas se reescribieron"""
+        previous = self.lines
+        out = []
+        if previous is None:
+            out.append("\x1b[H\x1b[2J")
+            previous = ()
+        written = 0
+        for i, line in enumerate(lines):
+            if i >= len(previous) or previous[i] != line:
+                out.append(f"\x1b[{i + 1};1H{line}\x1b[K")
+                written += 1
+        out.append(f"\x1b[{len(lines) + 1};1H\x1b[J")
+        self.stream.write("".join(out))
+        self.stream.flush()
+        self.lines = list(lines)
+        return written
@@ -0,0 +1,161 @@
+from queues import ReadyQueue
+
+# Estrategias de balanceo de carga entre CPUs
+BALANCING = ("steal", "push", "none")
+
+
+def check_affinity(affinity, cpus):
+    """Afinidad como frozenset de los CPUs permitidos que existen (0 a cpus - 1), o None si no hay
+
+    Como con taskset, los CPUs que la máquina simulada no tiene se ignoran;
+    es un error que no quede ninguno.
+    """
+    if affinity is None:
+        return None
+    if not all(isinstance(cpu, int) and cpu >= 0 for cpu in affinity):
+        raise ValueError(f"Afinidad inválida: {list(affinity)} (use números de CPU desde 0)")
+    allowed = frozenset(cpu for cpu in affinity if cpu < cpus)
+    if not allowed:
+        raise ValueError(f"Afinidad inválida: {sorted(affinity)} no incluye ninguno de los CPUs 0-{cpus - 1}")
+    return allowed
+
+
+class Core:
+    """Un CPU simulado con su propia cola de listos"""
+
+    __slots__ = ("index", "run_queue", "current", "busy_time", "dispatches", "migrations", "steals")
+
+    def __init__(self, index):
+        self.index = index
+        self.run_queue = ReadyQueue(f"Listo (CPU {index})")
+        self.current = None     # Proceso en ejecución en este CPU
+        self.busy_time = 0.0
+        self.dispatches = 0
+        self.migrations = 0     # Despachos de procesos que venían de otro CPU
+        self.steals = 0         # Procesos robados de la cola de otro CPU
+
+    @property
+    def load(self):
+        """Procesos asignados a este CPU: los de su cola más el que está ejecutando"""
+        return len(self.run_queue) + (self.current is not None)
+
+    def stats(self, elapsed):
+        return {
+            "cpu": self.index,
+            "busy_time": self.busy_time,
+            "utilization": self.busy_time / elapsed if elapsed else 0.0,
+            "dispatches": self.dispatches,
+            "migrations": self.migrations,
+            "steals": self.steals,
+            "queued": len(self.run_queue),
+        }
+
+
+class Processors:
+    """CPUs simulados con una cola de listos por CPU, afinidad y balanceo de carga
+
+    Un proceso listo vuelve al último CPU en el que ejecutó (su caché sigue
+    caliente) si su afinidad lo permite; uno nuevo va al CPU menos cargado.
+    Balanceo:
+    - steal: un CPU ocioso roba el último proceso de la cola más larga
+    - push: cada proceso que queda listo se encola en el CPU menos cargado
+    - none: los procesos no cambian de CPU después de su primera ubicación
+    """
+
+    def __init__(self, count, balancing="steal"):
+        if count < 1:
+            raise ValueError("Debe haber al menos un CPU")
+        if balancing not in BALANCING:
+            raise ValueError(f"Balanceo desconocido: {balancing} (use {', '.join(BALANCING)})")
+        self.cores = [Core(i) for i in range(count)]
+        self.balancing = balancing
+        self.idle = {core.index: core for core in self.cores}  # CPUs sin proceso en ejecución, en orden
+        self.running = 0
+        self.migrations = 0
+        self.steals = 0
+
+    def __len__(self):
+        return len(self.cores)
+
+    def place(self, process):
+        """Encola un proceso listo en el CPU que le corresponde y retorna ese CPU"""
+        affinity = process.affinity
+        last = process.cpu
+        if last is not None and self.balancing != "push" and (affinity is None or last in affinity):
+            core = self.cores[last]
+        elif affinity is None:
+            core = min(self.cores, key=lambda core: core.load)
+        else:
+            core = min((self.cores[i] for i in sorted(affinity)), key=lambda core: core.load)
+        core.run_queue.append(process)
+        return core
+
+    def next_process(self, core, round_robin):
+        """Saca el próximo proceso de la cola de un CPU, o None si está vacía
+
+        Round Robin recorre la cola en rondas por prioridad (como con un solo
+        CPU); FIFO la atiende en orden de llegada.
+        """
+        queue = core.run_queue
+        if not queue:
+            return None
+        if not round_robin:
+            return queue.popleft()
+        process = queue.pop_round()
+        if process is None:
+            queue.start_round()
+            process = queue.pop_round()
+        return process
+
+    def steal(self, thieves):
+        """Los CPUs ociosos 'thieves' (ya sin nada en su cola) roban trabajo de las colas más largas
+
+        Se toma el proceso más reciente de la víctima, el que más iba a
+        esperar. Retorna los CPUs que consiguieron trabajo.
+        """
+        victims = sorted((core for core in self.cores if core.run_queue), key=lambda core: -len(core.run_queue))
+        fed = []
+        for thief in thieves:
+            for victim in victims:
+                process = next((p for p in reversed(victim.run_queue)
+                                if p.affinity is None or thief.index in p.affinity), None)
+                if process is not None:
+                    thief.run_queue.append(process)  # Lo saca de la cola de la víctima
+                    thief.steals += 1
+                    self.steals += 1
+                    fed.append(thief)
+                    break
+        return fed
+
+    def start(self, core, process, duration):
+        """Registra que 'process' ocupa 'core' durante 'duration'"""
+        if process.cpu is not None and process.cpu != core.index:
+            core.migrations += 1
+            self.migrations += 1
+        process.cpu = core.index
+        core.current = process
+        core.busy_time += duration
+        core.dispatches += 1
+        del self.idle[core.index]
+        self.running += 1
+
+    def release(self, core):
+        """Libera un CPU al terminar el turno y retorna el proceso que ejecutaba"""
+        process = core.current
+        core.current = None
+        self.idle[core.index] = core
+        self.running -= 1
+        return process
+
+    def stats(self, elapsed):
+        """Uso por CPU, migraciones y robos"""
+        cores = [core.stats(elapsed) for core in self.cores]
+        return {
+            "count": len(self.cores),
+            "balancing": self.balancing,
+            "utilization": sum(core.busy_time for core in self.cores) / (elapsed * len(self.cores)) if elapsed else 0.0,
+            "migrations": self.migrations,
+            "steals": self.steals,
+            "cores": cores,
+        }
+
@@ -0,0 +1,121 @@
+import csv
+import itertools
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import ingest
+from Menu_v2 import OperatingSystemSimulator
+from logger import LogLevel
+
+# Columnas de la tabla de resultados, en orden
+COLUMNS = ("algorithm", "quantum", "buffer_size", "memory_size", "cpus", "seed", "simulated_time", "events",
+           "completed", "blocked", "avg_waiting_time", "avg_turnaround_time", "buffer_high_water",
+           "memory_fragmentation", "cpu_utilization", "migrations")
+
+
+def parse_range(value, cast=int):
+    """Convierte "1,2,4" o "inicio:fin[:paso]" (fin incluido) en una lista de valores"""
+    values = []
+    for part in value.split(","):
+        part = part.strip()
+        if ":" in part:
+            bounds = [cast(x) for x in part.split(":")]
+            if len(bounds) not in (2, 3) or (len(bounds) == 3 and bounds[2] <= 0):
+                raise ValueError(f"Rango inválido: {part} (use inicio:fin o inicio:fin:paso)")
+            start, stop, step = bounds[0], bounds[1], bounds[2] if len(bounds) == 3 else 1
+            while start <= stop:
+                values.append(start)
+                start += step
+        elif part:
+            values.append(cast(part))
+    if not values:
+        raise ValueError(f"Rango vacío: {value}")
+    return values
+
+
+def grid(algorithms, quanta, buffer_sizes, memory_sizes, repeats=1, seed=0, cpus=(1,)):
+    """Genera las configuraciones del barrido en un orden fijo
+
+    FIFO no usa quantum, así que aparece una sola vez por combinación. Cada
+    repetición usa la semilla seed + repetición en todas las configuraciones,
+    de modo que todas comparan la misma carga de trabajo.
+    """
+    configs = []
+    for algorithm, buffer_size, memory_size, cpu_count, repeat in itertools.product(
+            algorithms, buffer_sizes, memory_sizes, cpus, range(repeats)):
+        for quantum in (quanta if algorithm == "Round Robin" else [None]):
+            configs.append({"algorithm": algorithm, "quantum": quantum, "buffer_size": buffer_size,
+                            "memory_size": memory_size, "cpus": cpu_count, "seed": seed + repeat})
+    return configs
+
+
+def run_config(workload, config):
+    """Corre una configuración del barrido y retorna su fila de resultados"""
+    simulator = OperatingSystemSimulator(
+        interactive=False,
+        log_file=os.devnull,
+        buffer_size=config["buffer_size"],
+        memory_size=config["memory_size"],
+        seed=config["seed"],
+        log_level=LogLevel.OFF,
+        memory_policy=workload.get("memory_policy", "first-fit"),
+        cpus=config.get("cpus", 1),
+        balancing=workload.get("balancing", "steal"),
+    )
+    simulator.add_workload(workload.get("processes", []))
+    if workload.get("trace"):
+        simulator.feed(ingest.load_trace(workload["trace"]))  # Cada configuración vuelve a leer la traza
+    results = simulator.simulate(config["algorithm"], config["quantum"])
+
+    metrics = results["metrics"]  # Los promedios son los mismos que reportan run y compare
+    return {
+        **config,
+        "simulated_time": results["simulated_time"],
+        "events": results["events"],
+        "completed": metrics["completed"],
+        "blocked": results["states"]["Bloqueado"],
+        "avg_waiting_time": metrics["avg_waiting_time"],
+        "avg_turnaround_time": metrics["avg_turnaround_time"],
+        "buffer_high_water": results["buffer_high_water"],
+        # Con paginación no hay fragmentación externa: cualquier marco libre sirve
+        "memory_fragmentation": results["memory"]["external_fragmentation"] if results["memory"] else 0.0,
+        "cpu_utilization": results["metrics"]["cpu_utilization"],
+        "migrations": results["processors"]["migrations"] if results["processors"] else 0,
+    }
+
+
+def _run_config(job):
+    return run_config(*job)
+
+
+def run_sweep(workload, configs, workers=None):
+    """Reparte las configuraciones entre procesos (todos los núcleos por defecto) y junta las filas en orden"""
+    jobs = [(workload, config) for config in configs]
+    if workers == 1:
+        return [_run_config(job) for job in jobs]
+    workers = workers or os.cpu_count() or 1
+    chunksize = max(1, len(jobs) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(_run_config, jobs, chunksize=chunksize))
+
+
+def format_table(rows):
+    """Tabla de texto alineada con una fila por configuración"""
+    def cell(value):
+        if value is None:
+            return "-"
+        return f"{value:.2f}" if isinstance(value, float) else str(value)
+
+    cells = [[cell(row[name]) for name in COLUMNS] for row in rows]
+    widths = [max([len(name)] + [len(line[i]) for line in cells]) for i, name in enumerate(COLUMNS)]
+    lines = ["  ".join(name.ljust(w) for name, w in zip(COLUMNS, widths))]
+    lines += ["  ".join(value.rjust(w) for value, w in zip(line, widths)) for line in cells]
+    return "\n".join(lines)
+
+
+def write_csv(rows, path):
+    """Guarda la tabla del barrido como CSV"""
+    with open(path, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=COLUMNS)
+        writer.writeheader()
+        writer.writerows(rows)
@@ -0,0 +1,42 @@
+import os
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+import batch_eval
+from Menu_v2 import OperatingSystemSimulator
+
+
+def _simulator(seed, count=40):
+    rng = random.Random(seed)
+    workload = [{"pid": str(i), "type": "Normal", "priority": rng.randint(1, 5), "burst_time": rng.randint(1, 12),
+                 "memory": 16, "arrival_time": rng.choice([0, 0, rng.randint(0, 60)])} for i in range(count)]
+    simulator = OperatingSystemSimulator(interactive=False, log_file=os.devnull, memory_size=1024, seed=seed)
+    simulator.add_workload(workload)
+    return simulator
+
+
+@pytest.mark.parametrize("seed", [1, 2, 3, 4, 5])
+@pytest.mark.parametrize("algorithm,quantum", [("FIFO", None), ("Round Robin", 1), ("Round Robin", 3)])
+def test_cross_check_matches_the_simulator(seed, algorithm, quantum):
+    """El evaluador por lotes reproduce las finalizaciones del simulador, con llegadas escalonadas y CPU ociosa"""
+    assert batch_eval.cross_check(_simulator(seed), algorithm, quantum) == pytest.approx(0.0, abs=1e-9)
+
+
+def test_fifo_schedule_by_hand():
+    """Llegadas 0, 1 y 10 con ráfagas 4, 2 y 3: el CPU queda ocioso entre 6 y 10"""
+    schedule = batch_eval.fifo_schedule([4, 2, 3], [0, 1, 10])
+    assert schedule["completion"].tolist() == [4, 6, 13]
+    assert schedule["waiting"].tolist() == [0, 3, 0]
+    assert batch_eval.summary(schedule)["makespan"] == 13
+
+
+def test_cross_check_rejects_what_it_does_not_model():
+    simulator = OperatingSystemSimulator(interactive=False, log_file=os.devnull, memory_size=1024, seed=1)
+    simulator.add_workload([{"pid": "p", "type": "Productor", "priority": 1, "burst_time": 3, "memory": 16}])
+    with pytest.raises(ValueError):
+        batch_eval.cross_check(simulator)
+    with pytest.raises(ValueError):
+        batch_eval.round_robin_schedule([1, 2], quantum=0)
@@ -0,0 +1,45 @@
+import pytest
+
+from buffer import SharedBuffer
+
+
+def test_ring_has_one_slot_per_kb_and_never_grows():
+    """El anillo tiene tantos espacios como KB de capacidad; lleno de ítems chicos, el productor no cabe"""
+    buffer = SharedBuffer(4)
+    for pid in "abcd":
+        assert buffer.can_produce(0.5)
+        buffer.produce(pid, 0.5)
+    assert len(buffer.pids) == buffer.slots == 4
+    assert buffer.used == 2 and buffer.free == 0 and not buffer.can_produce(0.5)
+    with pytest.raises(OverflowError):
+        buffer.produce("e", 0.5)
+    assert len(buffer.pids) == 4
+
+
+def test_kb_capacity_blocks_before_slots():
+    buffer = SharedBuffer(10)
+    buffer.produce("a", 6)
+    assert buffer.free == 4 and buffer.can_produce(4) and not buffer.can_produce(5)
+
+
+def test_fifo_order_wraps_around_and_keeps_partial_remainder():
+    """Los ítems salen en orden aunque den la vuelta al anillo; el sobrante de un consumo vuelve al frente"""
+    buffer = SharedBuffer(3)
+    buffer.produce("a", 1)
+    buffer.produce("b", 1)
+    assert buffer.pop() == ("a", 1)
+    buffer.produce("c", 1)
+    buffer.produce("d", 1)
+    assert list(buffer) == [("b", 1), ("c", 1), ("d", 1)]
+    assert buffer.consume(1.5) == 1.5
+    assert list(buffer) == [("c", 0.5), ("d", 1)] and buffer.used == 1.5
+    buffer.discard_pids({"c"})
+    assert list(buffer) == [("d", 1)] and buffer.used == 1 and buffer.high_water == 3
+
+
+def test_restore_rejects_more_items_than_slots():
+    buffer = SharedBuffer(2)
+    buffer.restore([("a", 0.5), ("b", 0.5)], 1.0, 2.0)
+    assert list(buffer) == [("a", 0.5), ("b", 0.5)] and buffer.high_water == 2.0
+    with pytest.raises(ValueError):
+        buffer.restore([("a", 0.5)] * 3, 1.5, 2.0)
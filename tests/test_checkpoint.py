@@ -0,0 +1,78 @@
+import os
+
+import pytest
+
+import checkpoint
+from Menu_v2 import OperatingSystemSimulator
+
+TYPES = ["Normal", "Normal", "Productor", "Consumidor"]
+WORKLOAD = [{"pid": f"p{i}", "type": TYPES[i % 4], "priority": 1 + i % 3, "burst_time": 3 + i % 7,
+             "memory": 40 + 37 * i % 160, "arrival_time": i * 0.75} for i in range(40)]
+
+
+def _comparable(results):
+    """Resultados sin las latencias de asignación, que se miden con el reloj real"""
+    results = dict(results, memory=dict(results["memory"]))
+    for name in ("avg_allocation_latency_us", "max_allocation_latency_us"):
+        results["memory"].pop(name)
+    return results
+
+
+def _run(path, **options):
+    simulator = OperatingSystemSimulator(interactive=False, log_file=os.devnull, buffer_size=120, memory_size=600,
+                                         seed=11, checkpoint=path, checkpoint_every=2, **options)
+    simulator.add_workload(WORKLOAD)
+    return simulator
+
+
+@pytest.mark.parametrize("algorithm, quantum", [("FIFO", None), ("Round Robin", 2)])
+@pytest.mark.parametrize("options", [{}, {"memory_policy": "buddy"}, {"memory_policy": "best-fit", "cpus": 2}])
+def test_resume_from_any_frame_matches_uninterrupted_run(tmp_path, algorithm, quantum, options):
+    """Retomar desde un cuadro completo o incremental termina igual que la corrida sin interrupciones"""
+    path = str(tmp_path / "run.ckpt")
+    simulator = _run(path, **options)
+    full = _comparable(simulator.simulate(algorithm, quantum))
+    simulator.checkpoints.close()
+
+    frames = checkpoint.frames(path)
+    kinds = {kind for _, kind, _, _, _, _ in frames}
+    assert len(frames) >= 3 and kinds == {checkpoint.FULL, checkpoint.DELTA}
+    for frame in sorted({0, 1, len(frames) // 2, len(frames) - 1}):
+        resumed = OperatingSystemSimulator.from_checkpoint(path, frame, log_file=os.devnull)
+        assert _comparable(resumed.resume()) == full, f"cuadro {frame}"
+
+
+def test_resume_appends_to_the_same_file_and_ignores_a_torn_frame(tmp_path):
+    """Un cuadro a medio escribir (caída) se descarta y la corrida retomada sigue agregando cuadros"""
+    path = str(tmp_path / "run.ckpt")
+    simulator = _run(path)
+    full = _comparable(simulator.simulate("Round Robin", 2))
+    simulator.checkpoints.close()
+    frames = checkpoint.frames(path)
+    index, _, _, _, offset, length = frames[len(frames) // 2]
+    with open(path, "r+b") as f:
+        f.truncate(offset + length // 2)  # Se cortó en medio del cuadro
+    assert len(checkpoint.frames(path)) == len(frames) // 2
+
+    resumed = OperatingSystemSimulator.from_checkpoint(path, log_file=os.devnull, checkpoint=path,
+                                                       checkpoint_every=2)
+    assert _comparable(resumed.resume()) == full
+    resumed.checkpoints.close()
+    assert [frame[0] for frame in checkpoint.frames(path)] == list(range(len(frames)))
+
+
+def test_branching_keeps_the_saved_prefix(tmp_path):
+    """Bifurcar con otro algoritmo conserva lo ya ejecutado: los procesos terminados no cambian"""
+    path = str(tmp_path / "run.ckpt")
+    simulator = _run(path)
+    simulator.simulate("FIFO")
+    simulator.checkpoints.close()
+    frame = len(checkpoint.frames(path)) // 2
+    state = checkpoint.load(path, frame)
+    finished = {record[0]: record[8] for record in state["processes"] if record[8] is not None}
+    assert finished
+
+    results = OperatingSystemSimulator.from_checkpoint(path, frame, log_file=os.devnull).resume("Round Robin", 1)
+    assert results["algorithm"] == "Round Robin"
+    completion = {p["pid"]: p["completion_time"] for p in results["processes"]}
+    assert all(completion[pid] == time for pid, time in finished.items())
@@ -0,0 +1,70 @@
+import os
+
+import pytest
+
+from event_trace import EventKind, EventTrace, EventTraceWriter
+from Menu_v2 import OperatingSystemSimulator
+
+EVENTS = [
+    (EventKind.ARRIVAL, "a", 0.0, 0.0),
+    (EventKind.ARRIVAL, 7, 0.5, 0.0),
+    (EventKind.DISPATCH, "a", 1.0, 2.0),
+    (EventKind.BLOCK, "a", 3.0, 0.0),
+    (EventKind.DISPATCH, 7, 3.0, 1.5),
+    (EventKind.UNBLOCK, "a", 4.0, 0.0),
+    (EventKind.DISPATCH, "a", 4.5, 1.0),
+    (EventKind.TERMINATE, "a", 5.5, 0.0),
+    (EventKind.TERMINATE, 7, 5.5, 0.0),
+]
+
+
+def _write(path, batch_size=2):
+    writer = EventTraceWriter(path, batch_size=batch_size)
+    for kind, pid, now, value in EVENTS:
+        writer.emit(kind, pid, now, value)
+    assert len(writer) == len(EVENTS)
+    writer.close()
+
+
+def test_round_trip_without_numpy(tmp_path):
+    """Lo escrito por lotes se lee igual, con los PIDs (de cualquier tipo JSON) recuperados del archivo auxiliar"""
+    path = str(tmp_path / "trace.bin")
+    _write(path)
+    with EventTrace(path) as trace:
+        assert len(trace) == len(EVENTS) and trace.pids == ["a", 7]
+        assert list(trace) == [(now, kind, pid, value) for kind, pid, now, value in EVENTS]
+
+
+def test_select_and_summary(tmp_path):
+    np = pytest.importorskip("numpy")
+    path = str(tmp_path / "trace.bin")
+    _write(path, batch_size=100)
+    with EventTrace(path) as trace:
+        assert trace.select(pid=7)["time"].tolist() == [0.5, 3.0, 5.5]
+        assert trace.select(kind=EventKind.DISPATCH, pid="a")["value"].tolist() == [2.0, 1.0]
+        assert trace.select(start=3.0, end=5.5)["kind"].tolist() == [3, 1, 4, 1]
+        assert len(trace.select(pid="desconocido")) == 0  # Sin ValueError
+        summary = trace.summary()
+        assert summary["cpu_time"] == 4.5 and summary["busiest"] == [("a", 3.0), (7, 1.5)]
+        assert summary["by_kind"]["Despacho"] == 3 and (summary["start"], summary["end"]) == (0.0, 5.5)
+        starts, ends, pids = trace.blocked_intervals()
+        assert (starts.tolist(), ends.tolist(), pids.tolist()) == ([3.0], [4.0], [0])
+        assert trace.state_at(4.0) == {"a": "Desbloqueo", 7: "Despacho"}
+        assert np.array_equal(trace.segments()[1], np.array([3.0, 4.5, 5.5]))
+
+
+def test_simulation_trace_accounts_every_burst(tmp_path):
+    pytest.importorskip("numpy")
+    path = str(tmp_path / "run.bin")
+    workload = [{"pid": str(i), "type": "Normal", "priority": 1 + i % 3, "burst_time": 3 + i % 5, "memory": 50,
+                 "arrival_time": i} for i in range(12)]
+    simulator = OperatingSystemSimulator(interactive=False, log_file=os.devnull, memory_size=1024, seed=1,
+                                         event_trace=path)
+    simulator.add_workload(workload)
+    results = simulator.simulate("Round Robin", 2)
+    simulator.event_trace.close()
+    with EventTrace(path) as trace:
+        summary = trace.summary()
+        assert summary["cpu_time"] == pytest.approx(sum(entry["burst_time"] for entry in workload))
+        assert summary["by_kind"]["Terminación"] == results["metrics"]["completed"] == 12
+        assert summary["end"] == pytest.approx(results["simulated_time"])
@@ -0,0 +1,87 @@
+import os
+
+import pytest
+
+import log_index
+from log_index import LogEvent, LogViewer, classify, index_path
+from logger import EventLog
+
+PIDS = ["a1", "b2", "c3", "d4"]
+
+
+def _message(i):
+    pid = PIDS[i % len(PIDS)]
+    return (f"Proceso creado: PID={pid}, Tipo=Normal", f"Proceso {pid} comenzó ejecución",
+            f"Productor {pid} produjo Item-{i}", f"Proceso {pid} terminado", "Sistema en espera")[i % 5]
+
+
+@pytest.fixture
+def log(tmp_path):
+    """Log con tiempo simulado de 300 líneas escritas en lotes de 7, y sus líneas esperadas (tiempo, texto)"""
+    path = str(tmp_path / "system_log.txt")
+    now = [0.0]
+    logger = EventLog(path, clock=lambda: now[0], batch_size=7)
+    lines = []
+    for i in range(300):
+        now[0] = i * 0.5
+        logger.log(_message(i))
+        lines.append((now[0], f"[t={now[0]:.3f}] {_message(i)}"))
+    logger.close()
+    return path, lines
+
+
+def _expected(lines, count, before=None, pid=None, kind=None, start=None, end=None):
+    """Lo que debe retornar select, filtrando todas las líneas una por una"""
+    matches = []
+    for number, (now, text) in enumerate(lines[:before]):
+        line_pid, line_kind = classify(text.partition("] ")[2])
+        if ((pid is None or line_pid == pid) and (kind is None or line_kind == kind)
+                and (start is None or now >= start) and (end is None or now < end)):
+            matches.append((number, text))
+    return matches[-count:] if count else []
+
+
+FILTERS = [{}, {"pid": "b2"}, {"kind": LogEvent.TERMINATE}, {"start": 20, "end": 75.5},
+           {"pid": "c3", "kind": LogEvent.START, "start": 10}, {"pid": "zz"}]
+
+
+@pytest.mark.parametrize("numpy", [True, False])
+@pytest.mark.parametrize("filters", FILTERS)
+def test_select_matches_linear_filter(log, monkeypatch, numpy, filters):
+    """Los filtros por índice (con y sin NumPy) dan lo mismo que revisar cada línea"""
+    path, lines = log
+    if not numpy:
+        monkeypatch.setattr(log_index, "np", None)
+    with LogViewer(path) as viewer:
+        assert len(viewer) == len(lines)
+        assert viewer.select(15, **filters) == _expected(lines, 15, **filters)
+        assert viewer.select(10, before=123, **filters) == _expected(lines, 10, before=123, **filters)
+
+
+def test_paging_backwards_covers_every_line(log):
+    path, lines = log
+    seen = []
+    with LogViewer(path) as viewer:
+        before = None
+        while True:
+            page = viewer.select(40, before=before, kind=LogEvent.CREATE)
+            if not page:
+                break
+            seen[:0] = page
+            before = page[0][0]
+    assert seen == _expected(lines, len(lines), kind=LogEvent.CREATE)
+
+
+def test_missing_or_stale_index_is_rebuilt_on_open(log):
+    """Sin índice, o con líneas que el índice no cubre, el visor indexa en memoria lo que falta"""
+    path, lines = log
+    with open(index_path(path), "rb") as f:
+        partial = f.read()[:log_index.HEADER.size + 100 * log_index.RECORD.size]
+    with open(index_path(path), "wb") as f:
+        f.write(partial)
+    with LogViewer(path) as viewer:
+        assert len(viewer) == len(lines)
+        assert viewer.select(12, pid="a1") == _expected(lines, 12, pid="a1")
+    os.remove(index_path(path))
+    with LogViewer(path) as viewer:
+        assert viewer.select(12, start=100) == _expected(lines, 12, start=100)
@@ -0,0 +1,72 @@
+import os
+
+import pytest
+
+from log_index import LogEvent, classify
+from log_rotation import LogHistory, LogRotation, list_segments, read_file
+from logger import EventLog
+
+
+def _write(path, count, **rotation):
+    """Escribe 'count' líneas con tiempo simulado rotando cada 40 líneas; retorna los textos en orden"""
+    now = [0.0]
+    logger = EventLog(path, clock=lambda: now[0], batch_size=10,
+                      rotation=LogRotation(path, max_lines=40, **rotation))
+    lines = []
+    for i in range(count):
+        now[0] = float(i)
+        action = f"Proceso p{i % 3} terminado" if i % 4 == 0 else f"Proceso p{i % 3} comenzó ejecución"
+        logger.log(action)
+        lines.append(f"[t={now[0]:.3f}] {action}")
+    logger.close()
+    return lines
+
+
+@pytest.mark.parametrize("compress", ["gzip", "lzma", None])
+def test_history_reads_across_segments(tmp_path, compress):
+    """Las consultas ven los segmentos (comprimidos o no) y el archivo activo como un solo log"""
+    path = str(tmp_path / "system_log.txt")
+    lines = _write(path, 230, compress=compress)
+    segments = list_segments(path)
+    assert [number for number, _, _ in segments] == [1, 2, 3, 4, 5]
+    suffix = {"gzip": ".gz", "lzma": ".xz", None: ""}[compress]
+    assert all(log_file.endswith(suffix) for _, log_file, _ in segments)
+    assert b"".join(read_file(log_file) for _, log_file, _ in segments) + read_file(path) == \
+        "".join(line + "\n" for line in lines).encode()
+
+    with LogHistory(path, cache=2) as history:
+        assert [text for _, text in history.tail(100)] == lines[-100:]
+        # Paginar hacia atrás con filtro recorre todos los segmentos sin repetir ni saltar líneas
+        seen, before = [], None
+        while True:
+            page = history.select(7, before=before, pid="p1", kind=LogEvent.TERMINATE, start=15)
+            if not page:
+                break
+            seen[:0] = page
+            before = page[0][0]
+    expected = [line for line in lines if classify(line.partition("] ")[2]) == ("p1", LogEvent.TERMINATE)
+                and float(line[3:line.index("]")]) >= 15]
+    assert [text for _, text in seen] == expected and len(expected) > 7
+    assert history.label(seen[0][0]).split(":")[0].isdigit()
+
+
+def test_positions_survive_rotation(tmp_path):
+    path = str(tmp_path / "system_log.txt")
+    _write(path, 50, compress=None)
+    with LogHistory(path) as history:
+        position, text = history.tail(1)[0]
+        assert history.parse_position(history.label(position)) == position
+    _write(path, 60, compress=None)  # Rota el archivo activo anterior
+    with LogHistory(path) as history:
+        assert history.select(1, before=(position[0], position[1] + 1))[0] == (position, text)
+
+
+def test_retention_drops_oldest_segments(tmp_path):
+    path = str(tmp_path / "system_log.txt")
+    lines = _write(path, 400, compress="gzip", retention=3000)
+    segments = list_segments(path)
+    sizes = sum(os.path.getsize(name) for _, log_file, index_file in segments for name in (log_file, index_file))
+    assert sizes <= 3000 and segments[-1][0] == 10 and segments[0][0] > 1
+    with LogHistory(path) as history:
+        kept = [text for _, text in history.tail(len(lines))]
+    assert 0 < len(kept) < len(lines) and kept == lines[-len(kept):]
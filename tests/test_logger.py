@@ -0,0 +1,94 @@
+import threading
+
+import pytest
+
+from logger import EventLog, LogLevel
+
+
+def _read(path):
+    with open(path) as f:
+        return f.read().splitlines()
+
+
+@pytest.mark.parametrize("background", [False, True])
+def test_close_writes_every_line_in_order(tmp_path, background):
+    """Los lotes (y el hilo escritor) no pierden ni reordenan líneas: close escribe lo pendiente"""
+    path = str(tmp_path / "log.txt")
+    log = EventLog(path, clock=lambda: 1.0, batch_size=7, background=background)
+    for i in range(100):
+        log.log(f"Sistema paso {i}")
+    log.close()
+    assert _read(path) == [f"[t=1.000] Sistema paso {i}" for i in range(100)]
+    assert log.written == 100
+
+
+def test_lines_stay_pending_until_the_batch_fills(tmp_path):
+    path = str(tmp_path / "log.txt")
+    log = EventLog(path, batch_size=5, index=False)
+    for i in range(4):
+        log.log(f"línea {i}")
+    assert not (tmp_path / "log.txt").exists() or _read(path) == []  # Nada escrito todavía
+    log.log("línea 4")
+    assert len(_read(path)) == 5
+    log.log("línea 5")
+    log.flush()
+    assert [line.partition("] ")[2] for line in _read(path)] == [f"línea {i}" for i in range(6)]
+    log.close()
+
+
+def test_concurrent_writers_lose_nothing(tmp_path):
+    """Varios hilos registrando a la vez con escritor en segundo plano: cada hilo conserva su orden"""
+    path = str(tmp_path / "log.txt")
+    log = EventLog(path, clock=lambda: 0.0, batch_size=16, background=True)
+
+    def write(name):
+        for i in range(300):
+            log.log(f"{name} {i}")
+
+    threads = [threading.Thread(target=write, args=(f"h{n}",)) for n in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    log.close()
+    lines = [line.partition("] ")[2].split() for line in _read(path)]
+    assert len(lines) == 1200
+    for n in range(4):
+        assert [int(i) for name, i in lines if name == f"h{n}"] == list(range(300))
+
+
+def test_level_filtering(tmp_path):
+    """INFO descarta los mensajes DEBUG, OFF descarta todo; tail lee el buffer en memoria"""
+    path = str(tmp_path / "log.txt")
+    log = EventLog(path, level="info", clock=lambda: 0.0)
+    assert log.enabled(LogLevel.INFO) and not log.enabled(LogLevel.DEBUG)
+    log.log("configuración", LogLevel.INFO)
+    log.log("despacho", LogLevel.DEBUG)
+    assert [line.strip() for line in log.tail()] == ["[t=0.000] configuración"]
+    log.level = LogLevel.OFF
+    log.log("ignorado", LogLevel.INFO)
+    log.close()
+    assert _read(path) == ["[t=0.000] configuración"]
+    assert LogLevel.parse("DEBUG") is LogLevel.DEBUG and LogLevel.parse(0) is LogLevel.OFF
+    with pytest.raises(ValueError):
+        LogLevel.parse("verbose")
+
+
+def test_tail_keeps_the_last_capacity_lines(tmp_path):
+    log = EventLog(str(tmp_path / "log.txt"), clock=lambda: 0.0, capacity=3)
+    for i in range(10):
+        log.log(f"l{i}")
+    assert [line.split()[-1] for line in log.tail()] == ["l7", "l8", "l9"]
+    assert [line.split()[-1] for line in log.tail(2)] == ["l8", "l9"]
+    log.close()
+
+
+def test_reset_discards_pending_and_truncates(tmp_path):
+    path = str(tmp_path / "log.txt")
+    log = EventLog(path, clock=lambda: 0.0, batch_size=2)
+    for i in range(5):
+        log.log(f"antes {i}")
+    log.reset()
+    log.log("después")
+    log.close()
+    assert _read(path) == ["[t=0.000] después"]
@@ -0,0 +1,78 @@
+import random
+
+import pytest
+
+from memory_manager import MemoryManager
+
+
+def _holes(manager):
+    """Huecos (dirección, tamaño) por dirección, calculados desde los bloques asignados"""
+    holes, cursor = [], 0
+    for address, size, _ in sorted(manager.blocks.values()):
+        if address > cursor:
+            holes.append((cursor, address - cursor))
+        cursor = address + size
+    if cursor < manager.total:
+        holes.append((cursor, manager.total - cursor))
+    return holes
+
+
+def _expected(policy, holes, size, rover):
+    """Dirección que elige cada política recorriendo todos los huecos"""
+    fits = [(start, hole) for start, hole in holes if hole >= size]
+    if not fits:
+        return None
+    if policy == "best-fit":
+        return min(fits, key=lambda fit: (fit[1], fit[0]))[0]
+    if policy == "next-fit":
+        return next((start for start, _ in fits if start >= rover), fits[0][0])
+    return fits[0][0]
+
+
+@pytest.mark.parametrize("policy", ["first-fit", "next-fit", "best-fit"])
+def test_contiguous_policies_match_linear_scan(policy):
+    """Los índices de huecos eligen lo mismo que recorrer la lista completa"""
+    rng = random.Random(policy)
+    manager = MemoryManager(4000, policy, auto_compact=False)
+    live = []
+    for pid in range(5000):
+        if live and rng.random() < 0.45:
+            manager.free(live.pop(rng.randrange(len(live))))
+        else:
+            size = rng.randint(1, 200)
+            expected = _expected(policy, _holes(manager), size, manager.rover)
+            assert manager.allocate(pid, size) == expected
+            if expected is not None:
+                live.append(pid)
+        holes = _holes(manager)
+        assert manager.free_blocks() == len(holes)
+        assert manager.largest_free() == max((hole for _, hole in holes), default=0)
+
+
+def test_compaction_leaves_one_hole():
+    manager = MemoryManager(100, "first-fit")
+    for pid in range(10):
+        manager.allocate(pid, 10)
+    for pid in range(0, 10, 2):
+        manager.free(pid)
+    assert manager.allocate("grande", 30) == 50  # No hay hueco de 30: compacta y lo ubica al final
+    assert manager.compactions == 1 and manager.free_blocks() == 1 and manager.largest_free() == 20
+
+
+def test_buddy_blocks_are_aligned_and_coalesce():
+    """Los bloques buddy son potencias de dos alineadas y al liberar todo vuelve a quedar un solo bloque"""
+    rng = random.Random(7)
+    manager = MemoryManager(1000, "buddy")
+    live = []
+    for pid in range(3000):
+        if live and rng.random() < 0.5:
+            manager.free(live.pop(rng.randrange(len(live))))
+        elif manager.allocate(pid, rng.randint(1, 100)) is not None:
+            live.append(pid)
+        blocks = sorted(manager.blocks.values())
+        for (address, size, requested), following in zip(blocks, blocks[1:] + [(manager.managed, 0, 0)]):
+            assert size & (size - 1) == 0 and address % size == 0 and requested <= size
+            assert address + size <= following[0]
+    for pid in live:
+        manager.free(pid)
+    assert manager.free_blocks() == 1 and manager.largest_free() == manager.managed == 512
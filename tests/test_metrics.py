@@ -0,0 +1,76 @@
+import pytest
+
+import concurrency
+from metrics import COMPARISON_ROWS, MetricsCollector, comparison_table
+
+
+def _schedule():
+    """Dos procesos con un bloqueo, más uno que llega y no llega a ejecutarse
+
+    t=0 a 2: p1 (memoria 100, buffer 0)     t=2 a 3: p2 (300, 10), que se bloquea en 3
+    t=3 a 5: p1 (300, 20), que termina en 5  t=6: p2 se desbloquea; t=6 a 8: p2 (200, 5)
+    """
+    metrics = MetricsCollector(buffer_capacity=40, memory_capacity=400)
+    metrics.arrival("p1", 0)
+    metrics.arrival("p2", 1)
+    metrics.dispatch("p1", 0, 2, 0, 100)
+    metrics.dispatch("p2", 2, 1, 10, 300)
+    metrics.block("p2", 3)
+    metrics.dispatch("p1", 3, 2, 20, 300)
+    metrics.complete("p1", 5)
+    metrics.unblock("p2", 6)
+    metrics.dispatch("p2", 6, 2, 5, 200)
+    metrics.arrival("p3", 7)
+    metrics.complete("p2", 8)
+    return metrics
+
+
+def test_per_process_derivations():
+    """Espera = retorno - CPU - bloqueo; respuesta = primer despacho - llegada"""
+    processes = _schedule().processes
+    assert processes["p1"].as_dict() == {
+        "arrival_time": 0, "first_dispatch_time": 0, "completion_time": 5, "response_time": 0,
+        "turnaround_time": 5, "waiting_time": 1, "cpu_time": 4, "blocked_time": 0, "blocks": 0, "dispatches": 2,
+    }
+    p2 = processes["p2"]
+    assert (p2.response_time, p2.turnaround_time, p2.cpu_time, p2.blocked_time, p2.waiting_time) == (1, 7, 3, 3, 1)
+    assert p2.blocks == 1 and p2.blocked_since is None
+    assert processes["p3"].waiting_time is None and processes["p3"].response_time is None
+
+
+def test_summary_averages_and_time_weighted_occupancy():
+    """Los promedios por proceso cuentan solo terminados (respuesta: despachados); la ocupación se pondera por tiempo"""
+    summary = _schedule().summary(8)
+    assert summary["processes"] == 3 and summary["completed"] == 2
+    assert summary["elapsed_time"] == 8 and summary["dispatches"] == 4 and summary["context_switches"] == 3
+    assert summary["cpu_utilization"] == pytest.approx(7 / 8)
+    assert summary["throughput"] == pytest.approx(2 / 8)
+    assert (summary["avg_waiting_time"], summary["avg_turnaround_time"]) == (1, 6)
+    assert (summary["avg_response_time"], summary["avg_blocked_time"]) == (0.5, 1.5)
+    assert summary["blocks"] == 1
+    # Memoria: 100x2 + 300x1 + 300x3 + 200x2 = 1800 sobre 400x8; buffer: 10x1 + 20x3 + 5x2 = 80 sobre 40x8
+    assert summary["memory_utilization"] == pytest.approx(1800 / 3200) and summary["memory_peak"] == 300
+    assert summary["buffer_utilization"] == pytest.approx(80 / 320) and summary["buffer_peak"] == 20
+
+
+def test_summary_extends_the_current_level_until_now():
+    metrics = MetricsCollector(buffer_capacity=10, memory_capacity=100, timeline=True)
+    metrics.arrival("p", 0)
+    metrics.dispatch("p", 0, 1, 5, 50)
+    assert metrics.summary(4)["memory_utilization"] == pytest.approx(0.5)
+    assert metrics.summary(4)["avg_waiting_time"] is None
+    assert metrics.timeline == [(0, 5, 50)]
+
+
+def test_comparison_table_takes_its_rows():
+    """La misma tabla sirve para las métricas de planificación y para las filas de otro módulo"""
+    summary = _schedule().summary(8)
+    lines = comparison_table({"FIFO": summary, "RR": summary}).splitlines()
+    assert len(lines) == 1 + len(COMPARISON_ROWS) and lines[0].split() == ["FIFO", "RR"]
+    assert lines[3].split()[-2:] == ["1.000", "1.000"] and lines[7].split()[-1] == "0.875"
+
+    rows = (("items", "Ítems"), ("seconds", "Segundos"), ("missing", "Sin dato"))
+    table = comparison_table({"a": {"items": 3, "seconds": 0.5, "missing": None}}, rows, decimals=1)
+    assert table.splitlines()[1:] == ["Ítems       3", "Segundos  0.5", "Sin dato    -"]
+    assert len(concurrency.comparison_table({"x": dict.fromkeys(dict(concurrency.COMPARISON_ROWS), 0.0)})
+               .splitlines()) == 1 + len(concurrency.COMPARISON_ROWS)
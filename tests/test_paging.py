@@ -0,0 +1,151 @@
+import os
+import random
+
+import pytest
+
+import checkpoint
+from Menu_v2 import OperatingSystemSimulator
+from paging import REPLACEMENT, PagedMemory
+
+WORKLOAD = [{"pid": str(i), "type": "Normal", "priority": 1, "burst_time": 20, "memory": 200} for i in range(3)]
+
+
+def _reference_faults(policy, frames, references):
+    """Fallos de página de una política elegida recorriendo todas las páginas cargadas en cada reemplazo
+
+    FIFO: la cargada hace más tiempo; LRU: la usada hace más tiempo; LFU: la
+    de menos accesos desde que se cargó (empate: la usada hace más tiempo);
+    Clock: la manecilla apaga bits de referencia hasta dar con uno apagado.
+    """
+    loaded, last, count, referenced = {}, {}, {}, {}
+    slots, hand, faults = [None] * frames, 0, 0
+    for now, page in enumerate(references):
+        if page in loaded:
+            last[page], count[page], referenced[page] = now, count[page] + 1, 1
+            continue
+        faults += 1
+        if len(loaded) < frames:
+            slot = len(loaded)
+        else:
+            if policy == "fifo":
+                victim = min(loaded, key=lambda q: loaded[q][1])
+            elif policy == "lru":
+                victim = min(loaded, key=lambda q: last[q])
+            elif policy == "lfu":
+                victim = min(loaded, key=lambda q: (count[q], last[q]))
+            else:
+                while referenced[slots[hand]]:
+                    referenced[slots[hand]] = 0
+                    hand = (hand + 1) % frames
+                victim = slots[hand]
+                hand = (hand + 1) % frames
+            slot = loaded.pop(victim)[0]
+        slots[slot] = page
+        loaded[page], last[page], count[page], referenced[page] = (slot, now), now, 1, 1
+    return faults
+
+
+@pytest.mark.parametrize("policy", REPLACEMENT)
+def test_replacement_matches_reference(policy):
+    """Cada política en O(1) produce los mismos fallos que su versión por recorrido completo"""
+    rng = random.Random(policy)
+    for _ in range(30):
+        frames, pages = rng.randint(1, 12), rng.randint(1, 40)
+        references = [rng.randrange(pages) for _ in range(400)]
+        memory = PagedMemory(frames * 4, policy, page_size=4, tlb_size=4)
+        memory.attach("p", pages * 4)
+        faults = sum(memory.access("p", page) for page in references)
+        assert faults == memory.faults == _reference_faults(policy, frames, references)
+        assert memory.evictions == max(0, faults - frames) and memory.used_frames == len(memory.tables["p"])
+
+
+@pytest.mark.parametrize("policy", REPLACEMENT)
+def test_release_returns_frames_and_tlb_entries(policy):
+    memory = PagedMemory(64, policy, page_size=4, tlb_size=8, seed=1)
+    for pid in "abc":
+        memory.attach(pid, 40)
+    for i in range(60):
+        memory.run("abc"[i % 3], 5)
+    held = len(memory.tables["b"])
+    assert memory.release("b") == held and "b" not in memory
+    assert memory.used_frames == sum(len(memory.tables[pid]) for pid in "ac")
+    assert all(pid != "b" for pid, _ in memory.tlb) and all(owner is None or owner[0] != "b"
+                                                            for owner in memory.owners)
+    memory.attach("b", 40)
+    for i in range(60):
+        memory.run("abc"[i % 3], 5)  # Los marcos liberados se reutilizan sin errores
+    assert memory.used_frames <= memory.frames
+
+
+@pytest.mark.parametrize("policy", REPLACEMENT)
+def test_state_restore_continues_identically(policy):
+    """Restaurar el estado en una memoria nueva sigue con los mismos fallos y aciertos de TLB"""
+    original = PagedMemory(128, policy, page_size=4, tlb_size=8, seed=2)
+    for pid in range(4):
+        original.attach(pid, 60)
+    for i in range(40):
+        original.run(i % 4, 3)
+    copy = PagedMemory(128, policy, page_size=4, tlb_size=8, seed=99)
+    copy.restore(original.state())
+    for i in range(40):
+        assert original.run(i % 4, 3) == copy.run(i % 4, 3)
+    assert copy.stats() == original.stats()
+
+
+def _simulate(**options):
+    simulator = OperatingSystemSimulator(interactive=False, log_file=os.devnull, memory_size=256, seed=3, **options)
+    simulator.add_workload(WORKLOAD)
+    return simulator.simulate()
+
+
+@pytest.mark.parametrize("policy", ["fifo", "lru", "clock", "lfu"])
+def test_metrics_report_resident_frames(policy):
+    """Con paginación la ocupación de memoria son los marcos usados por el tamaño de página"""
+    results = _simulate(paging=policy, page_size=4)
+    metrics, paging = results["metrics"], results["paging"]
+
+    assert metrics["memory_peak"] == paging["peak_frames"] * 4 > 0
+    assert 0 < metrics["memory_utilization"] <= 1
+
+
+@pytest.mark.parametrize("policy", ["fifo", "lru", "clock", "lfu"])
+def test_checkpoint_resumes_warm_paging(tmp_path, policy):
+    """Un checkpoint guarda la configuración y el estado de la paginación: la corrida retomada es idéntica"""
+    path = str(tmp_path / "run.ckpt")
+    workload = [{"pid": str(i), "type": "Normal", "priority": 1 + i % 3, "burst_time": 5 + i % 7,
+                 "memory": 100 + 10 * i, "arrival_time": i * 0.5} for i in range(30)]
+    simulator = OperatingSystemSimulator(interactive=False, log_file=os.devnull, memory_size=512, seed=5,
+                                         paging=policy, tlb_size=8, checkpoint=path, checkpoint_every=7)
+    simulator.add_workload(workload)
+    full = simulator.simulate("Round Robin", 2)
+    simulator.checkpoints.close()
+
+    frames = checkpoint.frames(path)
+    resumed = OperatingSystemSimulator.from_checkpoint(path, len(frames) // 2, log_file=os.devnull)
+    assert resumed.paging is not None and resumed.paging.tlb_size == 8
+    assert resumed.paging.accesses > 0  # No retoma con la memoria fría ni los contadores en cero
+    results = resumed.resume()
+
+    assert results["paging"] == full["paging"]
+    assert results["metrics"] == full["metrics"]
+    assert results["processes"] == full["processes"]
+
+
+def test_results_report_paged_memory_instead_of_the_contiguous_manager():
+    """Con paginación lo disponible son los marcos libres y no se informan cifras de la memoria contigua"""
+    simulator = OperatingSystemSimulator(interactive=False, log_file=os.devnull, memory_size=256, seed=3,
+                                         paging="lru", page_size=3)
+    simulator.add_workload(WORKLOAD)
+    for process in simulator.process_table.values():
+        simulator.load_into_memory(process)
+        simulator.paging.run(process.pid, 5)
+    results = simulator.results()
+    paging = results["paging"]
+    assert results["memory"] is None and paging["used_frames"] > 0
+    assert results["memory_available"] == (paging["frames"] - paging["used_frames"]) * 3
+
+    results = simulator.simulate()
+    assert results["memory_available"] == results["paging"]["frames"] * 3 == 255  # Todos terminaron
+
+    contiguous = _simulate()
+    assert contiguous["memory_available"] == contiguous["memory"]["available"] == 256
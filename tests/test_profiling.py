@@ -0,0 +1,88 @@
+import os
+
+import pytest
+
+from Menu_v2 import OperatingSystemSimulator
+from profiling import PHASES, Profiler
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class Work:
+    """Fases de juguete que avanzan el reloj falso: outer dura 1 + 2 x inner (2) + 3 = 8"""
+
+    def __init__(self, clock):
+        self.clock = clock
+
+    def outer(self):
+        self.clock.now += 1
+        self.inner()
+        self.inner()
+        self.clock.now += 3
+
+    def inner(self):
+        self.clock.now += 2
+
+    def countdown(self, n):
+        self.clock.now += 1
+        if n:
+            self.countdown(n - 1)
+
+
+def _profiled():
+    clock = FakeClock()
+    profiler = Profiler(clock=clock)
+    work = profiler.instrument(Work(clock), phases=("outer", "inner", "countdown"))
+    return profiler, work
+
+
+def test_phase_totals_and_self_time():
+    """El total de una fase incluye sus hijas, el tiempo propio no; el total medido es el de las fases externas"""
+    profiler, work = _profiled()
+    work.outer()
+    work.inner()
+    report = profiler.report()
+    assert report["seconds"] == 10
+    assert report["phases"]["outer"] == {"calls": 1, "seconds": 8, "self_seconds": 4, "share": 0.4,
+                                         "mean_us": 8e6}
+    assert report["phases"]["inner"] == {"calls": 3, "seconds": 6, "self_seconds": 6, "share": 0.6,
+                                         "mean_us": 2e6}
+    assert list(report["phases"]) == ["inner", "outer"]  # Por tiempo propio
+    assert profiler.stacks == {("outer",): 4, ("outer", "inner"): 4, ("inner",): 2}
+
+
+def test_recursion_counts_the_total_once(tmp_path):
+    profiler, work = _profiled()
+    work.countdown(3)
+    calls, seconds, own = profiler.stats["countdown"]
+    assert (calls, seconds, own) == (4, 4, 4) and profiler.total() == 4
+    path = str(tmp_path / "stacks.txt")
+    profiler.write_collapsed(path)
+    with open(path) as f:
+        assert f.read().splitlines() == [";".join(["countdown"] * depth) + " 1000000" for depth in range(1, 5)]
+
+
+def test_exceptions_still_close_the_phase():
+    profiler, work = _profiled()
+    work.inner = profiler.wrap("broken", lambda: 1 / 0)
+    with pytest.raises(ZeroDivisionError):
+        work.inner()
+    assert profiler.frames == [] and profiler.stats["broken"][0] == 1
+    with pytest.raises(ValueError):
+        profiler.write_pstats(os.devnull)
+
+
+def test_simulator_reports_its_phases():
+    simulator = OperatingSystemSimulator(interactive=False, log_file=os.devnull, memory_size=1024, seed=2, profile=True)
+    simulator.add_workload([{"pid": str(i), "type": "Normal", "priority": 1, "burst_time": 4, "memory": 50}
+                            for i in range(10)])
+    profile = simulator.simulate("Round Robin", 2)["profile"]
+    assert set(profile["phases"]) <= set(PHASES) and profile["phases"]["run_scheduler"]["calls"] >= 1
+    assert profile["seconds"] == pytest.approx(profile["phases"]["run_scheduler"]["seconds"])
+    assert sum(phase["share"] for phase in profile["phases"].values()) == pytest.approx(1.0)
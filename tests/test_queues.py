@@ -0,0 +1,142 @@
+import random
+
+import pytest
+
+from process import Process, ProcessType
+from queues import BlockedQueues, ProcessQueue, ReadyQueue, WaitQueue
+
+
+def _processes(priorities):
+    return [Process(f"p{i}", priority, 5, 64) for i, priority in enumerate(priorities)]
+
+
+def _drain(queue):
+    order = []
+    while queue:
+        order.append(queue.pop().pid)
+    return order
+
+
+def test_ready_queue_is_fifo_within_a_priority():
+    """Entre procesos de igual prioridad sale primero el que llegó antes"""
+    queue = ReadyQueue()
+    for process in _processes([2, 1, 2, 1, 3, 2]):
+        queue.append(process)
+    assert _drain(queue) == ["p1", "p3", "p0", "p2", "p5", "p4"]
+    assert [p.pid for p in queue] == []
+
+
+def test_remove_from_the_middle_keeps_both_orders():
+    queue = ReadyQueue()
+    processes = _processes([1, 1, 1, 2, 2])
+    for process in processes:
+        queue.append(process)
+    queue.remove(processes[1])
+    queue.discard(processes[3])
+    queue.discard(processes[3])  # Ya no está: sin error
+    assert processes[1].queue is None and processes[1] not in queue and len(queue) == 3
+    assert [p.pid for p in queue] == ["p0", "p2", "p4"]
+    with pytest.raises(ValueError):
+        queue.remove(processes[1])
+    assert _drain(queue) == ["p0", "p2", "p4"]
+
+
+def test_reinserting_a_cancelled_process_goes_to_the_back():
+    """La entrada cancelada queda vacía en el heap: el proceso reinsertado sale una sola vez y como recién llegado"""
+    queue = ReadyQueue()
+    processes = _processes([1, 1, 1])
+    for process in processes:
+        queue.append(process)
+    queue.remove(processes[0])
+    queue.append(processes[0])
+    assert processes[0].queue is queue and len(queue) == 3
+    assert [p.pid for p in queue] == ["p1", "p2", "p0"]
+    assert _drain(queue) == ["p1", "p2", "p0"]
+    with pytest.raises(IndexError):
+        queue.pop()
+
+
+def test_append_moves_a_process_between_queues():
+    ready, executing = ReadyQueue(), ProcessQueue("Ejecutando")
+    process = _processes([1])[0]
+    ready.append(process)
+    executing.append(process)
+    executing.append(process)  # Ya está: no se duplica
+    assert process.queue is executing and not ready and len(executing) == 1
+    assert ready._top() is None
+
+
+def test_rounds_hold_back_late_arrivals():
+    """Lo que se encola después de start_round espera a la ronda siguiente aunque tenga más prioridad"""
+    queue = ReadyQueue()
+    first = _processes([3, 2])
+    for process in first:
+        queue.append(process)
+    queue.start_round()
+    late = Process("late", 1, 5, 64)
+    queue.append(late)
+    assert [queue.pop_round().pid, queue.pop_round().pid, queue.pop_round()] == ["p1", "p0", None]
+    queue.start_round()
+    assert queue.pop_round() is late
+
+
+def test_matches_a_sorted_reference_under_random_churn():
+    """Con muchas altas y bajas (compactaciones incluidas) el orden es el de (prioridad, llegada)"""
+    rng = random.Random(3)
+    queue = ReadyQueue()
+    live, order = {}, {}
+    for step in range(3000):
+        if live and rng.random() < 0.3:
+            process = rng.choice(list(live.values()))
+            queue.remove(process)
+            del live[process.pid]
+        elif live and rng.random() < 0.2:
+            process = queue.pop()
+            expected = min(live.values(), key=lambda p: (p.priority, order[p.pid]))
+            assert process is expected
+            del live[process.pid]
+        else:
+            process = Process(f"p{step}", rng.randint(1, 5), 5, 64)
+            queue.append(process)
+            live[process.pid] = process
+            order[process.pid] = step
+        assert len(queue) == len(live)
+    assert queue.dead <= max(64, len(queue))
+
+
+def test_wait_queue_wakes_by_threshold_then_arrival():
+    """wake saca, en orden de umbral y entre iguales por llegada, solo a los que ya alcanza el recurso"""
+    queue = WaitQueue("memoria")
+    processes = _processes([1] * 6)
+    for process, threshold in zip(processes, [50, 20, 80, 20, 50, 10]):
+        queue.wait(process, threshold)
+    assert queue.min_threshold() == 10
+    assert [p.pid for p in queue.wake(50)] == ["p5", "p1", "p3", "p0", "p4"]
+    assert all(p.queue is None for p in processes[:2]) and processes[2].queue is queue
+    assert queue.wake(79) == [] and queue.min_threshold() == 80
+    queue.remove(processes[2])
+    assert queue.min_threshold() is None and queue.wake(1000) == []
+
+
+def test_wait_queue_skips_cancelled_waiters():
+    queue = WaitQueue("datos")
+    processes = _processes([1] * 3)
+    for process, threshold in zip(processes, [5, 10, 15]):
+        queue.wait(process, threshold)
+    queue.discard(processes[0])
+    queue.wait(processes[0], 20)  # Vuelve a esperar con otro umbral
+    assert [p.pid for p in queue.wake(20)] == ["p1", "p2", "p0"]
+
+
+def test_blocked_queues_route_by_process_type():
+    blocked = BlockedQueues()
+    producer = Process("prod", 1, 5, 30, ProcessType.PRODUCER)
+    consumer = Process("cons", 1, 5, 40, ProcessType.CONSUMER)
+    normal = Process("norm", 1, 5, 50)
+    for process in (producer, consumer, normal):
+        blocked.append(process)
+    assert producer.queue is blocked.buffer_space and consumer.queue is blocked.buffer_data
+    assert normal.queue is blocked.external and len(blocked) == 3
+    assert blocked.buffer_space.min_threshold() == 30 and blocked.buffer_data.min_threshold() == 40
+    blocked.remove(consumer)
+    assert consumer not in blocked and len(blocked) == 2
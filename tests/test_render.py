@@ -0,0 +1,79 @@
+import io
+
+import pytest
+
+from process import Process, ProcessState, ProcessType
+from render import ProcessTableView, Screen, parse_filter
+
+
+def _table(count):
+    """PIDs p0..p{count-1}; prioridad 1 + i % 3; los múltiplos de 4 son Productores"""
+    return {f"p{i}": Process(f"p{i}", 1 + i % 3, 5, 64, ProcessType.PRODUCER if i % 4 == 0 else ProcessType.NORMAL)
+            for i in range(count)}
+
+
+def _pids(rows):
+    return [row.split()[0] for row in rows]
+
+
+@pytest.mark.parametrize("count,pages", [(0, 1), (1, 1), (9, 1), (10, 1), (11, 2), (30, 3), (31, 4)])
+def test_page_count_boundaries(count, pages):
+    view = ProcessTableView(_table(count), page_size=10)
+    number, rows, total, has_next = view.page(pages)
+    assert total == pages and number == pages and not has_next
+    assert len(rows) == (count - 10 * (pages - 1) if count else 0)
+
+
+def test_pages_cover_the_table_once_and_clamp_out_of_range():
+    table = _table(25)
+    view = ProcessTableView(table, page_size=10)
+    seen = []
+    for number in (1, 2, 3):
+        page, rows, pages, has_next = view.page(number)
+        assert (page, pages, has_next) == (number, 3, number < 3)
+        seen += _pids(rows)
+    assert seen == list(table)
+    assert view.page(0)[0] == 1 and view.page(99)[0] == 3 and _pids(view.page(99)[1]) == seen[20:]
+
+
+def test_filters_follow_touched_changes():
+    """Con filtro de estado las filas salen en el orden en que llegaron al estado; touch mantiene los conteos"""
+    table = _table(12)
+    view = ProcessTableView(table, page_size=2)
+    for pid in ("p7", "p2", "p9"):
+        table[pid].state = ProcessState.BLOCKED
+        view.touch(pid)
+    assert view.count(state=ProcessState.BLOCKED) == 3
+    number, rows, pages, has_next = view.page(2, state=ProcessState.BLOCKED)
+    assert (number, _pids(rows), pages, has_next) == (2, ["p9"], 2, False)
+    assert view.count(process_type=ProcessType.PRODUCER) == 3
+    assert view.count(state=ProcessState.BLOCKED, process_type=ProcessType.NORMAL) == 3
+
+    del table["p2"]
+    view.touch("p2")
+    assert view.state_counts() == {"Listo": 9, "Ejecutando": 0, "Bloqueado": 2, "Terminado": 0}
+
+
+def test_priority_filter_pages_without_a_total():
+    view = ProcessTableView(_table(12), page_size=3)
+    number, rows, pages, has_next = view.page(1, priority=2)
+    assert (_pids(rows), pages, has_next) == (["p1", "p4", "p7"], None, True)
+    number, rows, pages, has_next = view.page(2, priority=2)
+    assert (_pids(rows), has_next) == (["p10"], False)
+    assert view.render(5, priority=2)[-2:] == ["(no hay procesos en esta página)", "Página 5"]
+
+
+def test_parse_filter():
+    assert parse_filter("estado=Bloqueado tipo=Productor prioridad=3") == {
+        "state": ProcessState.BLOCKED, "process_type": ProcessType.PRODUCER, "priority": 3}
+    assert parse_filter("") == {}
+    for text in ("estado", "color=rojo", "prioridad=alta"):
+        with pytest.raises(ValueError):
+            parse_filter(text)
+
+
+def test_screen_redraws_only_changed_lines():
+    screen = Screen(io.StringIO())
+    assert screen.draw(["a", "b", "c"]) == 3
+    assert screen.draw(["a", "x", "c"]) == 1
+    assert screen.draw(["a", "x"]) == 0
@@ -0,0 +1,84 @@
+import os
+import random
+
+import pytest
+
+from Menu_v2 import OperatingSystemSimulator
+from process import Process
+from smp import Processors, check_affinity
+
+
+def _process(pid, affinity=None):
+    return Process(pid, 1, 5, 64, affinity=affinity)
+
+
+def test_check_affinity_ignores_missing_cpus():
+    assert check_affinity(None, 4) is None
+    assert check_affinity([1, 7], 4) == frozenset({1})
+    with pytest.raises(ValueError):
+        check_affinity([5, 6], 4)
+    with pytest.raises(ValueError):
+        check_affinity([-1], 4)
+
+
+def test_steal_takes_the_newest_process_the_thief_may_run():
+    """El CPU ocioso roba de la cola más larga el proceso más reciente, salteando los fijados a otro CPU"""
+    cpus = Processors(3)
+    busy = cpus.cores[0]
+    processes = [_process("libre1"), _process("libre2"), _process("fijo", frozenset({0}))]
+    for process in processes:
+        busy.run_queue.append(process)
+    cpus.cores[2].run_queue.append(_process("otro"))
+
+    thief = cpus.cores[1]
+    assert cpus.steal([thief]) == [thief]
+    assert [p.pid for p in thief.run_queue] == ["libre2"] and processes[1].queue is thief.run_queue
+    assert cpus.steal([thief]) == [thief]
+    assert [p.pid for p in busy.run_queue] == ["fijo"] and [p.pid for p in thief.run_queue] == ["libre2", "libre1"]
+    assert cpus.steals == thief.steals == 2
+
+
+def test_nothing_to_steal_for_a_cpu_outside_every_affinity():
+    cpus = Processors(2)
+    for i in range(3):
+        cpus.cores[0].run_queue.append(_process(f"p{i}", frozenset({0})))
+    assert cpus.steal([cpus.cores[1]]) == [] and len(cpus.cores[0].run_queue) == 3 and cpus.steals == 0
+
+
+def test_place_respects_affinity_and_prefers_the_last_cpu():
+    cpus = Processors(4)
+    pinned = _process("fijo", frozenset({2, 3}))
+    for i in range(6):
+        cpus.place(_process(f"p{i}"))
+    assert cpus.place(pinned).index in (2, 3)
+    warm = _process("caliente")
+    warm.cpu = 1
+    assert cpus.place(warm).index == 1
+    assert Processors(4, "push").place(warm).index == 0  # push ignora el CPU anterior: va al menos cargado
+
+
+@pytest.mark.parametrize("algorithm", ["FIFO", "Round Robin"])
+def test_simulation_never_runs_a_process_outside_its_affinity(algorithm):
+    """Con robos de trabajo incluidos, cada despacho ocurre en un CPU permitido y todos terminan"""
+    rng = random.Random(4)
+    workload = []
+    for i in range(40):
+        affinity = rng.choice([None, None, [0], [1, 2], [3]])
+        workload.append({"pid": str(i), "type": "Normal", "priority": rng.randint(1, 4),
+                         "burst_time": rng.randint(1, 15), "memory": 20, "affinity": affinity})
+    simulator = OperatingSystemSimulator(interactive=False, log_file=os.devnull, memory_size=2048, seed=4, cpus=4)
+    simulator.add_workload(workload)
+
+    dispatched = []
+    start = simulator.processors.start
+
+    def record(core, process, duration):
+        dispatched.append((core.index, process.affinity))
+        start(core, process, duration)
+
+    simulator.processors.start = record
+    results = simulator.simulate(algorithm, 2)
+    assert results["metrics"]["completed"] == 40
+    assert dispatched and all(affinity is None or cpu in affinity for cpu, affinity in dispatched)
+    stats = results["processors"]
+    assert stats["steals"] > 0 and stats["steals"] == sum(core["steals"] for core in stats["cores"])
@@ -0,0 +1,79 @@
+import json
+import os
+
+import pytest
+
+import cli
+import sweep
+
+TRACE = """arrival_time,burst_time,priority,memory,type
+0,3,1,64,Normal
+0,5,2,64,Normal
+1,2,1,64,Normal
+4,4,3,64,Normal
+"""
+
+
+@pytest.fixture
+def trace(tmp_path):
+    path = tmp_path / "load.csv"
+    path.write_text(TRACE)
+    return str(path)
+
+
+def _run(path, algorithm, quantum):
+    """Resultados de 'run' sobre el mismo archivo, con las opciones por defecto de la línea de comandos"""
+    args = cli.build_parser().parse_args(["run", path, "--log-file", os.devnull])
+    simulator = cli.build_simulator(cli.load_workload(path), args)
+    return simulator.simulate(algorithm, quantum)
+
+
+@pytest.mark.parametrize("algorithm, quantum", [("FIFO", None), ("Round Robin", 2)])
+def test_sweep_matches_run_on_trace(trace, algorithm, quantum):
+    config = {"algorithm": algorithm, "quantum": quantum, "buffer_size": 500, "memory_size": 1024, "cpus": 1,
+              "seed": 0}
+    row = sweep.run_config(cli.load_workload(trace), config)
+    results = _run(trace, algorithm, quantum)
+    metrics = results["metrics"]
+
+    assert row["completed"] == metrics["completed"] == 4
+    assert row["events"] == results["events"] > 0
+    assert row["simulated_time"] == results["simulated_time"]
+    assert row["avg_turnaround_time"] == pytest.approx(metrics["avg_turnaround_time"])
+    assert row["avg_waiting_time"] == pytest.approx(metrics["avg_waiting_time"])
+
+
+def test_turnaround_discounts_arrival(tmp_path):
+    workload = {"processes": [
+        {"priority": 1, "burst_time": 3, "memory": 64},
+        {"priority": 1, "burst_time": 5, "memory": 64},
+        {"priority": 1, "burst_time": 2, "memory": 64},
+        {"priority": 1, "burst_time": 4, "memory": 64, "arrival_time": 4},
+    ]}
+    config = {"algorithm": "FIFO", "quantum": None, "buffer_size": 500, "memory_size": 1024, "cpus": 1, "seed": 0}
+    row = sweep.run_config(workload, config)
+    # Terminan en 3, 8, 10 y 14; el último llegó en t=4
+    assert row["avg_turnaround_time"] == pytest.approx((3 + 8 + 10 + 10) / 4)
+
+
+@pytest.mark.parametrize("algorithm, quantum", [("FIFO", None), ("Round Robin", 2)])
+def test_sweep_matches_run_when_processes_block(tmp_path, algorithm, quantum):
+    """Con productores, consumidores y poca memoria hay bloqueos: sweep, run y el detalle por proceso coinciden"""
+    types = ["Productor", "Consumidor", "Normal", "Consumidor", "Productor"]
+    processes = [{"pid": f"p{i}", "type": types[i % 5], "priority": 1 + i % 3, "burst_time": 2 + i % 5,
+                  "memory": 30 + 25 * (i % 6), "arrival_time": i % 4} for i in range(24)]
+    workload = {"processes": processes, "buffer_size": 90, "memory_size": 300}
+    path = tmp_path / "load.json"
+    path.write_text(json.dumps(workload))
+    config = {"algorithm": algorithm, "quantum": quantum, "buffer_size": 90, "memory_size": 300, "cpus": 1,
+              "seed": 0}
+    row = sweep.run_config(workload, config)
+    results = _run(str(path), algorithm, quantum)
+    metrics = results["metrics"]
+
+    assert metrics["blocks"] > 0 and metrics["completed"] > 0
+    assert row["completed"] == metrics["completed"]
+    assert row["avg_waiting_time"] == pytest.approx(metrics["avg_waiting_time"])
+    assert row["avg_turnaround_time"] == pytest.approx(metrics["avg_turnaround_time"])
+    finished = [p for p in results["processes"] if p["completion_time"] is not None]
+    assert sum(p["waiting_time"] for p in finished) / len(finished) == pytest.approx(metrics["avg_waiting_time"])
@@ -0,0 +1,73 @@
+import math
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+import ingest
+from process import ProcessColumns
+from workload import (INT32_MAX, Bimodal, Exponential, Pareto, Poisson, Uniform, WorkloadGenerator, entries,
+                      parse_distribution, parse_mix, write_trace)
+
+
+def _same(first, second):
+    return all(getattr(first, name).tobytes() == getattr(second, name).tobytes() for name, _ in ProcessColumns.COLUMNS)
+
+
+@pytest.mark.parametrize("burst", [Uniform(1, 15), Exponential(5), Pareto(1.5, 2), Bimodal()])
+def test_same_seed_same_workload(burst):
+    first = WorkloadGenerator(seed=7, burst=burst, arrival=Poisson(3)).columns(5000)
+    second = WorkloadGenerator(seed=7, burst=burst, arrival=Poisson(3)).columns(5000)
+    other = WorkloadGenerator(seed=8, burst=burst, arrival=Poisson(3)).columns(5000)
+    assert _same(first, second)
+    assert not _same(first, other)
+
+
+def test_bounds_and_order():
+    data = WorkloadGenerator(seed=1, burst=Exponential(4), arrival=Poisson(10)).columns(20000).as_numpy()
+    assert data["burst_time"].min() >= 1
+    assert data["memory"].min() >= 1
+    assert data["priority"].min() >= 1 and data["priority"].max() <= 10
+    assert (np.diff(data["arrival_time"]) >= 0).all()
+    assert list(data["pid"][:3]) == [0, 1, 2]
+
+
+def test_heavy_tail_does_not_overflow():
+    with np.errstate(all="raise"):
+        data = WorkloadGenerator(seed=1, burst=parse_distribution("pareto:0.3"),
+                                 memory=parse_distribution("pareto:0.2")).arrays(10000)
+    assert data["burst_time"].min() >= 1 and data["burst_time"].max() <= INT32_MAX
+    assert data["memory"].min() >= 1
+    capped = WorkloadGenerator(seed=1, burst=Pareto(0.3), max_burst=500).arrays(10000)
+    assert capped["burst_time"].max() == 500
+
+
+def test_nan_samples_are_rejected():
+    class Broken:
+        def sample(self, rng, size):
+            return np.full(size, math.nan)
+
+    with pytest.raises(ValueError):
+        WorkloadGenerator(seed=0, burst=Broken()).arrays(10)
+
+
+def test_mix_and_parsing():
+    table = WorkloadGenerator(seed=3, mix=parse_mix("Normal=1")).columns(1000)
+    assert set(table.type) == {0}
+    with pytest.raises(ValueError):
+        parse_distribution("zipf:2")
+    with pytest.raises(ValueError):
+        parse_distribution("exp:1:2:3")
+
+
+def test_trace_round_trip(tmp_path):
+    table = WorkloadGenerator(seed=5, arrival=Poisson(2)).columns(200)
+    path = str(tmp_path / "load.csv.gz")
+    write_trace(table, path)
+    loaded = list(ingest.load_trace(path))
+    generated = list(entries(table))
+    assert len(loaded) == len(generated) == 200
+    for read, made in zip(loaded, generated):
+        assert read["burst_time"] == made["burst_time"]
+        assert read["arrival_time"] == pytest.approx(made["arrival_time"])
+        assert read["type"] == made["type"]
@@ -0,0 +1,241 @@
+import csv
+import gzip
+
+try:
+    import numpy as np
+except ImportError:  # NumPy es opcional: sin él solo quedan las cargas que se arman proceso por proceso
+    np = None
+
+from process import ProcessColumns, ProcessType
+
+# Mezcla de tipos por defecto (proporción de cada tipo de proceso); el benchmark usa la misma
+MIX = {"Normal": 0.8, "Productor": 0.1, "Consumidor": 0.1}
+INT32_MAX = 2**31 - 1  # Ráfagas y memoria se guardan como int32 en ProcessColumns
+
+
+def _require_numpy():
+    if np is None:
+        raise ImportError("El generador de cargas requiere NumPy (pip install numpy)")
+
+
+class Uniform:
+    """Enteros uniformes entre low y high inclusive (la distribución de create_process)"""
+
+    def __init__(self, low, high):
+        if low > high:
+            raise ValueError(f"Rango uniforme vacío: {low}..{high}")
+        self.low, self.high = low, high
+
+    def sample(self, rng, size):
+        return rng.integers(self.low, self.high, size, endpoint=True)
+
+
+class Exponential:
+    """Exponencial con media 'mean': muchos valores cortos y pocos largos"""
+
+    def __init__(self, mean):
+        if mean <= 0:
+            raise ValueError("La media de la exponencial debe ser mayor que 0")
+        self.mean = mean
+
+    def sample(self, rng, size):
+        return rng.exponential(self.mean, size)
+
+
+class Pareto:
+    """Pareto (cola pesada) con índice 'shape' y valor mínimo 'minimum'
+
+    Con shape <= 2 la varianza es infinita: unos pocos procesos concentran
+    buena parte del trabajo total, como en las trazas de clústeres reales.
+    """
+
+    def __init__(self, shape, minimum=1.0):
+        if shape <= 0 or minimum <= 0:
+            raise ValueError("El índice y el mínimo de la Pareto deben ser mayores que 0")
+        self.shape, self.minimum = shape, minimum
+
+    def sample(self, rng, size):
+        return self.minimum * (1.0 + rng.pareto(self.shape, size))
+
+
+class Bimodal:
+    """Mezcla de dos distribuciones: 'short' con probabilidad 1 - long_share y 'long' con long_share
+
+    Por defecto, ráfagas interactivas cortas (exponencial de media 2) y una
+    minoría de trabajos largos tipo batch (exponencial de media 40).
+    """
+
+    def __init__(self, short=None, long=None, long_share=0.2):
+        if not 0 <= long_share <= 1:
+            raise ValueError("La proporción de la moda larga debe estar entre 0 y 1")
+        self.short = short or Exponential(2)
+        self.long = long or Exponential(40)
+        self.long_share = long_share
+
+    def sample(self, rng, size):
+        is_long = rng.random(size) < self.long_share
+        values = np.asarray(self.short.sample(rng, size), dtype=np.float64)
+        values[is_long] = self.long.sample(rng, int(is_long.sum()))
+        return values
+
+
+class Poisson:
+    """Llegadas de Poisson con 'rate' procesos por segundo simulado (entre llegadas exponencial)"""
+
+    def __init__(self, rate):
+        if rate <= 0:
+            raise ValueError("La tasa de llegadas debe ser mayor que 0")
+        self.rate = rate
+
+    def sample(self, rng, size):
+        return np.cumsum(rng.exponential(1.0 / self.rate, size))
+
+
+DISTRIBUTIONS = {"uniform": Uniform, "exp": Exponential, "pareto": Pareto, "bimodal": Bimodal, "poisson": Poisson}
+
+
+def parse_distribution(text):
+    """Convierte 'exp:5', 'pareto:1.5:2', 'bimodal:2:40:0.2', 'uniform:1:15' o 'poisson:50' en una distribución
+
+    bimodal recibe las medias de sus dos modas exponenciales y la proporción
+    de la moda larga.
+    """
+    name, *params = text.strip().lower().split(":")
+    if name not in DISTRIBUTIONS:
+        raise ValueError(f"Distribución desconocida: {name} (use {', '.join(DISTRIBUTIONS)})")
+    try:
+        values = [float(param) for param in params]
+    except ValueError:
+        raise ValueError(f"Parámetros inválidos en {text}") from None
+    try:
+        if name == "uniform":
+            return Uniform(*(int(value) for value in values))
+        if name == "bimodal":
+            short, long, *share = values
+            return Bimodal(Exponential(short), Exponential(long), *share)
+        return DISTRIBUTIONS[name](*values)
+    except TypeError:
+        raise ValueError(f"Cantidad de parámetros inválida en {text}") from None
+
+
+def parse_mix(text):
+    """Convierte 'Normal=0.8,Productor=0.1,Consumidor=0.1' en una mezcla de tipos"""
+    mix = {}
+    for term in text.split(","):
+        name, sep, weight = term.partition("=")
+        if not sep:
+            raise ValueError(f"Mezcla inválida: {term} (use tipo=proporción)")
+        try:
+            mix[ProcessType.parse(name.strip()).label] = float(weight)
+        except ValueError:
+            raise ValueError(f"Mezcla inválida: {term}") from None
+    return mix
+
+
+def _positive_integers(values, upper, name):
+    """Redondea hacia arriba a enteros entre 1 y 'upper' (o el máximo de int32, el tipo de la columna)
+
+    Las colas pesadas pueden dar valores enormes o infinitos: se acotan en vez
+    de desbordar al convertir. NaN no tiene un valor razonable y se rechaza.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    if np.isnan(values).any():
+        raise ValueError(f"La distribución de {name} produjo valores NaN")
+    limit = INT32_MAX if upper is None else min(upper, INT32_MAX)
+    return np.clip(np.ceil(values), 1, limit).astype(np.int32)
+
+
+class WorkloadGenerator:
+    """Generador de cargas de trabajo sintéticas reproducibles, vectorizado con NumPy
+
+    Cada columna sale de una sola llamada a su distribución sobre un
+    numpy.random.Generator con la semilla indicada, así que la misma semilla
+    y configuración producen siempre la misma carga. Las ráfagas y la memoria
+    se redondean hacia arriba a enteros positivos acotados a int32 (las
+    ráfagas además a max_burst, si se indica), las prioridades van de 1 a 10
+    y los tipos siguen la mezcla 'mix'. Sin 'arrival' todos los procesos
+    llegan en t=0. Cualquier objeto con un método
+    sample(rng, size) que retorne un arreglo sirve como distribución.
+    """
+
+    def __init__(self, seed=None, burst=None, memory=None, priority=None, arrival=None, mix=None, max_burst=None):
+        _require_numpy()
+        self.seed = seed
+        self.burst = burst or Uniform(1, 15)
+        self.memory = memory or Uniform(64, 256)
+        self.priority = priority or Uniform(1, 10)
+        self.arrival = arrival
+        self.mix = mix or MIX
+        self.max_burst = max_burst
+        types = [ProcessType.parse(name) for name in self.mix]
+        weights = np.asarray(list(self.mix.values()), dtype=np.float64)
+        if weights.size == 0 or (weights < 0).any() or weights.sum() <= 0:
+            raise ValueError("La mezcla de tipos necesita proporciones no negativas con suma mayor que 0")
+        self.types = np.asarray(types, dtype=np.int8)
+        self.weights = weights / weights.sum()
+
+    def arrays(self, count, first_pid=0):
+        """Columnas de 'count' procesos como arreglos NumPy (mismos nombres que ProcessColumns)"""
+        if count < 0:
+            raise ValueError("La cantidad de procesos no puede ser negativa")
+        rng = np.random.default_rng(self.seed)
+        burst = _positive_integers(self.burst.sample(rng, count), self.max_burst, "burst")
+        memory = _positive_integers(self.memory.sample(rng, count), None, "memory")
+        priority = _positive_integers(self.priority.sample(rng, count), 10, "priority")
+        process_type = self.types[rng.choice(self.types.size, count, p=self.weights)]
+        arrival = self.arrival.sample(rng, count) if self.arrival is not None else np.zeros(count)
+        return {
+            "pid": np.arange(first_pid, first_pid + count, dtype=np.int64),
+            "type": process_type,
+            "priority": priority.astype(np.int8),
+            "burst_time": burst,
+            "memory": memory,
+            "arrival_time": np.asarray(arrival, dtype=np.float64),
+        }
+
+    def columns(self, count, table=None):
+        """Genera 'count' procesos directamente en una tabla ProcessColumns (nueva o 'table') y la retorna"""
+        table = ProcessColumns() if table is None else table
+        table.extend(**self.arrays(count, first_pid=len(table)))
+        return table
+
+    def summary(self, table):
+        """Resumen de una carga generada: procesos por tipo, ráfagas, memoria y llegadas"""
+        data = table.as_numpy()
+        count = len(table)
+        counts = np.bincount(data["type"], minlength=len(ProcessType))
+        return {
+            "seed": self.seed,
+            "process_count": count,
+            "types": {member.label: int(counts[member]) for member in ProcessType},
+            "total_burst": int(data["burst_time"].sum(dtype=np.int64)),
+            "mean_burst": float(data["burst_time"].mean()) if count else 0.0,
+            "max_burst": int(data["burst_time"].max()) if count else 0,
+            "mean_memory": float(data["memory"].mean()) if count else 0.0,
+            "last_arrival": float(data["arrival_time"].max()) if count else 0.0,
+        }
+
+
+def entries(table):
+    """Entradas de carga de trabajo (diccionarios de add_workload/feed) a partir de una tabla en columnas
+
+    Se generan de a una en el orden de la tabla; las de WorkloadGenerator ya
+    están ordenadas por llegada y se pueden reproducir con simulator.feed.
+    """
+    labels = [member.label for member in ProcessType]
+    for pid, process_type, priority, burst, memory, arrival in zip(
+            table.pid, table.type, table.priority, table.burst_time, table.memory, table.arrival_time):
+        yield {"pid": str(pid), "type": labels[process_type], "priority": priority, "burst_time": burst,
+               "memory": memory, "arrival_time": arrival}
+
+
+def write_trace(table, path):
+    """Escribe la tabla como traza CSV (con gzip si termina en .gz) que ingest.load_trace sabe leer"""
+    opener = gzip.open if path.endswith(".gz") else open
+    labels = [member.label for member in ProcessType]
+    with opener(path, "wt", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(("pid", "arrival_time", "burst_time", "priority", "memory", "type"))
+        writer.writerows(zip(table.pid, table.arrival_time, table.burst_time, table.priority, table.memory,
+                             (labels[t] for t in table.type)))
+    return len(table)